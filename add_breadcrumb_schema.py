@@ -6,65 +6,29 @@ This helps search engines understand site hierarchy and can show breadcrumbs in
 
 import os
 import re
-from html.parser import HTMLParser
-
-class CameraPageParser(HTMLParser):
-    """Parse camera page to extract city and camera name"""
-    def __init__(self):
-        super().__init__()
-        self.city = None
-        self.camera_name = None
-        self.in_breadcrumb = False
-        self.in_h1 = False
-
-    def handle_starttag(self, tag, attrs):
-        if tag == 'nav':
-            self.in_breadcrumb = True
-        if tag == 'h1':
-            self.in_h1 = True
-
-    def handle_endtag(self, tag):
-        if tag == 'nav':
-            self.in_breadcrumb = False
-        if tag == 'h1':
-            self.in_h1 = False
-
-    def handle_data(self, data):
-        data = data.strip()
-        if not data:
-            return
-        # Extract city from breadcrumb
-        if self.in_breadcrumb and not self.city and data not in ['Home', '/', 'View All']:
-            # Remove ", Japan" if present
-            if ', Japan' in data:
-                data = data.replace(', Japan', '')
-            if data and data != 'Home' and data != '/':
-                self.city = data
-        # Extract camera name from h1
-        if self.in_h1 and not self.camera_name:
-            self.camera_name = data
+import argparse
+
+from page_batch import add_jobs_argument, run_pages
+from page_metadata import get_page_metadata
+from structured_data import json_string
 
 def get_camera_info(html_content):
     """Extract camera name and city from HTML"""
-    parser = CameraPageParser()
-    parser.feed(html_content)
-    return parser.camera_name, parser.city
-
-def add_breadcrumb_schema(file_path):
-    """Add BreadcrumbList schema to a camera page"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    metadata = get_page_metadata(html_content)
+    return metadata.camera_name, metadata.breadcrumb_city
 
+def add_breadcrumb_schema_to_content(content, file_path):
+    """Return content with BreadcrumbList schema added, or None if not needed"""
     # Skip if already has BreadcrumbList schema
     if '"@type": "BreadcrumbList"' in content or '"@type":"BreadcrumbList"' in content:
-        return False
+        return None
 
     # Get camera info
     camera_name, city = get_camera_info(content)
 
     if not camera_name or not city:
         print(f"  ⚠️  Could not extract info from {os.path.basename(file_path)}")
-        return False
+        return None
 
     # Get filename for camera URL
     filename = os.path.basename(file_path)
@@ -87,13 +51,13 @@ def add_breadcrumb_schema(file_path):
             {{
                 "@type": "ListItem",
                 "position": 2,
-                "name": "{city}",
+                "name": "{json_string(city)}",
                 "item": "https://sakuralivecams.com/cities/{city_slug}.html"
             }},
             {{
                 "@type": "ListItem",
                 "position": 3,
-                "name": "{camera_name}",
+                "name": "{json_string(camera_name)}",
                 "item": "https://sakuralivecams.com/cameras/{filename}"
             }}
         ]
@@ -115,6 +79,17 @@ def add_breadcrumb_schema(file_path):
         # Fallback: insert before </head>
         content = content.replace('</head>', f'{breadcrumb_schema}\n</head>')
 
+    return content
+
+def add_breadcrumb_schema(file_path):
+    """Add BreadcrumbList schema to a camera page"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    content = add_breadcrumb_schema_to_content(content, file_path)
+    if content is None:
+        return False
+
     # Write back
     with open(file_path, 'w', encoding='utf-8') as f:
         f.write(content)
@@ -123,6 +98,10 @@ def add_breadcrumb_schema(file_path):
 
 def main():
     """Process all camera HTML files"""
+    parser = argparse.ArgumentParser(description='Add BreadcrumbList schema to camera pages.')
+    add_jobs_argument(parser)
+    args = parser.parse_args()
+
     cameras_dir = 'cameras'
 
     if not os.path.exists(cameras_dir):
@@ -135,17 +114,17 @@ def main():
     updated_count = 0
     skipped_count = 0
 
-    for filename in camera_files:
-        file_path = os.path.join(cameras_dir, filename)
-        try:
-            if add_breadcrumb_schema(file_path):
-                updated_count += 1
-                if updated_count % 50 == 0:
-                    print(f"  ✓ Processed {updated_count} files...")
-            else:
-                skipped_count += 1
-        except Exception as e:
-            print(f"  ❌ Error processing {filename}: {e}")
+    file_paths = [os.path.join(cameras_dir, filename) for filename in camera_files]
+    for result in run_pages(add_breadcrumb_schema, file_paths, jobs=args.jobs):
+        print(result.output, end='')
+        if result.error:
+            print(f"  ❌ Error processing {os.path.basename(result.path)}: {result.error}")
+        elif result.value:
+            updated_count += 1
+            if updated_count % 50 == 0:
+                print(f"  ✓ Processed {updated_count} files...")
+        else:
+            skipped_count += 1
 
     print(f"\n✅ Complete!")
     print(f"  • Updated: {updated_count} files")
@@ -6,6 +6,9 @@ Critical for tracking site performance and user behavior.
 
 import os
 import re
+import argparse
+
+from page_batch import add_jobs_argument, run_pages
 
 # GTM and GA tracking codes
 GTM_HEAD_CODE = '''    <!-- Google Tag Manager -->
@@ -33,17 +36,14 @@ GTM_BODY_CODE = '''  <!-- Google Tag Manager (noscript) -->
   <!-- End Google Tag Manager (noscript) -->
 '''
 
-def add_analytics_to_file(file_path):
-    """Add GTM and GA tracking codes to a single HTML file"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
+def add_analytics_to_content(content, file_path=None):
+    """Return content with GTM and GA tracking codes added, or None if unchanged"""
     # Skip if already has both GTM in head AND noscript in body
     has_gtm_head = 'GTM-5CGB48MH' in content and '<!-- Google Tag Manager -->' in content
     has_gtm_body = 'googletagmanager.com/ns.html' in content
 
     if has_gtm_head and has_gtm_body:
-        return False
+        return None
 
     modified = False
 
@@ -59,14 +59,22 @@ def add_analytics_to_file(file_path):
         content = re.sub(body_pattern, f'\\1\n{GTM_BODY_CODE}', content)
         modified = True
 
-    if modified:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        return True
+    return content if modified else None
 
-    return False
+def add_analytics_to_file(file_path):
+    """Add GTM and GA tracking codes to a single HTML file"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
 
-def process_directory(directory, file_type):
+    content = add_analytics_to_content(content, file_path)
+    if content is None:
+        return False
+
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return True
+
+def process_directory(directory, file_type, jobs=1):
     """Process all HTML files in a directory"""
     if not os.path.exists(directory):
         print(f"⚠️  Directory '{directory}' not found")
@@ -83,17 +91,17 @@ def process_directory(directory, file_type):
     updated_count = 0
     skipped_count = 0
 
-    for filename in html_files:
-        file_path = os.path.join(directory, filename)
-        try:
-            if add_analytics_to_file(file_path):
-                updated_count += 1
-                if updated_count % 50 == 0:
-                    print(f"  ✓ Processed {updated_count} files...")
-            else:
-                skipped_count += 1
-        except Exception as e:
-            print(f"  ❌ Error processing {filename}: {e}")
+    file_paths = [os.path.join(directory, filename) for filename in html_files]
+    for result in run_pages(add_analytics_to_file, file_paths, jobs=jobs):
+        print(result.output, end='')
+        if result.error:
+            print(f"  ❌ Error processing {os.path.basename(result.path)}: {result.error}")
+        elif result.value:
+            updated_count += 1
+            if updated_count % 50 == 0:
+                print(f"  ✓ Processed {updated_count} files...")
+        else:
+            skipped_count += 1
 
     print(f"✅ {file_type.capitalize()} pages complete!")
     print(f"  • Updated: {updated_count} files")
@@ -103,6 +111,10 @@ def process_directory(directory, file_type):
 
 def main():
     """Add Google Analytics to all camera and city pages"""
+    parser = argparse.ArgumentParser(description='Add GTM and GA tracking to camera and city pages.')
+    add_jobs_argument(parser)
+    args = parser.parse_args()
+
     print("=" * 70)
     print("🎯 Adding Google Tag Manager & Google Analytics to All Pages")
     print("=" * 70)
@@ -110,10 +122,10 @@ def main():
     total_updated = 0
 
     # Process camera pages
-    total_updated += process_directory('cameras', 'camera')
+    total_updated += process_directory('cameras', 'camera', jobs=args.jobs)
 
     # Process city pages
-    total_updated += process_directory('cities', 'city')
+    total_updated += process_directory('cities', 'city', jobs=args.jobs)
 
     print("\n" + "=" * 70)
     print(f"✅ COMPLETE! Updated {total_updated} total pages")
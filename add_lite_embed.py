@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Replace the YouTube iframe on camera pages with a click-to-play facade.
+
+Each camera page used to create the YouTube player as soon as it loaded,
+which pulls in roughly a megabyte of player scripts before anyone presses
+play. The .lite-embed facade (already used for the home page featured
+streams) shows the stream thumbnail with a play button instead, and a small
+script swaps in the real iframe, with autoplay, on the first click.
+
+Usage:
+    python3 add_lite_embed.py
+    python3 add_lite_embed.py --jobs 0
+"""
+
+import os
+import re
+import glob
+import argparse
+
+from page_batch import add_jobs_argument, run_pages
+from site_locales import mirror_locales
+
+CAMERA_DIR = 'cameras'
+
+# The player iframe as build_site.py and the camera page scripts write it
+iframe_pattern = re.compile(
+    r'<iframe src="https://www\.youtube\.com/embed/(?P<video_id>[\w-]+)\?autoplay=1&mute=1"\s*'
+    r'allow="[^"]*"\s*allowfullscreen\s*title="(?P<title>[^"]*)"\s*'
+    r'class="w-full h-full border-none"></iframe>'
+)
+
+# Facade shown in place of the iframe
+lite_embed = '''<button type="button" class="lite-embed group absolute inset-0 w-full h-full grid place-items-center"
+                    data-video-id="{video_id}" data-title="{title}" aria-label="Play {title}">
+                <img src="https://img.youtube.com/vi/{video_id}/hqdefault.jpg" alt="{title}"
+                     class="absolute inset-0 w-full h-full object-cover" decoding="async">
+                <span class="relative h-16 w-16 rounded-full bg-red-600/90 grid place-items-center shadow-lg group-hover:scale-110 transition">
+                    <svg xmlns="http://www.w3.org/2000/svg" class="h-8 w-8 text-white ml-1" viewBox="0 0 24 24" fill="currentColor"><path d="M8 5v14l11-7z"/></svg>
+                </span>
+            </button>'''
+
+# JavaScript to add before </body>
+lite_embed_script = '''
+    <script>
+        document.querySelectorAll('.lite-embed').forEach(function(btn) {
+            btn.addEventListener('click', function() {
+                const iframe = document.createElement('iframe');
+                iframe.src = 'https://www.youtube.com/embed/' + btn.dataset.videoId + '?autoplay=1&mute=1';
+                iframe.allow = 'accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture';
+                iframe.allowFullscreen = true;
+                iframe.title = btn.dataset.title;
+                iframe.className = 'w-full h-full border-none';
+                btn.replaceWith(iframe);
+            }, { once: true });
+        });
+    </script>'''
+
+def add_lite_embed_content(content, file_path=None):
+    """Return content with the player iframe swapped for the facade, or None if not applicable."""
+    # Check if already updated
+    if 'class="lite-embed' in content:
+        return None
+
+    if not iframe_pattern.search(content):
+        return None
+
+    content = iframe_pattern.sub(
+        lambda m: lite_embed.format(video_id=m.group('video_id'), title=m.group('title')),
+        content,
+        count=1
+    )
+
+    # Add JavaScript before </body>
+    if '</body>' in content and lite_embed_script not in content:
+        content = content.replace('</body>', lite_embed_script + '\n</body>')
+
+    return content
+
+def update_camera_page(file_path):
+    """Add the click-to-play facade to a single camera page."""
+    print(f"Processing: {os.path.relpath(file_path)}")
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    if 'class="lite-embed' in content:
+        print(f"  ⏭️  Already has the facade, skipping")
+        return False
+
+    content = add_lite_embed_content(content, file_path)
+    if content is None:
+        print(f"  ⚠️  Could not find the player iframe")
+        return False
+
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+    print(f"  ✅ Replaced the iframe with the facade")
+    return True
+
+def main():
+    parser = argparse.ArgumentParser(description='Swap the camera page YouTube iframes for a click-to-play facade.')
+    parser.add_argument('--root', default='.', help='site root (default: current directory)')
+    add_jobs_argument(parser)
+    args = parser.parse_args()
+
+    camera_files = []
+    for directory in [CAMERA_DIR] + [f'{lang}/{CAMERA_DIR}' for lang in mirror_locales(args.root)]:
+        camera_files.extend(glob.glob(os.path.join(args.root, directory, '*.html')))
+
+    # Filter out non-camera pages
+    camera_files = [f for f in camera_files if not os.path.basename(f).startswith('index')]
+
+    print(f"Found {len(camera_files)} camera pages to update\n")
+
+    updated_count = 0
+    skipped_count = 0
+    error_count = 0
+
+    for result in run_pages(update_camera_page, sorted(camera_files), jobs=args.jobs):
+        print(result.output, end='')
+        if result.error:
+            print(f"  ❌ Error: {result.error}")
+            error_count += 1
+        elif result.value:
+            updated_count += 1
+        else:
+            skipped_count += 1
+        print()
+
+    print(f"\n{'='*60}")
+    print(f"Summary:")
+    print(f"  Updated: {updated_count}")
+    print(f"  Skipped: {skipped_count}")
+    print(f"  Errors:  {error_count}")
+    print(f"  Total:   {len(camera_files)}")
+    print(f"{'='*60}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Benchmark the maintenance scripts against synthetic copies of the site.
+
+For every requested scale the site is cloned into a scratch directory with
+each camera page, city page, sitemap entry and catalog entry repeated
+SCALE times under new slugs (scale 10 = ~2,100 cameras and ~340 cities).
+The scripts are copied alongside, with the hard-coded site path pointed at
+the copy, and run one after another in the usual maintenance order:
+
+    update_descriptions -> fix_camera_descriptions -> fix_city_descriptions
+    -> add_breadcrumb_schema -> enhance_video_schema -> generate_i18n_pages
+    -> update_sitemap_dates -> build_sitemap -> build_site
+
+Each run reports wall time, CPU time, pages/sec, peak RSS and bytes written.
+Results are saved as JSON (.benchmarks/ by default) and can be compared
+against an earlier run with --compare.
+
+    python3 benchmark_site.py --scale 1 10
+    python3 benchmark_site.py --scale 10 --stale --compare .benchmarks/old.json
+"""
+
+import os
+import re
+import sys
+import json
+import shutil
+import argparse
+import platform
+import subprocess
+import tempfile
+import time
+from collections import namedtuple
+from datetime import datetime
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent
+RESULTS_DIR = REPO_DIR / '.benchmarks'
+
+# Absolute site path several scripts still hard-code
+SITE_PATH_LITERAL = '/home/user/sakuralivecams'
+
+# Files and directories copied into every synthetic site as-is
+SITE_FILES = ('index.html', 'contact.html', 'privacy.html', 'terms.html',
+              'sakura-season-2026.html', 'robots.txt')
+SITE_DIRS = ('translations',)
+
+# pages: which page set the script walks ('cameras', 'cities', 'site', 'sitemap', 'catalog')
+Benchmark = namedtuple('Benchmark', 'name args pages')
+
+BENCHMARKS = [
+    Benchmark('update-descriptions', ['update_descriptions.py'], 'cameras'),
+    Benchmark('camera-descriptions', ['fix_camera_descriptions.py'], 'cameras'),
+    Benchmark('city-descriptions', ['fix_city_descriptions.py'], 'cities'),
+    Benchmark('breadcrumb-schema', ['add_breadcrumb_schema.py'], 'cameras'),
+    Benchmark('video-schema', ['enhance_video_schema.py'], 'cameras'),
+    Benchmark('i18n', ['generate_i18n_pages.py', '--force'], 'site'),
+    Benchmark('i18n-incremental', ['generate_i18n_pages.py'], 'site'),
+    Benchmark('sitemap', ['update_sitemap_dates.py'], 'sitemap'),
+    Benchmark('sitemap-build', ['build_sitemap.py'], 'sitemap'),
+    Benchmark('build-site', ['build_site.py', '--output', '_build'], 'catalog'),
+]
+
+# Scripts that accept --jobs (page_batch)
+PARALLEL_SCRIPTS = ('fix_camera_descriptions.py', 'add_breadcrumb_schema.py',
+                    'enhance_video_schema.py', 'generate_i18n_pages.py')
+
+H1_PATTERN = re.compile(r'(<h1[^>]*>)([^<]+)(</h1>)')
+URL_BLOCK_PATTERN = re.compile(r'    <url>\n.*?</url>\n', re.DOTALL)
+DESCRIPTION_PATTERN = re.compile(r'<div class="text-gray-300 space-y-3 mb-4">.*?</div>', re.DOTALL)
+
+
+def copy_slug(slug, copy):
+    """Slug of the n-th synthetic copy of a page (copy 0 keeps the original)."""
+    return slug if copy == 0 else f'{slug}-x{copy}'
+
+
+def clone_pages(source_dir, dest_dir, section, scale, stale=False):
+    """Write SCALE copies of every page in source_dir; return the page count."""
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    count = 0
+    for page in sorted(source_dir.glob('*.html')):
+        slug = page.stem
+        content = page.read_text(encoding='utf-8')
+        if slug == 'index':
+            (dest_dir / page.name).write_text(content, encoding='utf-8')
+            continue
+        if stale and section == 'cameras':
+            # Back to the one-line placeholder the description scripts rewrite
+            content = DESCRIPTION_PATTERN.sub(
+                '<p class="text-gray-300 mb-4">Live webcam view of this location, Japan.</p>', content, count=1)
+        for copy in range(scale):
+            new_slug = copy_slug(slug, copy)
+            page_content = content
+            if copy:
+                page_content = page_content.replace(f'{section}/{slug}.html', f'{section}/{new_slug}.html')
+                page_content = H1_PATTERN.sub(rf'\g<1>\g<2> {copy + 1}\g<3>', page_content, count=1)
+            (dest_dir / f'{new_slug}.html').write_text(page_content, encoding='utf-8')
+            count += 1
+    return count
+
+
+def clone_sitemap(source_path, dest_path, scale):
+    """Repeat every camera and city <url> entry SCALE times; return the URL count."""
+    content = source_path.read_text(encoding='utf-8')
+    blocks = URL_BLOCK_PATTERN.findall(content)
+    head = content[:content.index(blocks[0])] if blocks else content
+    tail = content[content.rindex(blocks[-1]) + len(blocks[-1]):] if blocks else ''
+
+    urls = []
+    for block in blocks:
+        match = re.search(r'/(cameras|cities)/([^/"<]+)\.html', block)
+        if not match:
+            urls.append(block)
+            continue
+        section, slug = match.groups()
+        for copy in range(scale):
+            urls.append(block.replace(f'{section}/{slug}.html', f'{section}/{copy_slug(slug, copy)}.html'))
+
+    dest_path.write_text(head + ''.join(urls) + tail, encoding='utf-8')
+    return len(urls)
+
+
+def clone_catalog(source_path, dest_path, scale):
+    """Repeat every catalog entry SCALE times with distinct names; return the entry count."""
+    with open(source_path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    catalog = []
+    for copy in range(scale):
+        for entry in entries:
+            entry = dict(entry)
+            if copy:
+                # Slugifies to the same name as the cloned page
+                entry['Description'] = f"{entry['Description']} x{copy}"
+            catalog.append(entry)
+    dest_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(dest_path, 'w', encoding='utf-8') as f:
+        json.dump(catalog, f, ensure_ascii=False)
+    return len(catalog)
+
+
+def copy_scripts(dest_dir):
+    """Copy the scripts into the synthetic site, pointed at it instead of the real one."""
+    for script in REPO_DIR.glob('*.py'):
+        source = script.read_text(encoding='utf-8')
+        (dest_dir / script.name).write_text(source.replace(SITE_PATH_LITERAL, str(dest_dir)), encoding='utf-8')
+
+
+def make_synthetic_site(dest_dir, scale, stale=False):
+    """Build a synthetic site SCALE times the size of the real one; return page counts."""
+    for name in SITE_FILES:
+        if (REPO_DIR / name).exists():
+            shutil.copy2(REPO_DIR / name, dest_dir / name)
+    for name in SITE_DIRS:
+        shutil.copytree(REPO_DIR / name, dest_dir / name)
+    copy_scripts(dest_dir)
+
+    counts = {
+        'cameras': clone_pages(REPO_DIR / 'cameras', dest_dir / 'cameras', 'cameras', scale, stale),
+        'cities': clone_pages(REPO_DIR / 'cities', dest_dir / 'cities', 'cities', scale, stale),
+        'sitemap': clone_sitemap(REPO_DIR / 'sitemap.xml', dest_dir / 'sitemap.xml', scale),
+        'catalog': clone_catalog(REPO_DIR / 'assets' / 'output2.json', dest_dir / 'assets' / 'output2.json', scale),
+    }
+    counts['site'] = counts['cameras'] + counts['cities'] + len(SITE_FILES) - 1
+    return counts
+
+
+def snapshot(root):
+    """Map every file under root to its (size, mtime)."""
+    files = {}
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            stat = os.stat(path)
+            files[path] = (stat.st_size, stat.st_mtime_ns)
+    return files
+
+
+def bytes_written(before, after):
+    """Total size of files created or rewritten between two snapshots."""
+    return sum(size for path, (size, mtime) in after.items()
+               if before.get(path, (None, None))[1] != mtime)
+
+
+def run_benchmark(benchmark, site_dir, pages, jobs=1):
+    """Run one script in the synthetic site and measure it."""
+    args = list(benchmark.args)
+    if jobs != 1 and args[0] in PARALLEL_SCRIPTS:
+        args += ['--jobs', str(jobs)]
+
+    before = snapshot(site_dir)
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable] + args, cwd=site_dir,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    # wait4 gives the resource usage of this child (and the pool workers it reaped)
+    _, status, usage = os.wait4(process.pid, 0)
+    wall = time.perf_counter() - start
+    process.returncode = os.waitstatus_to_exitcode(status)
+    stderr = process.stderr.read().decode('utf-8', 'replace')
+    process.stderr.close()
+    after = snapshot(site_dir)
+
+    # ru_maxrss is in KiB on Linux and in bytes on macOS
+    peak_rss = usage.ru_maxrss if sys.platform == 'darwin' else usage.ru_maxrss * 1024
+    return {
+        'name': benchmark.name,
+        'command': ' '.join(args),
+        'pages': pages,
+        'wall_seconds': round(wall, 4),
+        'cpu_seconds': round(usage.ru_utime + usage.ru_stime, 4),
+        'pages_per_second': round(pages / wall, 1) if wall else None,
+        'peak_rss_bytes': peak_rss,
+        'bytes_written': bytes_written(before, after),
+        'exit_code': process.returncode,
+        'error': stderr.strip().splitlines()[-1] if process.returncode and stderr.strip() else None,
+    }
+
+
+def run_scale(scale, benchmarks, jobs=1, stale=False, workdir=None, keep=False):
+    """Build one synthetic site and run every benchmark against it."""
+    site_dir = Path(tempfile.mkdtemp(prefix=f'sakura-bench-{scale}x-', dir=workdir))
+    try:
+        print(f"\n🏗️  Building synthetic site at {scale}x in {site_dir}")
+        counts = make_synthetic_site(site_dir, scale, stale)
+        print(f"  {counts['cameras']} cameras, {counts['cities']} cities, "
+              f"{counts['sitemap']} sitemap URLs, {counts['catalog']} catalog entries")
+
+        results = []
+        for benchmark in benchmarks:
+            result = run_benchmark(benchmark, site_dir, counts[benchmark.pages], jobs)
+            results.append(result)
+            status = '✅' if result['exit_code'] == 0 else '❌'
+            print(f"  {status} {benchmark.name:<20} {result['wall_seconds']:>8.2f}s "
+                  f"{result['pages_per_second'] or 0:>9.1f} pages/s "
+                  f"{result['peak_rss_bytes'] / 2**20:>7.1f} MiB "
+                  f"{result['bytes_written'] / 2**20:>8.1f} MiB written")
+            if result['error']:
+                print(f"     {result['error']}")
+        return {'scale': scale, 'counts': counts, 'results': results}
+    finally:
+        if keep:
+            print(f"  Kept {site_dir}")
+        else:
+            shutil.rmtree(site_dir, ignore_errors=True)
+
+
+def git_revision():
+    """Short hash of the checked-out commit, or None outside a git checkout."""
+    try:
+        output = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR,
+                                capture_output=True, text=True, check=True)
+        return output.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(report, baseline):
+    """Print wall time and peak RSS changes against an earlier report."""
+    previous = {(run['scale'], result['name']): result
+                for run in baseline['runs'] for result in run['results']}
+
+    print(f"\n📊 Compared with {baseline.get('revision') or 'baseline'} ({baseline.get('created')})")
+    for run in report['runs']:
+        for result in run['results']:
+            old = previous.get((run['scale'], result['name']))
+            if not old or not old['wall_seconds']:
+                continue
+            wall_change = (result['wall_seconds'] / old['wall_seconds'] - 1) * 100
+            rss_change = (result['peak_rss_bytes'] / old['peak_rss_bytes'] - 1) * 100
+            marker = '⚠️ ' if wall_change > 10 else '  '
+            print(f"  {marker}{run['scale']:>4}x {result['name']:<20} "
+                  f"wall {wall_change:+6.1f}%  rss {rss_change:+6.1f}%")
+
+
+def main():
+    names = [benchmark.name for benchmark in BENCHMARKS]
+    parser = argparse.ArgumentParser(description='Benchmark the maintenance scripts on synthetic sites.')
+    parser.add_argument('--scale', type=int, nargs='+', default=[1, 10],
+                        help='site size multipliers to run (default: 1 10)')
+    parser.add_argument('--only', nargs='+', choices=names, metavar='NAME',
+                        help=f'benchmarks to run (default: all): {", ".join(names)}')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='pass --jobs to the scripts that support it (default: 1)')
+    parser.add_argument('--stale', action='store_true',
+                        help='reset camera descriptions so the description scripts rewrite every page')
+    parser.add_argument('--output', help='results file (default: .benchmarks/<timestamp>-<revision>.json)')
+    parser.add_argument('--compare', metavar='JSON', help='earlier results file to compare against')
+    parser.add_argument('--workdir', help='where to build the synthetic sites (default: system temp)')
+    parser.add_argument('--keep', action='store_true', help='keep the synthetic sites after the run')
+    args = parser.parse_args()
+
+    benchmarks = [b for b in BENCHMARKS if not args.only or b.name in args.only]
+    revision = git_revision()
+    created = datetime.now()
+
+    print("⏱️  SakuraLive script benchmarks")
+    print(f"  Revision: {revision or 'unknown'}  Python {platform.python_version()}  jobs={args.jobs}")
+
+    runs = [run_scale(scale, benchmarks, args.jobs, args.stale, args.workdir, args.keep)
+            for scale in args.scale]
+
+    report = {
+        'created': created.isoformat(timespec='seconds'),
+        'revision': revision,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'jobs': args.jobs,
+        'stale': args.stale,
+        'runs': runs,
+    }
+
+    output = Path(args.output) if args.output else \
+        RESULTS_DIR / f"{created.strftime('%Y%m%d-%H%M%S')}-{revision or 'local'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            compare(report, json.load(f))
+
+    failed = sum(1 for run in runs for result in run['results'] if result['exit_code'])
+    print(f"\n{'='*60}")
+    print(f"Summary:")
+    print(f"  Scales:     {', '.join(f'{scale}x' for scale in args.scale)}")
+    print(f"  Benchmarks: {len(benchmarks)}")
+    print(f"  Failed:     {failed}")
+    print(f"  Results:    {output}")
+    print(f"{'='*60}")
+
+
+if __name__ == '__main__':
+    main()
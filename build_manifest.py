@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Content-hash build manifest shared by the site build scripts.
+
+A manifest is a small JSON sidecar mapping each generated file to the hash of
+everything it was built from. A build step computes the key for an output,
+skips the work when the manifest already holds that key (and the output still
+exists), and only rewrites files whose bytes actually changed so file mtimes
+and deploy diffs stay minimal.
+"""
+
+import os
+import json
+import hashlib
+from pathlib import Path
+
+
+def content_hash(*parts):
+    """Return a stable SHA-256 hex digest of strings, bytes or JSON data."""
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode('utf-8')
+        elif not isinstance(part, bytes):
+            part = json.dumps(part, sort_keys=True, ensure_ascii=False).encode('utf-8')
+        digest.update(hashlib.sha256(part).digest())
+    return digest.hexdigest()
+
+
+def stable_index(key, count):
+    """Map a string to an index in range(count) that is the same on every run.
+
+    Unlike hash(), which is salted per process, this can pick "random" copy
+    variants that stay put across runs and worker processes.
+    """
+    return int(content_hash(key)[:8], 16) % count
+
+
+def write_if_changed(path, content):
+    """Write text to path only if it differs from what is on disk.
+
+    Returns True if the file was written.
+    """
+    path = Path(path)
+    data = content.encode('utf-8')
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+    return True
+
+
+class BuildManifest:
+    """Output path -> build key store persisted as JSON."""
+
+    def __init__(self, path, version):
+        self.path = Path(path)
+        self.version = str(version)
+        self.entries = {}
+        self.load()
+
+    def load(self):
+        """Load entries, discarding them if written by another version."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if data.get('version') == self.version:
+            self.entries = data.get('entries', {})
+
+    def save(self):
+        """Persist the manifest, sorted so it diffs cleanly."""
+        data = {'version': self.version, 'entries': self.entries}
+        write_if_changed(self.path, json.dumps(data, indent=2, sort_keys=True) + '\n')
+
+    def _entry_name(self, output_path):
+        # Entries are stored relative to the manifest so it stays portable
+        return Path(os.path.relpath(output_path, self.path.parent)).as_posix()
+
+    def is_current(self, output_path, key):
+        """True if output_path exists and was last built from key."""
+        return (self.entries.get(self._entry_name(output_path)) == key
+                and Path(output_path).exists())
+
+    def record(self, output_path, key):
+        """Remember that output_path was built from key."""
+        self.entries[self._entry_name(output_path)] = key
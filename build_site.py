@@ -0,0 +1,466 @@
+#!/usr/bin/env python3
+"""
+Build cameras/*.html and cities/*.html straight from the stream catalog.
+
+assets/output2.json (the same file the home page loads) lists every stream
+with its Link, Location, Description and Tags. Instead of scraping the name,
+city and video ID back out of pages and patching them with a chain of regex
+scripts, this renders every camera and city page in one pass through the
+templates in site_templates.py. Adding a camera is a catalog edit plus one
+build.
+
+The copy blocks come from the same helpers the maintenance scripts use
+(unique camera descriptions, city descriptions, places to visit), so both
+paths produce the same markup. Those helpers only write a new page's copy:
+once a page exists its name (h1), head SEO text and description paragraphs
+are edited by hand, and the builder keeps them. Only pages whose bytes
+change are written.
+
+The pages are the record of which video each camera embeds. If the catalog
+disagrees with them (check_catalog.py lists these as stale pages) nothing is
+built: --sync-catalog copies the pages' video IDs into the catalog first,
+--force lets the catalog win.
+
+Usage:
+    python3 build_site.py                   # build all camera and city pages
+    python3 build_site.py --only cities --dry-run
+    python3 build_site.py --catalog assets/output2.json --output /tmp/site
+    python3 build_site.py --sync-catalog    # take stale video IDs from the pages
+
+The home page's stream filter index and per-location catalog shards
+(stream_index.py) are rebuilt alongside, since they are derived from the
+same catalog.
+"""
+
+import os
+import re
+import json
+import html
+import argparse
+import unicodedata
+from collections import namedtuple
+from urllib.parse import quote
+
+from build_manifest import write_if_changed
+from page_metadata import get_page_metadata
+from fix_camera_descriptions import get_location_type, create_unique_description
+from fix_city_descriptions import get_city_description
+from update_city_pages import get_city_places
+from structured_data import json_string
+from site_thumbs import THUMBS_DIR, MANIFEST_NAME, load_thumbs, rewrite_thumbnails
+from stream_index import SHARD_DIR, index_path, render_stream_index, render_catalog_shards, stale_shards
+from site_templates import (
+    CAMERA_PAGE_TEMPLATE, CITY_PAGE_TEMPLATE, CAMERA_CARD_TEMPLATE, RELATED_CAMERA_TEMPLATE,
+    CAMERA_TAG_TEMPLATE, CITY_TAG_TEMPLATE, OTHER_CITY_TEMPLATE, PLACE_TEMPLATE,
+    ABOUT_PARAGRAPH_TEMPLATE, ADSENSE_SCRIPT,
+)
+
+CATALOG_PATH = 'assets/output2.json'
+RELATED_CAMERA_COUNT = 3
+# City page cards show only the first few tags
+CARD_TAG_COUNT = 3
+# Cities linked from the "Explore Other Cities" row, in order
+FEATURED_CITIES = ['tokyo', 'osaka', 'kyoto', 'hokkaido', 'okinawa']
+OTHER_CITY_COUNT = 4
+
+# Hand-written city SEO copy that has no catalog field. Anything not listed
+# falls back to the generic text in render_city_page().
+CITY_PAGE_OVERRIDES = {
+    'fukuoka': {
+        'title': 'Fukuoka Live Camera',
+        'description': 'Fukuoka live camera',
+        'keywords': 'Fukuoka live webcam, Fukuoka live stream, Fukuoka live camera',
+        'og_title': 'Fukuoka live camera',
+        'og_description': 'Watch live camera from Fukuoka, Japan.',
+        'adsense': True,
+    },
+    'fukushima': {
+        'adsense': True,
+    },
+    'hokkaido': {
+        'description': "Live webcams across Hokkaido featuring natural landscapes, cities, and seasonal beauty of Japan's northern island.",
+        'keywords': 'Hokkaido live webcam, Hokkaido nature cam, Sapporo live',
+        'og_description': "Live webcams across Hokkaido featuring natural landscapes, cities, and seasonal beauty of Japan's northern island.",
+        'schema_description': "Live webcams across Hokkaido featuring natural landscapes, cities, and seasonal beauty of Japan's northern island.",
+        'intro': "Discover Hokkaido's vast natural beauty through live cameras placed across Japan's northernmost island. From urban centers to pristine wilderness, mountains to coasts.",
+        'adsense': True,
+    },
+    'kyoto': {
+        'description': "Live streams from Kyoto's temples, traditional streets, and cultural landmarks. Watch Japan's ancient capital in real-time.",
+        'keywords': 'Kyoto live webcam, Kyoto temple cam, traditional Japan live',
+        'og_title': 'Kyoto Live Camera',
+        'og_description': 'Kyoto Live Camera',
+        'og_image': 'https://sakuralivecams.com/assets/images/city-images/kyoto.webp',
+        'schema_description': "Live streams from Kyoto's temples, traditional streets, and cultural landmarks. Watch Japan's ancient capital in real-time.",
+        'intro': "Step into Japan's cultural heart with live webcams from Kyoto. Watch traditional streets like Hanamikoji, the iconic Kyoto Tower, historic temples, and the bustling Kyoto Station.",
+        'adsense': True,
+    },
+    'okinawa': {
+        'title': 'Okinawa Live Webcams',
+        'description': 'Okinawa live camera, japan live camera',
+        'keywords': 'Okinawa live camera, japan live camera',
+        'og_description': 'Okinawa live camera, japan live camera',
+        'og_image': 'https://sakuralivecams.com/assets/images/city-images/okinawa.webp',
+        'schema_description': 'Live beach webcams from Okinawa. Watch tropical beaches, Kokusai Street, and island paradise in real-time.',
+        'intro': "Escape to Japan's tropical paradise with live webcams from Okinawa. Watch pristine beaches, the vibrant Kokusai Street, and island life.",
+        'adsense': True,
+    },
+    'osaka': {
+        'description': "Live webcams from Osaka, Japan's kitchen. Watch Dotonbori, airports, city skylines, and bustling streets in real-time.",
+        'keywords': 'Osaka live webcam, Dotonbori live stream, Osaka airport cam',
+        'og_description': "Live webcams from Osaka, Japan's kitchen. Watch Dotonbori, airports, city skylines, and bustling streets in real-time.",
+        'schema_description': "Live webcams from Osaka, Japan's kitchen. Watch Dotonbori, airports, city skylines, and bustling streets in real-time.",
+        'intro': "Discover Osaka through live webcam feeds from across the city. Known as 'Japan's Kitchen,' Osaka offers vibrant street life in Dotonbori, modern architecture at Abeno Harukas, and the exciting Expo 2025 site.",
+        'adsense': True,
+    },
+    'tokyo': {
+        'title': 'Tokyo live camera',
+        'description': 'Tokyo live camera',
+        'keywords': 'tokyo live camera, Tokyo live cam, tokyo live stream, Tokyo webcam',
+        'og_title': 'Tokyo Live Webcams',
+        'og_description': 'Tokyo live camera',
+        'og_image': 'https://sakuralivecams.com/assets/images/city-images/tokyo.webp',
+        'schema_description': "Watch live webcams from Tokyo, Japan's vibrant capital. Real-time views of Shibuya Crossing, Shinjuku, Tokyo Tower, and iconic landmarks.",
+        'intro': "Experience Tokyo live through HD webcams strategically placed across Japan's bustling capital. From the world-famous Shibuya Scramble Crossing to the neon-lit streets of Shinjuku, Tokyo Station's architectural grandeur, and panoramic views from Tokyo Tower.",
+        'adsense': True,
+    },
+    'yamanashi': {
+        'description': "Live Mount Fuji webcams and Yamanashi views. Watch Japan's iconic mountain and surrounding lakes in real-time.",
+        'keywords': 'Mount Fuji live cam, Fuji webcam, Lake Kawaguchiko live',
+        'og_description': "Live Mount Fuji webcams and Yamanashi views. Watch Japan's iconic mountain and surrounding lakes in real-time.",
+        'schema_description': "Live Mount Fuji webcams and Yamanashi views. Watch Japan's iconic mountain and surrounding lakes in real-time.",
+        'intro': 'Witness the majesty of Mount Fuji through multiple live webcams positioned around Yamanashi Prefecture. From Lake Kawaguchiko to various vantage points.',
+    },
+}
+
+EMBED_PATTERN = re.compile(r'youtube\.com/embed/([^"?&/]+)')
+
+# Hand-edited once a page exists; the page's own copy is kept on rebuilds
+CAMERA_PAGE_OWNED = (
+    re.compile(r'<title>.*?</title>'),
+    re.compile(r'<meta name="description" content="[^"]*">'),
+    re.compile(r'<meta name="keywords" content="[^"]*">'),
+    re.compile(r'<meta property="og:title" content="[^"]*">'),
+    re.compile(r'<meta property="og:description" content="[^"]*">'),
+    re.compile(r'[ \t]*<div class="text-gray-300 space-y-3 mb-4">.*?</div>', re.DOTALL),
+)
+CITY_PAGE_OWNED = (
+    re.compile(r'<div class="prose prose-lg text-gray-700 space-y-4">.*?</div>', re.DOTALL),
+)
+
+# One catalog stream
+Camera = namedtuple('Camera', 'slug name city city_slug video_id tags')
+
+# Per-run outcome counts for one page type
+BuildStats = namedtuple('BuildStats', 'created updated unchanged')
+
+
+def slugify(text):
+    """Turn a catalog name into a page slug ("Tokyo Tower & Railway" -> "tokyo-tower-railway")."""
+    # Page names are NFD so accented names keep their combining marks
+    text = unicodedata.normalize('NFD', text.lower())
+    text = re.sub(r'[^\w\s\u0300-\u036f-]', '', text)
+    return re.sub(r'[\s_-]+', '-', text).strip('-')
+
+
+def escape(text):
+    """Escape text for HTML the way the existing pages do."""
+    return html.escape(text).replace('&#x27;', '&#39;')
+
+
+def load_catalog(path=CATALOG_PATH):
+    """Read the stream catalog into Camera records, in catalog order."""
+    with open(path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+
+    cameras = []
+    for entry in entries:
+        video_match = re.search(r'youtube\.com/(?:live|embed)/([^"?&/]+)', entry['Link'])
+        if not video_match:
+            print(f"⚠️  Skipping {entry.get('Description')}: no video ID in {entry['Link']}")
+            continue
+        cameras.append(Camera(
+            slug=slugify(entry['Description']),
+            name=entry['Description'],
+            city=entry['Location'],
+            city_slug=slugify(entry['Location']),
+            video_id=video_match.group(1),
+            tags=tuple(entry.get('Tags') or ()),
+        ))
+    return cameras
+
+
+def group_by_city(cameras):
+    """Map city slug -> cameras in that city, in catalog order."""
+    cities = {}
+    for camera in cameras:
+        cities.setdefault(camera.city_slug, []).append(camera)
+    return cities
+
+
+def embedded_video_ids(cameras_dir):
+    """Map camera page slug -> embedded video ID (None if it embeds none)."""
+    pages = {}
+    for filename in os.listdir(cameras_dir):
+        if not filename.endswith('.html') or filename == 'index.html':
+            continue
+        with open(os.path.join(cameras_dir, filename), 'r', encoding='utf-8') as f:
+            match = EMBED_PATTERN.search(f.read())
+        pages[filename[:-5]] = match.group(1) if match else None
+    return pages
+
+
+def stale_pages(camera_pages, cameras_dir):
+    """(slug, page video ID, catalog video ID) of every page embedding another video than its stream."""
+    if not os.path.isdir(cameras_dir):
+        return []
+    embedded = embedded_video_ids(cameras_dir)
+    return [(slug, embedded[slug], camera.video_id) for slug, camera in camera_pages.items()
+            if embedded.get(slug) and embedded[slug] != camera.video_id]
+
+
+def sync_catalog(path, stale):
+    """Point the catalog entries of stale pages at the video the page embeds."""
+    with open(path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    # build_site gives a page to the last entry with its slug
+    last = {slugify(entry['Description']): position for position, entry in enumerate(entries)}
+    for slug, page_id, catalog_id in stale:
+        entry = entries[last[slug]]
+        entry['Link'] = entry['Link'].replace(catalog_id, page_id)
+    write_if_changed(path, json.dumps(entries, ensure_ascii=False, separators=(',', ':')) + '\n')
+
+
+def keep_page_copy(content, existing, patterns):
+    """Swap the hand-edited regions of a rendered page for the existing page's."""
+    if existing is None:
+        return content
+    for pattern in patterns:
+        ours, theirs = pattern.search(content), pattern.search(existing)
+        if ours and theirs:
+            content = content[:ours.start()] + theirs.group(0) + content[ours.end():]
+    return content
+
+
+def render_camera_page(camera, city_cameras, existing=None):
+    """Render one camera page; existing is the current page, whose own copy is kept."""
+    if existing is not None:
+        # The h1 may have been renamed by hand; the page uses it throughout
+        camera = camera._replace(name=get_page_metadata(existing).camera_name or camera.name)
+    related = [c for c in city_cameras if c.slug != camera.slug][:RELATED_CAMERA_COUNT]
+    related_html = ''
+    if related:
+        related_html = '\n' + '        \n'.join(
+            RELATED_CAMERA_TEMPLATE.render(slug=c.slug, video_id=c.video_id, name=escape(c.name))
+            for c in related
+        ) + '        '
+
+    schema_keywords = camera.tags or (camera.city.lower(), 'japan', 'live webcam')
+    description = create_unique_description(camera.name, camera.city, get_location_type(camera.name.lower()))
+
+    content = CAMERA_PAGE_TEMPLATE.render(
+        slug=camera.slug,
+        name=escape(camera.name),
+        city=escape(camera.city),
+        city_slug=camera.city_slug,
+        video_id=camera.video_id,
+        schema_name=json_string(camera.name),
+        schema_city=json_string(camera.city),
+        schema_keywords=json_string(', '.join(schema_keywords)),
+        meta_keywords=escape(', '.join(camera.tags)),
+        share_text=quote(f'Watch {camera.name}'),
+        description=description,
+        tag_badges=' '.join(CAMERA_TAG_TEMPLATE.render(tag=escape(tag)) for tag in camera.tags),
+        related_cameras=related_html,
+    )
+    return keep_page_copy(content, existing, CAMERA_PAGE_OWNED)
+
+
+def render_city_page(city_slug, city_cameras, existing=None):
+    """Render one city page; existing is the current page, whose own copy is kept."""
+    name = city_cameras[0].city
+    overrides = CITY_PAGE_OVERRIDES.get(city_slug, {})
+    description = f'Watch live webcams from {name}, Japan. Real-time views of landmarks, streets, and city life.'
+    copy = {
+        'title': f'{name} Live Webcams - Watch {len(city_cameras)}+ Real-Time Cameras | SakuraLive',
+        'description': description,
+        'keywords': f'{name} live webcam, {name} Japan live stream, {name} live cam',
+        'og_title': f'{name} Live Webcams - SakuraLive',
+        'og_description': description,
+        'og_image': f'https://img.youtube.com/vi/{city_cameras[0].video_id}/maxresdefault.jpg',
+        'schema_description': description,
+        'intro': f'Experience {name} through live webcam feeds showing various locations across the city.',
+    }
+    copy.update((key, value) for key, value in overrides.items() if key in copy)
+
+    cards = ''.join(
+        CAMERA_CARD_TEMPLATE.render(
+            slug=c.slug, video_id=c.video_id, name=escape(c.name),
+            tag_badges=' '.join(CITY_TAG_TEMPLATE.render(tag=escape(tag)) for tag in c.tags[:CARD_TAG_COUNT]),
+        )
+        for c in city_cameras
+    )
+
+    paragraphs = get_city_description(name)
+    about = ''.join(ABOUT_PARAGRAPH_TEMPLATE.render(text=paragraphs[key])
+                    for key in ('para1', 'para2', 'para3'))
+    places = '\n'.join(PLACE_TEMPLATE.render(place=place) for place in get_city_places(name)) + '\n'
+
+    other_slugs = [slug for slug in FEATURED_CITIES if slug != city_slug][:OTHER_CITY_COUNT]
+    other_cities = ''.join(OTHER_CITY_TEMPLATE.render(slug=slug, name=slug.title()) for slug in other_slugs)
+
+    content = CITY_PAGE_TEMPLATE.render(
+        {key: escape(value) for key, value in copy.items()},
+        slug=city_slug,
+        name=escape(name),
+        head_scripts=ADSENSE_SCRIPT if overrides.get('adsense') else '',
+        camera_count=len(city_cameras),
+        camera_cards=cards,
+        about_paragraphs=about,
+        places=places,
+        other_cities=other_cities,
+    )
+    return keep_page_copy(content, existing, CITY_PAGE_OWNED)
+
+
+def write_page(path, content, dry_run=False):
+    """Write a rendered page; returns 'created', 'updated' or 'unchanged'."""
+    existed = os.path.exists(path)
+    if dry_run:
+        if existed:
+            with open(path, 'r', encoding='utf-8') as f:
+                return 'unchanged' if f.read() == content else 'updated'
+        return 'created'
+    if not write_if_changed(path, content):
+        return 'unchanged'
+    return 'updated' if existed else 'created'
+
+
+def read_page(path):
+    """Current content of a page, or None if it doesn't exist yet."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def build_pages(pages, directory, thumbs, dry_run=False):
+    """Render and write (slug, render) pairs into directory.
+
+    render(existing) gets the page's current content (None for a new page).
+    The templates link YouTube thumbnails; streams mirrored by
+    mirror_thumbnails.py get their local copy instead.
+    """
+    os.makedirs(directory, exist_ok=True)
+    counts = {'created': 0, 'updated': 0, 'unchanged': 0}
+    for slug, render in pages:
+        path = os.path.join(directory, f'{slug}.html')
+        content, _ = rewrite_thumbnails(render(read_page(path)), 1, thumbs)
+        status = write_page(path, content, dry_run)
+        counts[status] += 1
+        if status != 'unchanged':
+            print(f"  {'✅' if status == 'created' else '🔄'} {status.title()}: {slug}.html")
+    return BuildStats(counts['created'], counts['updated'], counts['unchanged'])
+
+
+def build_stream_data(catalog_path, output_dir, dry_run=False):
+    """Write the home page filter index and per-location catalog shards."""
+    shards = render_catalog_shards(catalog_path)
+    outputs = [(index_path(CATALOG_PATH), render_stream_index(catalog_path))]
+    outputs += [(f'{SHARD_DIR}/{name}', content) for name, content in shards.items()]
+
+    shard_dir = os.path.join(output_dir, SHARD_DIR)
+    os.makedirs(shard_dir, exist_ok=True)
+    counts = {'created': 0, 'updated': 0, 'unchanged': 0}
+    for path, content in outputs:
+        status = write_page(os.path.join(output_dir, path), content, dry_run)
+        counts[status] += 1
+        if status != 'unchanged':
+            print(f"  {'✅' if status == 'created' else '🔄'} {status.title()}: {path}")
+    for name in stale_shards(shard_dir, shards):
+        print(f"  🗑️  Removed: {SHARD_DIR}/{name}")
+        if not dry_run:
+            os.remove(os.path.join(shard_dir, name))
+    return BuildStats(counts['created'], counts['updated'], counts['unchanged'])
+
+
+def catalog_pages(cameras):
+    """Map slug -> camera; duplicate catalog entries share one page and the last entry wins."""
+    camera_pages = {}
+    for camera in cameras:
+        camera_pages[camera.slug] = camera
+    return camera_pages
+
+
+def build_site(catalog_path=CATALOG_PATH, output_dir='.', only=None, dry_run=False,
+               sync=False, force=False):
+    """Render the camera and/or city pages from the catalog.
+
+    Stops with a drift report when the catalog and the camera pages
+    disagree on a video, unless sync (update the catalog from the pages) or
+    force (overwrite the pages) is set.
+    """
+    cameras = load_catalog(catalog_path)
+    stale = stale_pages(catalog_pages(cameras), os.path.join(output_dir, 'cameras'))
+    if stale and not force:
+        print(f"⚠️  {catalog_path} disagrees with {len(stale)} camera pages:")
+        for slug, page_id, catalog_id in stale:
+            print(f"  • cameras/{slug}.html embeds {page_id}, catalog has {catalog_id}")
+        if not sync:
+            raise SystemExit("❌ Nothing built. Use --sync-catalog to take the pages' video IDs, "
+                             "or --force to overwrite the pages.")
+        if dry_run:
+            print(f"  Would update {catalog_path} (dry run)\n")
+        else:
+            sync_catalog(catalog_path, stale)
+            print(f"  ✅ Updated {catalog_path} from the pages\n")
+            cameras = load_catalog(catalog_path)
+
+    cities = group_by_city(cameras)
+    camera_pages = catalog_pages(cameras)
+    thumbs = load_thumbs(os.path.join(output_dir, THUMBS_DIR, MANIFEST_NAME))
+
+    results = {}
+    if only in (None, 'cameras'):
+        print(f"📹 Rendering {len(camera_pages)} camera pages from {len(cameras)} catalog entries...")
+        results['cameras'] = build_pages(
+            ((slug, lambda existing, c=camera: render_camera_page(c, cities[c.city_slug], existing))
+             for slug, camera in camera_pages.items()),
+            os.path.join(output_dir, 'cameras'), thumbs, dry_run,
+        )
+    if only in (None, 'cities'):
+        print(f"🏙️  Rendering {len(cities)} city pages...")
+        results['cities'] = build_pages(
+            ((slug, lambda existing, s=slug, cams=city_cameras: render_city_page(s, cams, existing))
+             for slug, city_cameras in cities.items()),
+            os.path.join(output_dir, 'cities'), thumbs, dry_run,
+        )
+    if only in (None, 'streams'):
+        print("🔎 Building home page stream index and location shards...")
+        results['streams'] = build_stream_data(catalog_path, output_dir, dry_run)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Render camera and city pages from the stream catalog.')
+    parser.add_argument('--catalog', default=CATALOG_PATH, help=f'catalog JSON (default: {CATALOG_PATH})')
+    parser.add_argument('--output', default='.', help='site root to write cameras/, cities/ and the stream data into')
+    parser.add_argument('--only', choices=['cameras', 'cities', 'streams'], help='build only one output type')
+    parser.add_argument('--dry-run', action='store_true', help='report changes without writing files')
+    parser.add_argument('--sync-catalog', action='store_true',
+                        help="copy the video IDs of stale camera pages into the catalog before building")
+    parser.add_argument('--force', action='store_true',
+                        help='build even if the catalog disagrees with the camera pages (the catalog wins)')
+    args = parser.parse_args()
+
+    results = build_site(args.catalog, args.output, args.only, args.dry_run, args.sync_catalog, args.force)
+
+    print(f"\n{'='*60}")
+    print(f"Summary{' (dry run)' if args.dry_run else ''}:")
+    for page_type, stats in results.items():
+        print(f"  {page_type.title():<8} created {stats.created}, updated {stats.updated}, unchanged {stats.unchanged}")
+    print(f"{'='*60}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Build sitemap.xml by streaming <url> entries from the page inventory.
+
+Camera and city URLs come from the stream catalog (the pages build_site.py
+renders) plus any hand-made pages found in cameras/ and cities/; the home,
+utility and landing pages come from the site root. Every page is listed in
+English and in each language mirror that has it (see site_locales), each
+with its hreflang alternates.
+
+Entries are written one at a time by an incremental writer, so memory does
+not grow with the number of cameras. Once a file approaches the sitemap
+limits (50,000 URLs / 50 MB) the writer starts a new shard: the output then
+becomes sitemap-1.xml, sitemap-2.xml, ... under a sitemap_index.xml, and
+robots.txt is pointed at the index. With --gzip every sitemap file also gets
+a pre-compressed .xml.gz copy, and compress_site.py leaves the sitemap files
+alone. Files whose bytes did not change are left untouched.
+
+lastmod only advances for pages whose content changed (see page_lastmod);
+the changed and removed URLs are printed so they can be purged from the CDN.
+"""
+
+import os
+import re
+import gzip
+import argparse
+import filecmp
+from collections import namedtuple
+from xml.sax.saxutils import escape
+
+from build_site import CATALOG_PATH, load_catalog
+from page_lastmod import STORE_NAME, LastmodStore, read_sitemap_lastmods, print_change_report
+from site_locales import SOURCE_LANG, mirror_locales
+
+BASE_URL = 'https://sakuralivecams.com'
+
+# Stay under the protocol limits of 50,000 URLs and 50 MB per file
+MAX_URLS = 45000
+MAX_BYTES = 45 * 1024 * 1024
+
+# Priorities carried over from the hand-maintained sitemap
+HOME_PRIORITY = '1.00'
+UTILITY_PRIORITIES = {'contact.html': '0.60', 'privacy.html': '0.50', 'terms.html': '0.50'}
+LANDING_PRIORITY = '0.90'
+CITY_PRIORITY = '0.85'
+FEATURED_CITY_PRIORITY = '0.95'
+FEATURED_CITIES = ('fukuoka', 'hokkaido', 'kyoto', 'okinawa', 'osaka', 'tokyo', 'yokohama')
+CAMERA_PRIORITY = '0.80'
+FEATURED_CAMERA_PRIORITY = '0.90'
+FEATURED_CAMERAS = (
+    'shibuya-crossing-scramble-crossing',
+    'mount-fuji-oshino',
+    'osaka-dotonbori-live-camera',
+    'tokyo-tower',
+    'sapporo-station',
+)
+
+URLSET_HEADER = '''<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+        xmlns:xhtml="http://www.w3.org/1999/xhtml">
+'''
+URLSET_FOOTER = '</urlset>\n'
+INDEX_HEADER = '''<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+'''
+INDEX_FOOTER = '</sitemapindex>\n'
+
+# path: site-relative page path ('' for the home page), mirrors: (lang, path)
+# of each language mirror that has the page, alternate: path the hreflang
+# links use when the page's canonical URL differs from path (None otherwise)
+SitemapPage = namedtuple('SitemapPage', 'path mirrors priority alternate', defaults=(None,))
+
+CANONICAL_PATTERN = re.compile(r'<link\s+rel="canonical"\s+href="https?://[^/"]+/([^"]*)"')
+
+# lastmod: newest lastmod of the shard's URLs, for the sitemap index
+Shard = namedtuple('Shard', 'name count changed lastmod')
+
+
+def page_url(path):
+    return f'{BASE_URL}/{path}'
+
+
+def url_entry(loc, alternates, lastmod, priority):
+    """Render one <url> element."""
+    lines = ['    <url>', f'        <loc>{escape(loc)}</loc>']
+    for lang, href in alternates:
+        lines.append(f'        <xhtml:link rel="alternate" hreflang="{lang}" href="{escape(href)}"/>')
+    lines.append(f'        <lastmod>{lastmod}</lastmod>')
+    lines.append(f'        <priority>{priority}</priority>')
+    lines.append('    </url>\n')
+    return '\n'.join(lines)
+
+
+def page_entries(page, lastmod_for):
+    """Yield (<url> element, lastmod) for a page and each of its mirrors."""
+    en_url = page_url(page.path)
+    alternate_url = page_url(page.alternate) if page.alternate is not None else en_url
+    alternates = [(SOURCE_LANG, alternate_url)]
+    if page.mirrors:
+        alternates.extend((lang, page_url(path)) for lang, path in page.mirrors)
+        alternates.append(('x-default', alternate_url))
+
+    lastmod = lastmod_for(page.path)
+    yield url_entry(en_url, alternates, lastmod, page.priority), lastmod
+    for _, path in page.mirrors:
+        lastmod = lastmod_for(path)
+        yield url_entry(page_url(path), alternates, lastmod, page.priority), lastmod
+
+
+def html_name(slug):
+    """Sort key matching a listing of the .html files."""
+    return f'{slug}.html'
+
+
+def html_slugs(directory):
+    """Yield the page slugs in a directory (index.html included)."""
+    if not os.path.isdir(directory):
+        return
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith('.html'):
+                yield entry.name[:-5]
+
+
+def clean_alternate(root, name):
+    """The extensionless path of a root page whose canonical URL drops .html, else None."""
+    with open(os.path.join(root, name), 'r', encoding='utf-8') as f:
+        match = CANONICAL_PATTERN.search(f.read())
+    clean = name[:-len('.html')]
+    return clean if match and match.group(1) == clean else None
+
+
+def iter_pages(root, catalog_path):
+    """Yield every page of the site in sitemap order."""
+    locales = mirror_locales(root)
+
+    def mirrored(path):
+        mirrors = []
+        for lang in locales:
+            mirror_path = f'{lang}/{path}' if path else f'{lang}/'
+            if os.path.exists(os.path.join(root, mirror_path)):
+                mirrors.append((lang, mirror_path))
+        return tuple(mirrors)
+
+    yield SitemapPage('', mirrored(''), HOME_PRIORITY)
+    yield SitemapPage('index.html', mirrored('index.html'), HOME_PRIORITY)
+
+    cameras = load_catalog(os.path.join(root, catalog_path))
+    city_slugs = {camera.city_slug for camera in cameras}
+    city_slugs.update(html_slugs(os.path.join(root, 'cities')))
+    for slug in sorted(city_slugs, key=html_name):
+        path = f'cities/{slug}.html'
+        priority = FEATURED_CITY_PRIORITY if slug in FEATURED_CITIES else CITY_PRIORITY
+        yield SitemapPage(path, mirrored(path), priority)
+
+    camera_slugs = {camera.slug for camera in cameras}
+    camera_slugs.update(html_slugs(os.path.join(root, 'cameras')))
+    for slug in sorted(camera_slugs, key=html_name):
+        path = f'cameras/{slug}.html'
+        priority = FEATURED_CAMERA_PRIORITY if slug in FEATURED_CAMERAS else CAMERA_PRIORITY
+        yield SitemapPage(path, mirrored(path), priority)
+
+    for name, priority in UTILITY_PRIORITIES.items():
+        if os.path.exists(os.path.join(root, name)):
+            yield SitemapPage(name, mirrored(name), priority)
+
+    # Landing pages (seasonal guides and the like) at the site root
+    landing = sorted(name for name in os.listdir(root)
+                     if name.endswith('.html') and name != 'index.html' and name not in UTILITY_PRIORITIES)
+    for name in landing:
+        yield SitemapPage(name, mirrored(name), LANDING_PRIORITY, clean_alternate(root, name))
+
+
+class SitemapFile:
+    """One sitemap file written incrementally to a temp file, optionally gzipped."""
+
+    def __init__(self, path, header, footer, use_gzip=False):
+        self.path = path
+        self.footer = footer
+        self.tmp_path = f'{path}.{os.getpid()}.tmp'
+        self.file = open(self.tmp_path, 'w', encoding='utf-8', newline='\n')
+        self.gzip_raw = self.gzip_file = None
+        if use_gzip:
+            # No file name or mtime in the header, so the bytes only depend on
+            # the content (the temp name has the PID in it, and a single
+            # shard is renamed to sitemap.xml afterwards)
+            self.gzip_raw = open(f'{self.tmp_path}.gz', 'wb')
+            self.gzip_file = gzip.GzipFile(filename='', mode='wb', fileobj=self.gzip_raw, mtime=0)
+        self.count = 0
+        self.size = 0
+        self.lastmod = ''
+        self.write(header)
+
+    def write(self, text):
+        data = text.encode('utf-8')
+        self.file.write(text)
+        if self.gzip_file:
+            self.gzip_file.write(data)
+        self.size += len(data)
+
+    def fits(self, text, max_urls, max_bytes):
+        """Check if one more entry keeps the file within the limits."""
+        size = self.size + len(text.encode('utf-8')) + len(self.footer)
+        return self.count < max_urls and size <= max_bytes
+
+    def add(self, text, lastmod=''):
+        self.write(text)
+        self.count += 1
+        self.lastmod = max(self.lastmod, lastmod)
+
+    def close(self):
+        """Finish the file and return its Shard record."""
+        self.write(self.footer)
+        self.file.close()
+        changed = _replace_if_changed(self.tmp_path, self.path)
+        if self.gzip_file:
+            self.gzip_file.close()
+            self.gzip_raw.close()
+            _replace_if_changed(f'{self.tmp_path}.gz', f'{self.path}.gz')
+        return Shard(os.path.basename(self.path), self.count, changed, self.lastmod)
+
+
+def _replace_if_changed(tmp_path, path):
+    if os.path.exists(path) and filecmp.cmp(tmp_path, path, shallow=False):
+        os.remove(tmp_path)
+        return False
+    os.replace(tmp_path, path)
+    return True
+
+
+def shard_name(number):
+    return f'sitemap-{number}.xml'
+
+
+def write_shards(root, entries, max_urls=MAX_URLS, max_bytes=MAX_BYTES, use_gzip=False):
+    """Stream (entry, lastmod) pairs into sitemap shards; return their Shard records."""
+    shards = []
+    current = None
+    for entry, lastmod in entries:
+        if current is None or not current.fits(entry, max_urls, max_bytes):
+            if current is not None:
+                shards.append(current.close())
+            current = SitemapFile(os.path.join(root, shard_name(len(shards) + 1)),
+                                  URLSET_HEADER, URLSET_FOOTER, use_gzip)
+        current.add(entry, lastmod)
+    if current is not None:
+        shards.append(current.close())
+    return shards
+
+
+def write_index(root, shards, use_gzip=False):
+    """Write sitemap_index.xml listing the shards; return its Shard record."""
+    index = SitemapFile(os.path.join(root, 'sitemap_index.xml'), INDEX_HEADER, INDEX_FOOTER, use_gzip)
+    for shard in shards:
+        index.add(f'    <sitemap>\n        <loc>{page_url(shard.name)}</loc>\n'
+                  f'        <lastmod>{shard.lastmod}</lastmod>\n    </sitemap>\n')
+    return index.close()
+
+
+def point_robots_at(root, sitemap_name):
+    """Make the Sitemap: line in robots.txt point at the given file."""
+    robots_path = os.path.join(root, 'robots.txt')
+    if not os.path.exists(robots_path):
+        return False
+    with open(robots_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    updated = re.sub(r'(?m)^Sitemap: .*$', f'Sitemap: {page_url(sitemap_name)}', content)
+    if updated == content:
+        return False
+    with open(robots_path, 'w', encoding='utf-8') as f:
+        f.write(updated)
+    return True
+
+
+def remove_files(root, names):
+    for name in names:
+        for path in (os.path.join(root, name), os.path.join(root, f'{name}.gz')):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def sitemap_files(root):
+    """Names of the sitemap files currently in root."""
+    return [name for name in os.listdir(root) if re.fullmatch(r'sitemap(-\d+)?\.xml', name)]
+
+
+def build_sitemap(root='.', catalog_path=CATALOG_PATH, lastmod=None,
+                  max_urls=MAX_URLS, max_bytes=MAX_BYTES, use_gzip=False):
+    """Write the sitemap (sharded if needed).
+
+    Without a fixed lastmod, dates come from the LastmodStore and only move
+    for pages whose content changed. Returns (shards, store); store is None
+    when lastmod was fixed.
+    """
+    store = None
+    if not lastmod:
+        seed = read_sitemap_lastmods([os.path.join(root, name) for name in sitemap_files(root)], BASE_URL)
+        store = LastmodStore(os.path.join(root, STORE_NAME), seed=seed)
+
+    def lastmod_for(path):
+        if store is None:
+            return lastmod
+        return store.file_lastmod(root, path) or store.today
+
+    entries = (entry for page in iter_pages(root, catalog_path) for entry in page_entries(page, lastmod_for))
+    shards = write_shards(root, entries, max_urls, max_bytes, use_gzip)
+
+    stale = set(name for name in sitemap_files(root) if name != 'sitemap.xml')
+    if len(shards) == 1:
+        # Everything fits in one file: keep the plain sitemap.xml layout
+        shard = shards[0]
+        changed = _replace_if_changed(os.path.join(root, shard.name), os.path.join(root, 'sitemap.xml'))
+        if use_gzip:
+            _replace_if_changed(os.path.join(root, f'{shard.name}.gz'), os.path.join(root, 'sitemap.xml.gz'))
+        elif os.path.exists(os.path.join(root, 'sitemap.xml.gz')):
+            os.remove(os.path.join(root, 'sitemap.xml.gz'))
+        shards = [shard._replace(name='sitemap.xml', changed=changed)]
+        remove_files(root, stale | {shard.name, 'sitemap_index.xml'})
+        point_robots_at(root, 'sitemap.xml')
+    else:
+        write_index(root, shards, use_gzip)
+        remove_files(root, stale - {shard.name for shard in shards} | {'sitemap.xml'})
+        point_robots_at(root, 'sitemap_index.xml')
+
+    if store is not None:
+        store.prune()
+        store.save()
+    return shards, store
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build sitemap.xml from the page inventory and catalog.')
+    parser.add_argument('--root', default='.', help='site root (default: current directory)')
+    parser.add_argument('--catalog', default=CATALOG_PATH, help=f'catalog JSON (default: {CATALOG_PATH})')
+    parser.add_argument('--lastmod', help='fixed lastmod for every URL (default: tracked per page in .lastmod.json)')
+    parser.add_argument('--changed-urls', metavar='FILE', help='write the changed and removed URLs to FILE for CDN purging')
+    parser.add_argument('--gzip', action='store_true', help='also write a .xml.gz copy of every sitemap file')
+    parser.add_argument('--max-urls', type=int, default=MAX_URLS, help=f'URLs per shard (default: {MAX_URLS})')
+    parser.add_argument('--max-bytes', type=int, default=MAX_BYTES, help=f'bytes per shard (default: {MAX_BYTES})')
+    args = parser.parse_args()
+
+    print("🗺️  Building sitemap...")
+    shards, store = build_sitemap(args.root, args.catalog, args.lastmod, args.max_urls, args.max_bytes, args.gzip)
+
+    for shard in shards:
+        status = '✅ Wrote' if shard.changed else '⏭️  Unchanged'
+        print(f"  {status} {shard.name} ({shard.count} URLs)")
+    if len(shards) > 1:
+        print(f"  ✅ Wrote sitemap_index.xml ({len(shards)} shards)")
+
+    if store is not None:
+        print_change_report(store.changed, store.removed, BASE_URL, args.changed_urls)
+
+    print(f"\n{'='*60}")
+    print(f"Summary:")
+    print(f"  URLs:    {sum(shard.count for shard in shards)}")
+    if store is not None:
+        print(f"  Changed: {len(store.changed)}")
+        print(f"  Removed: {len(store.removed)}")
+    print(f"  Files:   {len(shards)}{' (+ .gz)' if args.gzip else ''}")
+    print(f"{'='*60}")
+
+
+if __name__ == '__main__':
+    main()
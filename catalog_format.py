@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+Compact compiled form of the stream catalogs (assets/output2.json,
+assets/output22.json).
+
+The JSON catalogs repeat every field name and the full YouTube URL for each
+stream. compile_catalog() interns every string (locations, tags,
+descriptions, URL prefixes, video IDs) into one string table and stores the
+entries as columns of table references:
+
+    header      magic, format version, entry count, SHA-256 of the source
+                JSON, then per field: type, name, column offset and size
+    strings     count, end offsets, UTF-8 blob
+    columns     's' field: one u32 string ref per entry
+                'u' field: u32 prefix refs then u32 video-ID refs (Link)
+                'l' field: u32 list starts (count + 1), a presence byte per
+                entry, then the u32 refs
+
+Missing values are NO_VALUE (or a zero presence byte for lists), and entries
+keep their field order, so reading a compiled catalog gives back exactly
+the JSON entries. All integers are little-endian and columns are 4-byte
+aligned.
+
+CatalogReader memory-maps a compiled file and decodes entries or single
+columns on demand. load_entries() keeps a compiled copy next to the JSON
+(gitignored *.slcat) and reads that while the source hash still matches.
+At today's ~200 entries the C JSON parser still beats decoding every entry
+in Python, so the build scripts keep json.load(); the compiled form pays
+off for single-column reads (video_ids(), column()) and as the catalog
+grows.
+
+compact_json() is the same interned, columnar layout as minified JSON for
+browsers; expand it with strings[ref] lookups the same way.
+
+Usage:
+    python3 catalog_format.py                        # compile both catalogs
+    python3 catalog_format.py assets/output2.json --json
+"""
+
+import os
+import sys
+import json
+import mmap
+import array
+import struct
+import argparse
+import hashlib
+
+from build_manifest import write_if_changed
+
+CATALOG_PATHS = ['assets/output2.json', 'assets/output22.json']
+COMPILED_EXT = '.slcat'
+COMPACT_EXT = '.min.json'
+
+MAGIC = b'SLCAT\0'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<6sHI32sH')        # magic, version, count, source sha256, field count
+FIELD = struct.Struct('<cB')               # type, name length (name bytes follow)
+FIELD_COLUMN = struct.Struct('<II')        # column offset, column size
+NO_VALUE = 0xFFFFFFFF
+
+# Links are stored as an interned prefix plus the video ID after the last '/'
+LINK_FIELD = 'Link'
+
+
+def compiled_path(json_path):
+    """Path of the compiled copy of a JSON catalog."""
+    return os.path.splitext(json_path)[0] + COMPILED_EXT
+
+
+def _u32(values):
+    data = array.array('I', values)
+    if sys.byteorder == 'big':
+        data.byteswap()
+    return data.tobytes()
+
+
+def _align(data):
+    return data + b'\0' * (-len(data) % 4)
+
+
+class StringTable:
+    """Interns strings, handing out dense references."""
+
+    def __init__(self):
+        self.refs = {}
+        self.strings = []
+
+    def ref(self, text):
+        if text is None:
+            return NO_VALUE
+        ref = self.refs.get(text)
+        if ref is None:
+            ref = self.refs[text] = len(self.strings)
+            self.strings.append(text)
+        return ref
+
+    def encode(self):
+        blobs = [text.encode('utf-8') for text in self.strings]
+        ends, total = [], 0
+        for blob in blobs:
+            total += len(blob)
+            ends.append(total)
+        return _align(_u32([len(blobs)] + ends) + b''.join(blobs))
+
+
+def catalog_fields(entries):
+    """Ordered (name, type) pairs for the fields used by entries.
+
+    Raises ValueError for values other than strings or lists of strings, or
+    for entries that order their fields differently.
+    """
+    order = []
+    types = {}
+    for entry in entries:
+        for name, value in entry.items():
+            if isinstance(value, str):
+                kind = 'u' if name == LINK_FIELD else 's'
+            elif isinstance(value, list) and all(isinstance(item, str) for item in value):
+                kind = 'l'
+            else:
+                raise ValueError(f"{name}: unsupported value {value!r}")
+            if types.setdefault(name, kind) != kind:
+                raise ValueError(f"{name}: mixed value types")
+            if name not in order:
+                order.append(name)
+
+    position = {name: i for i, name in enumerate(order)}
+    for entry in entries:
+        positions = [position[name] for name in entry]
+        if positions != sorted(positions):
+            raise ValueError(f"entry fields out of order: {list(entry)}")
+    return [(name, types[name]) for name in order]
+
+
+def compile_catalog(entries, source_hash=b''):
+    """Compile catalog entries into the columnar binary format."""
+    fields = catalog_fields(entries)
+    strings = StringTable()
+    columns = []
+    for name, kind in fields:
+        values = [entry.get(name) for entry in entries]
+        if kind == 's':
+            columns.append(_u32([strings.ref(value) for value in values]))
+        elif kind == 'u':
+            prefixes, ids = [], []
+            for value in values:
+                if value is None:
+                    prefixes.append(NO_VALUE)
+                    ids.append(NO_VALUE)
+                    continue
+                cut = value.rfind('/') + 1
+                prefixes.append(strings.ref(value[:cut]))
+                ids.append(strings.ref(value[cut:]))
+            columns.append(_u32(prefixes) + _u32(ids))
+        else:
+            starts, refs = [0], []
+            for value in values:
+                refs.extend(strings.ref(item) for item in value or ())
+                starts.append(len(refs))
+            present = bytes(value is not None for value in values)
+            columns.append(_u32(starts) + _align(present) + _u32(refs))
+
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, len(entries), source_hash.ljust(32, b'\0'), len(fields))
+    header += b''.join(FIELD.pack(kind.encode(), len(name.encode())) + name.encode() for name, kind in fields)
+    header_size = len(_align(header + FIELD_COLUMN.size * len(fields) * b'\0'))
+
+    string_blob = strings.encode()
+    offset = header_size + len(string_blob)
+    placements = []
+    for column in columns:
+        placements.append(FIELD_COLUMN.pack(offset, len(column)))
+        offset += len(column)
+    header = _align(header + b''.join(placements))
+    return header + string_blob + b''.join(columns)
+
+
+class CatalogReader:
+    """Read-only, memory-mapped view of a compiled catalog."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._parse()
+        except Exception:
+            self.close()
+            raise
+
+    def _parse(self):
+        data = memoryview(self._map)
+        magic, version, self.count, self.source_hash, field_count = HEADER.unpack_from(data)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{self.path}: not a version {FORMAT_VERSION} compiled catalog")
+
+        offset = HEADER.size
+        names = []
+        for _ in range(field_count):
+            kind, length = FIELD.unpack_from(data, offset)
+            offset += FIELD.size
+            names.append((bytes(data[offset:offset + length]).decode('utf-8'), kind.decode()))
+            offset += length
+        self.fields = []
+        for name, kind in names:
+            start, size = FIELD_COLUMN.unpack_from(data, offset)
+            offset += FIELD_COLUMN.size
+            self.fields.append((name, kind, data[start:start + size]))
+
+        string_offset = (offset + 3) & ~3
+        string_count = self._u32(data[string_offset:string_offset + 4])[0]
+        self._string_ends = self._u32(data[string_offset + 4:string_offset + 4 + 4 * string_count])
+        self._blob_start = string_offset + 4 + 4 * string_count
+        self._strings = {}
+        self._table = None
+
+    @staticmethod
+    def _u32(view):
+        if sys.byteorder == 'big':
+            values = array.array('I', bytes(view))
+            values.byteswap()
+            return values
+        return view.cast('I')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        for attr in ('fields', '_string_ends'):
+            # Release memoryviews first or the map refuses to close
+            if hasattr(self, attr):
+                delattr(self, attr)
+        self._map.close()
+
+    def __len__(self):
+        return self.count
+
+    def string(self, ref):
+        """Decode one string table entry (cached)."""
+        if ref == NO_VALUE:
+            return None
+        text = self._strings.get(ref)
+        if text is None:
+            start = self._string_ends[ref - 1] if ref else 0
+            end = self._string_ends[ref]
+            text = self._map[self._blob_start + start:self._blob_start + end].decode('utf-8')
+            self._strings[ref] = text
+        return text
+
+    def strings(self):
+        """The whole string table, decoded once; NO_VALUE maps to None."""
+        if self._table is None:
+            blob = self._map[self._blob_start:self._blob_start + (self._string_ends[-1] if len(self._string_ends) else 0)]
+            table, start = {}, 0
+            for ref, end in enumerate(self._string_ends):
+                table[ref] = blob[start:end].decode('utf-8')
+                start = end
+            table[NO_VALUE] = None
+            self._table = table
+        return self._table
+
+    def _decode(self, kind, column):
+        count = self.count
+        table = self.strings()
+        if kind == 's':
+            return [table[ref] for ref in self._u32(column)]
+        if kind == 'u':
+            refs = self._u32(column)
+            return [None if prefix == NO_VALUE else table[prefix] + table[video_id]
+                    for prefix, video_id in zip(refs[:count], refs[count:])]
+        starts = self._u32(column[:4 * (count + 1)]).tolist()
+        present_start = 4 * (count + 1)
+        present = column[present_start:present_start + count]
+        refs_start = present_start + ((count + 3) & ~3)
+        values = [table[ref] for ref in self._u32(column[refs_start:])]
+        return [values[starts[i]:starts[i + 1]] if present[i] else None for i in range(count)]
+
+    def column(self, name):
+        """All values of one field, in catalog order (None where missing)."""
+        for field, kind, column in self.fields:
+            if field == name:
+                return self._decode(kind, column)
+        raise KeyError(name)
+
+    def video_ids(self):
+        """Video IDs straight from the Link column, without rebuilding URLs."""
+        for field, kind, column in self.fields:
+            if field == LINK_FIELD and kind == 'u':
+                table = self.strings()
+                return [table[ref] for ref in self._u32(column)[self.count:]]
+        raise KeyError(LINK_FIELD)
+
+    def entries(self):
+        """Decode every entry as the dict the JSON catalog holds."""
+        names = [name for name, _, _ in self.fields]
+        columns = [self._decode(kind, column) for _, kind, column in self.fields]
+        if all(None not in values for values in columns):
+            return [dict(zip(names, row)) for row in zip(*columns)]
+        return [{name: value for name, value in zip(names, row) if value is not None}
+                for row in zip(*columns)]
+
+
+def compact_json(entries):
+    """Interned, columnar catalog as minified JSON for browsers."""
+    fields = catalog_fields(entries)
+    strings = StringTable()
+    columns = {}
+    for name, kind in fields:
+        values = [entry.get(name) for entry in entries]
+        if kind == 'u':
+            cut = [value.rfind('/') + 1 if value is not None else 0 for value in values]
+            columns[name] = {
+                'prefix': [strings.ref(v[:c]) if v is not None else None for v, c in zip(values, cut)],
+                'id': [v[c:] if v is not None else None for v, c in zip(values, cut)],
+            }
+        elif kind == 's':
+            columns[name] = [strings.ref(value) if value is not None else None for value in values]
+        else:
+            columns[name] = [[strings.ref(item) for item in value] if value is not None else None
+                             for value in values]
+    data = {
+        'version': FORMAT_VERSION,
+        'count': len(entries),
+        'fields': [name for name, _ in fields],
+        'strings': strings.strings,
+        'columns': columns,
+    }
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+
+def compile_file(json_path, output_path=None):
+    """Compile a JSON catalog; returns True if the compiled file changed."""
+    with open(json_path, 'rb') as f:
+        source = f.read()
+    compiled = compile_catalog(json.loads(source), hashlib.sha256(source).digest())
+    output_path = output_path or compiled_path(json_path)
+    try:
+        with open(output_path, 'rb') as f:
+            if f.read() == compiled:
+                return False
+    except FileNotFoundError:
+        pass
+    with open(output_path, 'wb') as f:
+        f.write(compiled)
+    return True
+
+
+def load_entries(json_path):
+    """Catalog entries, from the compiled copy while it matches the JSON.
+
+    A missing or stale compiled copy is rebuilt from the JSON on the way.
+    """
+    with open(json_path, 'rb') as f:
+        source = f.read()
+    source_hash = hashlib.sha256(source).digest()
+    path = compiled_path(json_path)
+    try:
+        with CatalogReader(path) as reader:
+            if reader.source_hash == source_hash:
+                return reader.entries()
+    except (OSError, ValueError, struct.error):
+        pass
+
+    entries = json.loads(source)
+    try:
+        with open(path, 'wb') as f:
+            f.write(compile_catalog(entries, source_hash))
+    except (OSError, ValueError):
+        # The cache is an optimization; a read-only tree or odd entry still loads
+        pass
+    return entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compile the stream catalogs into the compact columnar format.')
+    parser.add_argument('catalogs', nargs='*', default=CATALOG_PATHS, help='JSON catalogs (default: both)')
+    parser.add_argument('--json', action='store_true', help=f'also write the browser variant ({COMPACT_EXT})')
+    args = parser.parse_args()
+
+    for json_path in args.catalogs:
+        with open(json_path, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+        compile_file(json_path)
+        path = compiled_path(json_path)
+        with CatalogReader(path) as reader:
+            if reader.entries() != entries:
+                print(f"❌ {path}: compiled catalog does not read back as {json_path}")
+                sys.exit(1)
+        print(f"✅ {json_path}: {len(entries)} entries, "
+              f"{os.path.getsize(json_path):,} -> {os.path.getsize(path):,} bytes ({path})")
+        if args.json:
+            compact_path = os.path.splitext(json_path)[0] + COMPACT_EXT
+            write_if_changed(compact_path, compact_json(entries))
+            print(f"   {os.path.getsize(compact_path):,} bytes as compact JSON ({compact_path})")
+
+if __name__ == '__main__':
+    main()
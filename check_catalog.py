@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Validate the stream catalogs and merge them into one canonical catalog.
+
+assets/output2.json is the catalog the site is built from; the older
+assets/output22.json has drifted from it (mixed-language descriptions,
+fewer tags, repeated streams). Both are indexed by YouTube video ID in one
+pass each, then checked against each other and against cameras/*.html:
+
+    duplicates        the same video ID more than once in a file
+    slug collisions   different streams whose names give the same page slug,
+                      so one page silently wins
+    conflicts         the files disagree on a stream's location or name
+    one-sided         streams only one of the files has
+    orphan pages      camera pages with no catalog stream
+    missing pages     catalog streams with no camera page
+    stale pages       pages embedding a different video than their stream
+    mixed language    descriptions with Japanese text in them
+
+Every check is a dict lookup per entry or page, so the run stays linear in
+catalog size plus page count.
+
+--merge writes the canonical catalog: output2.json's streams in order,
+duplicates folded into their first occurrence, tags from either file
+unioned, and missing Metadata filled in. Streams only output22.json has are
+left out unless --add-new is given, since they have no reviewed English
+name or prefecture yet.
+
+Usage:
+    python3 check_catalog.py
+    python3 check_catalog.py --merge assets/output2.json
+    python3 check_catalog.py --strict          # exit 1 if any problem is found
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+from collections import namedtuple
+
+from build_manifest import write_if_changed
+from build_site import slugify, embedded_video_ids
+
+PRIMARY_PATH = 'assets/output2.json'
+SECONDARY_PATH = 'assets/output22.json'
+CAMERAS_DIR = 'cameras'
+
+# Canonical field order, as in output2.json
+FIELD_ORDER = ['Link', 'Location', 'Description', 'Tags', 'Metadata']
+
+VIDEO_ID_PATTERN = re.compile(r'youtube\.com/(?:live|embed)/([^"?&/]+)')
+JAPANESE_PATTERN = re.compile(r'[\u3040-\u30ff\u3400-\u9fff\uff00-\uffef]')
+
+# Printed detail lines per check unless --verbose
+DETAIL_LIMIT = 10
+
+# One catalog entry, remembered by file and position
+Stream = namedtuple('Stream', 'source position video_id entry')
+
+
+def video_id(link):
+    """YouTube video ID of a catalog Link, or None."""
+    match = VIDEO_ID_PATTERN.search(link or '')
+    return match.group(1) if match else None
+
+
+def name_key(text):
+    """Comparable form of a stream name: Latin letters and digits only."""
+    return re.sub(r'[^a-z0-9]', '', (text or '').lower())
+
+
+def load_streams(path):
+    """Read a catalog; returns (streams, {video ID: [streams]}, bad-link streams)."""
+    with open(path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    streams, by_id, bad_links = [], {}, []
+    for position, entry in enumerate(entries):
+        stream = Stream(path, position, video_id(entry.get('Link')), entry)
+        streams.append(stream)
+        if stream.video_id is None:
+            bad_links.append(stream)
+        else:
+            by_id.setdefault(stream.video_id, []).append(stream)
+    return streams, by_id, bad_links
+
+
+def describe(stream):
+    """Short label for a stream in reports."""
+    return f"{os.path.basename(stream.source)}#{stream.position} {stream.video_id} \"{stream.entry.get('Description')}\""
+
+
+def check_catalogs(primary_path, secondary_path, cameras_dir):
+    """Run every check; returns {check name: [detail lines]}."""
+    primary, primary_ids, primary_bad = load_streams(primary_path)
+    secondary, secondary_ids, secondary_bad = load_streams(secondary_path)
+    primary_name = os.path.basename(primary_path)
+    secondary_name = os.path.basename(secondary_path)
+    report = {}
+
+    report['Unparseable links'] = [
+        f"{describe(stream)}: {stream.entry.get('Link')}" for stream in primary_bad + secondary_bad
+    ]
+
+    duplicates = []
+    for by_id in (primary_ids, secondary_ids):
+        for streams in by_id.values():
+            if len(streams) > 1:
+                differs = any(s.entry != streams[0].entry for s in streams[1:])
+                positions = ', '.join(f'#{s.position}' for s in streams)
+                duplicates.append(f"{describe(streams[0])} at {positions}"
+                                  f"{' (entries differ)' if differs else ''}")
+    report['Duplicate video IDs'] = duplicates
+
+    # Duplicate IDs already share a page; only distinct streams collide
+    slugs = {}
+    for streams in primary_ids.values():
+        slug = slugify(streams[0].entry.get('Description') or '')
+        slugs.setdefault(slug, []).append(streams[0])
+    report['Slug collisions'] = [
+        f"{slug}.html <- " + '; '.join(describe(s) for s in streams)
+        for slug, streams in slugs.items() if len(streams) > 1
+    ]
+
+    conflicts = []
+    for vid, streams in primary_ids.items():
+        other = secondary_ids.get(vid)
+        if not other:
+            continue
+        ours, theirs = streams[0].entry, other[0].entry
+        if (ours.get('Location') or '').lower() != (theirs.get('Location') or '').lower():
+            conflicts.append(f"{vid} location: {ours.get('Location')!r} vs {theirs.get('Location')!r}")
+        ours_key, theirs_key = name_key(ours.get('Description')), name_key(theirs.get('Description'))
+        if ours_key not in theirs_key and theirs_key not in ours_key:
+            conflicts.append(f"{vid} name: {ours.get('Description')!r} vs {theirs.get('Description')!r}")
+    report['Conflicting metadata'] = conflicts
+
+    report[f'Only in {primary_name}'] = [
+        describe(streams[0]) for vid, streams in primary_ids.items() if vid not in secondary_ids
+    ]
+    report[f'Only in {secondary_name}'] = [
+        describe(streams[0]) for vid, streams in secondary_ids.items() if vid not in primary_ids
+    ]
+
+    pages = embedded_video_ids(cameras_dir)
+    report['Orphan camera pages'] = [
+        f"{cameras_dir}/{slug}.html" for slug in sorted(pages) if slug not in slugs
+    ]
+    report['Streams without a page'] = [
+        f"{slug}.html <- {describe(streams[-1])}" for slug, streams in slugs.items() if slug not in pages
+    ]
+    # build_site gives a collided slug to the last stream, so compare against that one
+    report['Stale camera pages'] = [
+        f"{cameras_dir}/{slug}.html embeds {pages[slug]}, catalog has {streams[-1].video_id}"
+        for slug, streams in slugs.items()
+        if slug in pages and pages[slug] != streams[-1].video_id
+    ]
+
+    report['Mixed-language descriptions'] = [
+        describe(stream) for stream in primary + secondary
+        if JAPANESE_PATTERN.search(stream.entry.get('Description') or '')
+    ]
+    return report
+
+
+def merge_tags(tags, extra):
+    """Tags followed by the extra tags they don't already have, lowercased like output2.json's."""
+    merged = list(dict.fromkeys(tag.lower() for tag in tags))
+    seen = set(merged)
+    for tag in extra or ():
+        if tag.lower() not in seen:
+            seen.add(tag.lower())
+            merged.append(tag.lower())
+    return merged
+
+
+def canonical_entry(entry):
+    """Entry in canonical field order with Metadata filled in."""
+    entry = dict(entry)
+    if not entry.get('Metadata'):
+        description, location = entry.get('Description', ''), entry.get('Location', '')
+        place = description if location.lower() in description.lower() else f"{description}, {location}"
+        entry['Metadata'] = f"Live webcam view of {place}, Japan."
+    ordered = {field: entry.pop(field) for field in FIELD_ORDER if field in entry}
+    ordered.update(entry)
+    return ordered
+
+
+def merge_catalogs(primary_path, secondary_path, add_new=False):
+    """Canonical merged catalog entries (see the module docstring)."""
+    primary, _, _ = load_streams(primary_path)
+    _, secondary_ids, _ = load_streams(secondary_path)
+
+    merged = {}
+    for stream in primary:
+        # Streams without a video ID can't be matched; keep them as they are
+        key = stream.video_id or ('link', stream.position)
+        if key in merged:
+            merged[key]['Tags'] = merge_tags(merged[key].get('Tags') or [], stream.entry.get('Tags'))
+        else:
+            merged[key] = dict(stream.entry, Tags=merge_tags(stream.entry.get('Tags') or [], ()))
+
+    for vid, streams in secondary_ids.items():
+        if vid in merged:
+            for stream in streams:
+                merged[vid]['Tags'] = merge_tags(merged[vid].get('Tags') or [], stream.entry.get('Tags'))
+        elif add_new:
+            entry = dict(streams[0].entry, Tags=merge_tags(streams[0].entry.get('Tags') or [], ()))
+            for stream in streams[1:]:
+                entry['Tags'] = merge_tags(entry.get('Tags') or [], stream.entry.get('Tags'))
+            merged[vid] = entry
+
+    return [canonical_entry(entry) for entry in merged.values()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Validate the stream catalogs and merge them.')
+    parser.add_argument('--primary', default=PRIMARY_PATH, help=f'catalog the site is built from (default: {PRIMARY_PATH})')
+    parser.add_argument('--secondary', default=SECONDARY_PATH, help=f'older catalog to reconcile (default: {SECONDARY_PATH})')
+    parser.add_argument('--cameras', default=CAMERAS_DIR, help=f'camera pages directory (default: {CAMERAS_DIR})')
+    parser.add_argument('--merge', metavar='OUTPUT', help='write the canonical merged catalog to OUTPUT')
+    parser.add_argument('--add-new', action='store_true', help='include streams only the secondary catalog has in the merge')
+    parser.add_argument('--verbose', action='store_true', help='list every finding, not just the first few')
+    parser.add_argument('--strict', action='store_true', help='exit with status 1 if any check finds problems')
+    args = parser.parse_args()
+
+    print(f"🔍 Checking {args.primary} against {args.secondary} and {args.cameras}/...")
+    report = check_catalogs(args.primary, args.secondary, args.cameras)
+
+    for check, details in report.items():
+        if not details:
+            continue
+        print(f"\n⚠️  {check} ({len(details)}):")
+        shown = details if args.verbose else details[:DETAIL_LIMIT]
+        for line in shown:
+            print(f"  • {line}")
+        if len(shown) < len(details):
+            print(f"  ... {len(details) - len(shown)} more (--verbose to list all)")
+
+    if args.merge:
+        entries = merge_catalogs(args.primary, args.secondary, args.add_new)
+        content = json.dumps(entries, ensure_ascii=False, separators=(',', ':')) + '\n'
+        written = write_if_changed(args.merge, content)
+        print(f"\n{'✅ Wrote' if written else '⏭️  Unchanged:'} {args.merge} ({len(entries)} streams)")
+
+    print(f"\n{'='*60}")
+    print("Summary:")
+    for check, details in report.items():
+        print(f"  {'⚠️ ' if details else '✅'} {check}: {len(details)}")
+    print(f"{'='*60}")
+
+    if args.strict and any(report.values()):
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Build the site's link graph offline and report broken links.
+
+Pages link to each other through relative paths that several scripts write
+or rewrite (../cities/, ../cameras/, ../../assets/ in the mirrors, the
+hard-coded footer links of update_footer.py and update_city_pages.py) and
+through absolute https://sakuralivecams.com/ URLs (canonical, hreflang,
+language switcher). Every href, src and srcset of every page, English and
+each language mirror, is extracted on the page_batch pool, resolved to a
+site file and checked against one listing of the tree:
+
+    dangling      links to a file that doesn't exist, grouped by target
+    orphan pages  pages no other page links to (the home pages of each
+                  language are entry points, not orphans)
+
+plus the inbound-link counts per page: how many other pages link to it.
+Links built at runtime by page scripts ('cameras/' + slug + '.html') and
+third-party URLs are skipped.
+
+Usage:
+    python3 check_links.py
+    python3 check_links.py --jobs 0 --top 30
+    python3 check_links.py --graph links.json   # write the full graph
+    python3 check_links.py --strict             # exit 1 on dangling links or orphans
+"""
+
+import os
+import re
+import sys
+import html
+import json
+import time
+import argparse
+import posixpath
+from collections import Counter, defaultdict
+from functools import partial
+from urllib.parse import unquote, urlsplit
+
+from page_batch import add_jobs_argument, run_pages
+from site_locales import find_pages, mirror_locales
+
+# URLs that point back into this site
+SITE_URLS = ('https://sakuralivecams.com', 'https://www.sakuralivecams.com', 'http://sakuralivecams.com')
+
+LINK_PATTERN = re.compile(r'\b(?:href|src)\s*=\s*"([^"]*)"|\bsrcset\s*=\s*"([^"]*)"', re.IGNORECASE)
+SKIPPED_SCHEMES = ('#', 'mailto:', 'tel:', 'javascript:', 'data:', 'sms:')
+# Pieces of a URL assembled by a page script rather than written out
+DYNAMIC_MARKERS = ("'", '${', '{{', '+')
+
+# Printed detail lines per check unless --verbose
+DETAIL_LIMIT = 10
+TOP_PAGES = 15
+
+
+def entry_pages(root):
+    """Pages reached from outside the site: the home page of each language."""
+    return {'index.html'} | {f'{lang}/index.html' for lang in mirror_locales(root)}
+
+
+def site_files(root):
+    """Every file and directory under the site root, as site-relative paths."""
+    files, directories = set(), set()
+    for current, dirs, names in os.walk(root):
+        dirs[:] = [d for d in dirs if not d.startswith(('.', '__'))]
+        relative = os.path.relpath(current, root).replace(os.sep, '/')
+        prefix = '' if relative == '.' else f'{relative}/'
+        directories.update(f'{prefix}{d}' for d in dirs)
+        files.update(f'{prefix}{name}' for name in names)
+    return files, directories
+
+
+def resolve(url, page):
+    """Site-relative path a link on page points to, or None for links outside the site."""
+    url = html.unescape(url).strip()
+    if not url or url.startswith(SKIPPED_SCHEMES) or any(marker in url for marker in DYNAMIC_MARKERS):
+        return None
+    for site_url in SITE_URLS:
+        if url == site_url or url.startswith((f'{site_url}/', f'{site_url}?', f'{site_url}#')):
+            url = '/' + url[len(site_url):].lstrip('/')
+            break
+    else:
+        if url.startswith('//') or re.match(r'^[a-z][a-z0-9+.-]*:', url, re.IGNORECASE):
+            return None
+
+    path = unquote(urlsplit(url).path)
+    if not path:
+        return page
+    if path.startswith('/'):
+        target = posixpath.normpath(path.lstrip('/') or '.')
+    else:
+        target = posixpath.normpath(posixpath.join(posixpath.dirname(page), path))
+    if target == '.':
+        return 'index.html'
+    if path.endswith('/'):
+        return f'{target}/index.html'
+    return target
+
+
+def scan_page(path, root):
+    """Resolve every link on one page; returns (page, [(url, target)]) for links inside the site."""
+    page = os.path.relpath(path, root).replace(os.sep, '/')
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    links = []
+    for match in LINK_PATTERN.finditer(content):
+        if match.group(1) is not None:
+            urls = [match.group(1)]
+        else:
+            urls = [candidate.split()[0] for candidate in match.group(2).split(',') if candidate.strip()]
+        for url in urls:
+            target = resolve(url, page)
+            if target is not None:
+                links.append((url, target))
+    return page, links
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the link graph of the site and report broken links.')
+    parser.add_argument('--root', default='.', help='site root (default: current directory)')
+    parser.add_argument('--top', type=int, default=TOP_PAGES, help=f'most-linked pages to list (default: {TOP_PAGES})')
+    parser.add_argument('--graph', metavar='OUTPUT', help='write every page with its inbound count and outbound links as JSON')
+    parser.add_argument('--verbose', action='store_true', help='list every finding, not just the first few')
+    parser.add_argument('--strict', action='store_true', help='exit with status 1 on dangling links or orphan pages')
+    add_jobs_argument(parser)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    files, directories = site_files(args.root)
+    paths = find_pages(args.root)
+    print(f"🔗 Scanning {len(paths)} pages for links...")
+
+    outbound = {}
+    inbound = Counter()
+    dangling = defaultdict(list)
+    link_count = 0
+    for result in run_pages(partial(scan_page, root=args.root), paths, jobs=args.jobs):
+        print(result.output, end='')
+        if result.error:
+            print(f"  ❌ {os.path.relpath(result.path, args.root)}: {result.error}")
+            continue
+        page, links = result.value
+        link_count += len(links)
+        targets = set()
+        for url, target in links:
+            if target in directories:
+                target = f'{target}/index.html'
+            elif target not in files and f'{target}.html' in files:
+                # The host serves /name for name.html
+                target = f'{target}.html'
+            if target not in files:
+                dangling[target].append((page, url))
+            elif target != page:
+                targets.add(target)
+        outbound[page] = sorted(targets)
+        inbound.update(target for target in targets if target.endswith('.html'))
+    elapsed = time.perf_counter() - started
+
+    report = {}
+    report['Dangling links'] = [
+        f"{target} <- {len(sources)} link(s) on {len({page for page, _ in sources})} page(s), e.g. {sources[0][0]} ({sources[0][1]})"
+        for target, sources in sorted(dangling.items(), key=lambda item: (-len(item[1]), item[0]))
+    ]
+    entries = entry_pages(args.root)
+    report['Orphan pages'] = sorted(page for page in outbound if not inbound[page] and page not in entries)
+
+    for check, details in report.items():
+        if not details:
+            continue
+        print(f"\n⚠️  {check} ({len(details)}):")
+        shown = details if args.verbose else details[:DETAIL_LIMIT]
+        for line in shown:
+            print(f"  • {line}")
+        if len(shown) < len(details):
+            print(f"  ... {len(details) - len(shown)} more (--verbose to list all)")
+
+    if args.top:
+        print(f"\n📥 Most linked pages (linking pages)")
+        for page, count in inbound.most_common(args.top):
+            print(f"  {count:>6,}  {page}")
+
+    if args.graph:
+        graph = {page: {'inbound': inbound[page], 'links': links} for page, links in sorted(outbound.items())}
+        with open(args.graph, 'w', encoding='utf-8') as f:
+            json.dump(graph, f, ensure_ascii=False, indent=1)
+            f.write('\n')
+        print(f"\n✅ Wrote {args.graph}")
+
+    print(f"\n{'='*60}")
+    print("Summary:")
+    print(f"  🔗 {len(outbound)} pages, {link_count:,} links inside the site, scanned in {elapsed:.2f}s")
+    print(f"  {'⚠️ ' if dangling else '✅'} Dangling links: {sum(len(sources) for sources in dangling.values())} "
+          f"to {len(dangling)} missing targets")
+    print(f"  {'⚠️ ' if report['Orphan pages'] else '✅'} Orphan pages: {len(report['Orphan pages'])}")
+    print(f"{'='*60}")
+
+    if args.strict and any(report.values()):
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
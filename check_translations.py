@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Report how well translations/*.json covers what the i18n generator reads.
+
+The page translators in generate_i18n_pages.py read their strings with
+t.get(...).get(..., default), so a key missing from a locale silently falls
+back to English (or to the generator's default when en.json lacks it too)
+and a page ships half-translated. This runs the translators over every
+English page for every locale, without writing anything, through a dict that
+records each key looked up, and compares those reads with each translation
+file flattened to dotted keys:
+
+    missing       keys the generator reads that the file doesn't have
+    unused        keys in the file the generator never reads
+    placeholders  values whose {city}/{camera}/... placeholders differ from
+                  en.json's, so a substitution is lost or left in the page
+    errors        pages a translator failed on
+
+It also lists the hot keys: how many lookups each key gets across the
+generated site and on how many pages, i.e. which strings are worth getting
+right first. The English pages are read once and every locale is a
+single in-memory pass, so the whole report takes well under a second.
+
+Usage:
+    python3 check_translations.py
+    python3 check_translations.py --top 30 --verbose
+    python3 check_translations.py --strict     # exit 1 if any problem is found
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+from collections import Counter
+
+from generate_i18n_pages import load_translations, source_paths, source_page, translate_page
+from site_locales import SOURCE_LANG, TRANSLATIONS_DIR, mirror_locales
+
+PLACEHOLDER_PATTERN = re.compile(r'\{(\w+)\}')
+
+# Read outside the page translators (language switcher labels), so never
+# reported as unused
+EXTERNAL_KEYS = ('meta.',)
+
+# Printed detail lines per check unless --verbose
+DETAIL_LIMIT = 10
+HOT_KEYS = 15
+
+
+class KeyRecorder(dict):
+    """Translations dict that counts every leaf key looked up through it.
+
+    Sections come back wrapped too, including a missing section's {}
+    default, so t.get('seo', {}).get('city_title') records seo.city_title.
+    """
+
+    def __init__(self, data, counts, prefix=''):
+        super().__init__(data)
+        self._counts = counts
+        self._prefix = prefix
+
+    def _record(self, key, value):
+        path = f'{self._prefix}{key}'
+        if isinstance(value, dict):
+            return KeyRecorder(value, self._counts, f'{path}.')
+        self._counts[path] += 1
+        return value
+
+    def __getitem__(self, key):
+        if key not in self:
+            self._counts[f'{self._prefix}{key}'] += 1
+        return self._record(key, super().__getitem__(key))
+
+    def get(self, key, default=None):
+        return self._record(key, super().get(key, default))
+
+
+def flatten(data, prefix=''):
+    """Map dotted key -> value for the leaves of a translation file; lists are leaves."""
+    flat = {}
+    for key, value in data.items():
+        if isinstance(value, dict):
+            flat.update(flatten(value, f'{prefix}{key}.'))
+        else:
+            flat[f'{prefix}{key}'] = value
+    return flat
+
+
+def placeholders(value):
+    """The {name} placeholders in a string or list of strings."""
+    values = value if isinstance(value, list) else [value]
+    return {name for item in values if isinstance(item, str) for name in PLACEHOLDER_PATTERN.findall(item)}
+
+
+def load_flat(translations_dir, lang):
+    """A translation file as read from disk (no English fallback), flattened."""
+    with open(os.path.join(translations_dir, f'{lang}.json'), 'r', encoding='utf-8') as f:
+        return flatten(json.load(f))
+
+
+def read_sources(root):
+    """Every English page the generator mirrors, read once."""
+    sources = []
+    for kind, path in source_paths(root):
+        with open(os.path.join(root, path), 'r', encoding='utf-8') as f:
+            sources.append(source_page(kind, path, f.read()))
+    return sources
+
+
+def record_reads(sources, translations):
+    """Translate every page; returns ({key: lookups}, {key: pages}, [errors])."""
+    lookups, pages, errors = Counter(), Counter(), []
+    for page in sources:
+        counts = Counter()
+        try:
+            translate_page(page, KeyRecorder(translations, counts))
+        except Exception as e:
+            errors.append(f"{page.path}: {type(e).__name__}: {e}")
+        lookups.update(counts)
+        pages.update(counts.keys())
+    return lookups, pages, errors
+
+
+def check_translations(root, locales):
+    """Run every check; returns ({check name: [detail lines]}, lookups, pages, source count)."""
+    translations_dir = os.path.join(root, TRANSLATIONS_DIR)
+    sources = read_sources(root)
+    files = {lang: load_flat(translations_dir, lang) for lang in [SOURCE_LANG] + locales}
+    reference = files[SOURCE_LANG]
+
+    lookups, pages = Counter(), Counter()
+    reads, report = {}, {}
+    for lang in locales:
+        locale_lookups, locale_pages, errors = record_reads(sources, load_translations(lang, translations_dir))
+        lookups.update(locale_lookups)
+        pages.update(locale_pages)
+        reads[lang] = set(locale_lookups)
+        if errors:
+            report[f'Errors building {lang}'] = errors
+
+    # English pages are the sources, so en.json is only ever a fallback
+    all_reads = set().union(*reads.values())
+    for lang, flat in files.items():
+        name = f'{lang}.json'
+        if lang != SOURCE_LANG:
+            report[f'Missing in {name}'] = [
+                f"{key} (falls back to {'English' if key in reference else 'the generator default'})"
+                for key in sorted(reads[lang] - set(flat))
+            ]
+        report[f'Unused in {name}'] = [
+            key for key in sorted(set(flat) - all_reads) if not key.startswith(EXTERNAL_KEYS)
+        ]
+        if lang == SOURCE_LANG:
+            continue
+        mismatches = []
+        for key, value in flat.items():
+            if key not in reference:
+                continue
+            expected, found = placeholders(reference[key]), placeholders(value)
+            if expected != found:
+                lost = ', '.join(f'{{{p}}}' for p in sorted(expected - found))
+                extra = ', '.join(f'{{{p}}}' for p in sorted(found - expected))
+                mismatches.append(f"{key}: " + '; '.join(filter(None, [lost and f'lacks {lost}', extra and f'adds {extra}'])))
+        report[f'Placeholder mismatches in {name}'] = mismatches
+
+    return report, lookups, pages, len(sources)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Report missing, unused and mismatched translation keys.')
+    parser.add_argument('--root', default='.', help='site root (default: current directory)')
+    parser.add_argument('--top', type=int, default=HOT_KEYS, help=f'hot keys to list (default: {HOT_KEYS})')
+    parser.add_argument('--verbose', action='store_true', help='list every finding, not just the first few')
+    parser.add_argument('--strict', action='store_true', help='exit with status 1 if any check finds problems')
+    args = parser.parse_args()
+
+    locales = mirror_locales(args.root)
+    print(f"🔍 Checking {TRANSLATIONS_DIR}/ ({', '.join([SOURCE_LANG] + locales)}) against the i18n generator...")
+    started = time.perf_counter()
+    report, lookups, pages, source_count = check_translations(args.root, locales)
+    elapsed = time.perf_counter() - started
+
+    for check, details in report.items():
+        if not details:
+            continue
+        print(f"\n⚠️  {check} ({len(details)}):")
+        shown = details if args.verbose else details[:DETAIL_LIMIT]
+        for line in shown:
+            print(f"  • {line}")
+        if len(shown) < len(details):
+            print(f"  ... {len(details) - len(shown)} more (--verbose to list all)")
+
+    if args.top:
+        print(f"\n🔥 Hot keys ({len(locales)} locale(s) x {source_count} pages)")
+        print(f"  {'Lookups':>8} {'Pages':>6}  Key")
+        for key, count in lookups.most_common(args.top):
+            print(f"  {count:>8,} {pages[key]:>6,}  {key}")
+
+    print(f"\n{'='*60}")
+    print("Summary:")
+    print(f"  🔑 {len(lookups)} keys read, {sum(lookups.values()):,} lookups in {elapsed:.2f}s")
+    for check, details in report.items():
+        print(f"  {'⚠️ ' if details else '✅'} {check}: {len(details)}")
+    print(f"{'='*60}")
+
+    if args.strict and any(report.values()):
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Write pre-compressed .gz and .br siblings for the generated site files.
+
+Every HTML, JSON, XML, JS and CSS file under the site root gets a gzip
+(level 9) and, when the brotli module is installed, a brotli (quality 11)
+copy next to it, so the CDN can serve them without compressing on the fly.
+Files under MIN_SIZE and directories the site doesn't serve (translations/)
+are left alone, and a copy is only kept when it is smaller than the file;
+otherwise the CDN serves the original. Outputs are
+byte-stable (gzip mtime is zeroed), and .compress-manifest.json remembers
+the content hash each pair was built from, so a rerun only recompresses
+files whose content changed. Siblings whose source page is gone are
+removed, as are those of files that are now skipped; only files this
+script created are ever deleted. The sitemap files
+are skipped: build_sitemap.py --gzip writes (and removes) their .gz copies.
+
+Ends with the transfer size per directory so compression can be tracked
+over time.
+
+Usage:
+    python3 compress_site.py                # compress the whole site
+    python3 compress_site.py --jobs 0       # one worker per CPU
+    python3 compress_site.py --force        # recompress everything
+"""
+
+import os
+import re
+import gzip
+import argparse
+from functools import partial
+from pathlib import Path
+
+from build_manifest import BuildManifest, content_hash
+from page_batch import add_jobs_argument, run_pages
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+MANIFEST_NAME = '.compress-manifest.json'
+# Bump when compression settings change so everything is recompressed
+COMPRESS_VERSION = '1'
+
+COMPRESSIBLE_EXTENSIONS = ('.html', '.json', '.xml', '.js', '.css')
+# Smaller files gain nothing once headers and the compression framing are counted
+MIN_SIZE = 1024
+# Build inputs and caches under the site root that are never served
+EXCLUDED_DIRS = ('translations', '__pycache__')
+# Compressed by build_sitemap.py --gzip
+SITEMAP_PATTERN = re.compile(r'sitemap(-\d+|_index)?\.xml')
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+
+def available_formats():
+    """Compressed formats this run can write ('gz' always, 'br' if brotli is installed)."""
+    return ('gz', 'br') if brotli is not None else ('gz',)
+
+
+def compress(data, fmt):
+    """Compress bytes into one format, deterministically."""
+    if fmt == 'gz':
+        return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+    return brotli.compress(data, quality=BROTLI_QUALITY)
+
+
+def find_sources(root):
+    """Site-relative paths of every compressible file of at least MIN_SIZE bytes.
+
+    Dot directories, EXCLUDED_DIRS and the sitemaps are skipped.
+    """
+    sources = []
+    for directory, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith('.') and d not in EXCLUDED_DIRS)
+        for filename in sorted(filenames):
+            if filename.startswith('.') or SITEMAP_PATTERN.fullmatch(filename):
+                continue
+            path = os.path.join(directory, filename)
+            if filename.endswith(COMPRESSIBLE_EXTENSIONS) and os.path.getsize(path) >= MIN_SIZE:
+                sources.append(os.path.relpath(path, root))
+    return sources
+
+
+def compress_file(path, formats):
+    """Write the compressed siblings of one file; returns {format: compressed size}.
+
+    Formats that don't come out smaller than the file are left out of the
+    result, and an older sibling in that format is removed.
+    """
+    data = Path(path).read_bytes()
+    sizes = {}
+    for fmt in formats:
+        compressed = compress(data, fmt)
+        target = Path(f'{path}.{fmt}')
+        if len(compressed) >= len(data):
+            if target.exists():
+                target.unlink()
+            continue
+        try:
+            unchanged = target.read_bytes() == compressed
+        except FileNotFoundError:
+            unchanged = False
+        if not unchanged:
+            target.write_bytes(compressed)
+        sizes[fmt] = len(compressed)
+    return sizes
+
+
+def remove_orphans(root, manifest, sources):
+    """Delete siblings recorded in the manifest whose source is gone or now skipped."""
+    removed = []
+    sources = {Path(source).as_posix() for source in sources}
+    for name in sorted(manifest.entries):
+        source, _, fmt = name.rpartition('.')
+        if source in sources:
+            continue
+        path = os.path.join(root, name)
+        # A sitemap .gz left from before they were skipped is build_sitemap.py's now
+        owned_elsewhere = fmt == 'gz' and SITEMAP_PATTERN.fullmatch(os.path.basename(source))
+        if os.path.exists(path) and not owned_elsewhere:
+            os.remove(path)
+            removed.append(name)
+        del manifest.entries[name]
+    return removed
+
+
+def print_ratio_report(stats, formats):
+    """Print raw and compressed bytes per directory."""
+    header = f"  {'Directory':<24} {'Files':>6} {'Raw':>12}"
+    for fmt in formats:
+        header += f" {'.' + fmt:>12} {'ratio':>6}"
+    print(header)
+
+    totals = [0, 0] + [0] * len(formats)
+    for directory in sorted(stats):
+        row = stats[directory]
+        totals = [total + value for total, value in zip(totals, row)]
+        print(format_ratio_row(directory, row, formats))
+    print(format_ratio_row('Total', totals, formats))
+
+
+def format_ratio_row(label, row, formats):
+    files, raw, *compressed = row
+    line = f"  {label:<24} {files:>6} {raw:>12,}"
+    for size in compressed:
+        line += f" {size:>12,} {(size / raw if raw else 0):>6.1%}"
+    return line
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Write .gz/.br siblings for the site HTML, JSON, XML, JS and CSS.')
+    parser.add_argument('--root', default='.', help='site root to compress (default: current directory)')
+    parser.add_argument('--force', action='store_true', help='recompress every file')
+    add_jobs_argument(parser)
+    args = parser.parse_args()
+
+    formats = available_formats()
+    if brotli is None:
+        print("⚠️  brotli module not installed; writing .gz only (pip install brotli for .br)")
+
+    manifest = BuildManifest(os.path.join(args.root, MANIFEST_NAME), f'{COMPRESS_VERSION}:{",".join(formats)}')
+    if args.force:
+        manifest.entries = {}
+
+    sources = find_sources(args.root)
+    print(f"🗜️  Compressing {len(sources)} files as {', '.join('.' + fmt for fmt in formats)}...")
+
+    # Hash every file up front; only stale ones go to the pool
+    keys = {}
+    stale = []
+    for source in sources:
+        path = os.path.join(args.root, source)
+        keys[source] = content_hash(Path(path).read_bytes())
+        if not all(manifest.is_current(f'{path}.{fmt}', keys[source]) for fmt in formats):
+            stale.append(path)
+
+    compressed_count = failed_count = 0
+    for result in run_pages(partial(compress_file, formats=formats), stale, jobs=args.jobs):
+        print(result.output, end='')
+        if result.error:
+            print(f"  ❌ {os.path.relpath(result.path, args.root)}: {result.error}")
+            failed_count += 1
+            continue
+        compressed_count += 1
+        source = os.path.relpath(result.path, args.root)
+        for fmt in formats:
+            if fmt in result.value:
+                manifest.record(f'{result.path}.{fmt}', keys[source])
+            else:
+                manifest.entries.pop(Path(f'{source}.{fmt}').as_posix(), None)
+
+    removed = remove_orphans(args.root, manifest, sources)
+    for name in removed:
+        print(f"  🗑️  Removed {name} (source is gone or no longer compressed)")
+    manifest.save()
+
+    # files, raw bytes, then bytes served per format (the file itself where
+    # no smaller sibling was kept)
+    stats = {}
+    for source in sources:
+        path = os.path.join(args.root, source)
+        size = os.path.getsize(path)
+        row = stats.setdefault(os.path.dirname(source) or '.', [0, 0] + [0] * len(formats))
+        row[0] += 1
+        row[1] += size
+        for i, fmt in enumerate(formats):
+            sibling = f'{path}.{fmt}'
+            row[2 + i] += os.path.getsize(sibling) if os.path.exists(sibling) else size
+
+    print(f"\n{'='*60}")
+    print("Summary:")
+    print(f"  ✅ Compressed: {compressed_count}")
+    print(f"  ⏭️  Unchanged: {len(sources) - len(stale)}")
+    if removed:
+        print(f"  🗑️  Removed: {len(removed)}")
+    if failed_count:
+        print(f"  ❌ Failed: {failed_count}")
+    print(f"{'='*60}")
+    print("\nTransfer size by directory:")
+    print_ratio_report(stats, formats)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Hoist inline <script> and <style> blocks repeated across pages into shared,
+content-hashed files.
+
+Every camera and city page carries the same GTM/gtag snippets, page CSS and
+updateTime()/copyright script inline, so each page download repeats them.
+This finds blocks that are byte-identical on at least MIN_PAGES pages,
+writes each once to assets/shared/ under a content-hashed name (so it can be
+cached forever), and replaces the inline copies with
+
+    <script src="/assets/shared/script-<hash>.js" defer></script>
+    <link rel="stylesheet" href="/assets/shared/style-<hash>.css">
+
+A hoisted script runs after parsing instead of in place, so a script only
+qualifies if it is plain JavaScript without document.write and nothing left
+inline (other scripts, on* handlers) uses a name it declares. Styles keep
+their position, so the cascade is unchanged. JSON-LD, src scripts and small
+blocks (under MIN_BYTES) stay inline.
+
+Like minify_site.py this rewrites pages in place and the maintenance
+scripts expect the inline blocks, so run it on the deploy copy:
+extract_shared_assets.py, then minify_site.py, then compress_site.py.
+Shared files no page references any more are removed, so reruns are safe.
+
+Usage:
+    python3 extract_shared_assets.py --dry-run
+    python3 extract_shared_assets.py --root _deploy
+"""
+
+import os
+import re
+import argparse
+import textwrap
+from collections import namedtuple
+
+from build_manifest import content_hash, write_if_changed
+from site_locales import find_pages
+
+SHARED_DIR = 'assets/shared'
+SHARED_URL = '/assets/shared'
+
+# Only blocks shared by this many pages and at least this big are worth a request
+MIN_PAGES = 3
+MIN_BYTES = 128
+
+INLINE_BLOCK_PATTERN = re.compile(r'<(script|style)\b([^>]*)>(.*?)</\1\s*>', re.DOTALL | re.IGNORECASE)
+SCRIPT_TYPE_PATTERN = re.compile(r'^\s*(type=["\'](text/javascript|application/javascript)["\'])?\s*$', re.IGNORECASE)
+STYLE_ATTRS_PATTERN = re.compile(r'^\s*(media=["\'][^"\']*["\'])?\s*$', re.IGNORECASE)
+DECLARED_NAME_PATTERN = re.compile(r'\b(?:function|var|let|const|class)\s+([A-Za-z_$][\w$]*)')
+JS_LITERAL_PATTERN = re.compile(r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'|`(?:\\.|[^`\\])*`|//[^\n]*|/\*.*?\*/', re.DOTALL)
+HANDLER_PATTERN = re.compile(r'\son[a-z]+=(["\'])(.*?)\1', re.DOTALL | re.IGNORECASE)
+SHARED_REF_PATTERN = re.compile(re.escape(SHARED_URL) + r'/((?:script|style)-[0-9a-f]+\.(?:js|css))')
+
+# One hoistable block: the inline markup it replaces and the shared file
+SharedAsset = namedtuple('SharedAsset', 'kind attrs body filename pages')
+
+
+def inline_blocks(content):
+    """(kind, attrs, body) for every inline script/style block in a page."""
+    return [(kind.lower(), attrs, body) for kind, attrs, body in INLINE_BLOCK_PATTERN.findall(content)]
+
+
+def hoistable(kind, attrs, body):
+    """Whether a block may move to an external file at all."""
+    if len(body.encode('utf-8')) < MIN_BYTES:
+        return False
+    if kind == 'style':
+        return bool(STYLE_ATTRS_PATTERN.match(attrs))
+    return bool(SCRIPT_TYPE_PATTERN.match(attrs)) and 'document.write' not in body
+
+
+def shared_filename(kind, body):
+    """Content-hashed file name and content for a block."""
+    content = textwrap.dedent(body.strip('\n')).strip() + '\n'
+    ext = 'js' if kind == 'script' else 'css'
+    return f'{kind}-{content_hash(content)[:12]}.{ext}', content
+
+
+def global_names(script):
+    """Names a script declares at its top level (what other scripts could use)."""
+    code = JS_LITERAL_PATTERN.sub('""', script)
+    names = set()
+    depth = position = 0
+    for match in DECLARED_NAME_PATTERN.finditer(code):
+        segment = code[position:match.start()]
+        depth += segment.count('{') - segment.count('}')
+        position = match.start()
+        if depth == 0:
+            names.add(match.group(1))
+    return names
+
+
+def find_shared_assets(pages):
+    """Blocks identical on MIN_PAGES or more pages that are safe to hoist."""
+    counts = {}
+    inline_code = {}
+    for path in pages:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        for block in inline_blocks(content):
+            counts.setdefault(block, set()).add(path)
+            if block[0] == 'script':
+                inline_code.setdefault(block, block[2])
+        for _, handler in HANDLER_PATTERN.findall(content):
+            inline_code.setdefault(('handler', '', handler), handler)
+
+    candidates = {block: paths for block, paths in counts.items()
+                  if len(paths) >= MIN_PAGES and hoistable(*block)}
+
+    # A deferred script can't define names that code staying inline relies on
+    staying = [code for block, code in inline_code.items() if block not in candidates]
+    assets = []
+    for (kind, attrs, body), paths in candidates.items():
+        if kind == 'script':
+            names = global_names(body)
+            if any(re.search(rf'(?<![\w$.]){re.escape(name)}\b', code) for name in names for code in staying):
+                continue
+        filename, _ = shared_filename(kind, body)
+        assets.append(SharedAsset(kind, attrs, body, filename, len(paths)))
+    return assets
+
+
+def replacement_tag(asset):
+    """External reference that stands in for an inline block."""
+    if asset.kind == 'script':
+        return f'<script src="{SHARED_URL}/{asset.filename}" defer></script>'
+    media = f' {asset.attrs.strip()}' if asset.attrs.strip() else ''
+    return f'<link rel="stylesheet" href="{SHARED_URL}/{asset.filename}"{media}>'
+
+
+def hoist_page(path, assets, dry_run=False):
+    """Replace a page's shared inline blocks; returns (bytes before, bytes after)."""
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    by_block = {(asset.kind, asset.attrs, asset.body): asset for asset in assets}
+
+    def replace(match):
+        asset = by_block.get((match.group(1).lower(), match.group(2), match.group(3)))
+        return replacement_tag(asset) if asset else match.group(0)
+
+    updated = INLINE_BLOCK_PATTERN.sub(replace, content)
+    if not dry_run:
+        write_if_changed(path, updated)
+    return len(content.encode('utf-8')), len(updated.encode('utf-8'))
+
+
+def remove_unreferenced(shared_dir, pages):
+    """Delete shared files no page links to any more; returns their names."""
+    if not os.path.isdir(shared_dir):
+        return []
+    referenced = set()
+    for path in pages:
+        with open(path, 'r', encoding='utf-8') as f:
+            referenced.update(SHARED_REF_PATTERN.findall(f.read()))
+    removed = sorted(name for name in os.listdir(shared_dir) if name not in referenced)
+    for name in removed:
+        os.remove(os.path.join(shared_dir, name))
+    return removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Hoist repeated inline scripts and styles into shared files.')
+    parser.add_argument('--root', default='.', help='site root to rewrite in place (default: current directory)')
+    parser.add_argument('--dry-run', action='store_true', help='report what would be hoisted without writing files')
+    args = parser.parse_args()
+
+    pages = find_pages(args.root)
+    print(f"📦 Looking for shared inline blocks in {len(pages)} pages...")
+    assets = find_shared_assets(pages)
+    if not assets:
+        print("⏭️  No repeated inline blocks to hoist")
+
+    shared_dir = os.path.join(args.root, SHARED_DIR)
+    for asset in assets:
+        print(f"  ✅ {asset.kind:<6} {len(asset.body.encode('utf-8')):>6,} bytes on {asset.pages:>3} pages -> {SHARED_DIR}/{asset.filename}")
+        if not args.dry_run:
+            os.makedirs(shared_dir, exist_ok=True)
+            write_if_changed(os.path.join(shared_dir, asset.filename), shared_filename(asset.kind, asset.body)[1])
+
+    before_total = after_total = changed_count = 0
+    for path in pages:
+        before, after = hoist_page(path, assets, args.dry_run)
+        before_total += before
+        after_total += after
+        changed_count += before != after
+
+    removed = [] if args.dry_run else remove_unreferenced(shared_dir, pages)
+    for name in removed:
+        print(f"  🗑️  Removed {SHARED_DIR}/{name} (no longer referenced)")
+
+    shared_bytes = sum(len(shared_filename(a.kind, a.body)[1].encode('utf-8')) for a in assets)
+    print(f"\n{'='*60}")
+    print(f"Summary{' (dry run)' if args.dry_run else ''}:")
+    print(f"  ✅ Shared files: {len(assets)} ({shared_bytes:,} bytes, cached once)")
+    print(f"  📝 Pages rewritten: {changed_count}")
+    print(f"  📉 HTML: {before_total:,} -> {after_total:,} bytes "
+          f"({(1 - after_total / before_total) if before_total else 0:.1%} smaller)")
+    print(f"{'='*60}")
+
+if __name__ == '__main__':
+    main()
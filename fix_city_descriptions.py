@@ -3,6 +3,8 @@ import os
 import re
 import glob
 
+from build_manifest import stable_index
+
 # Unique city descriptions - SEO optimized, city-specific
 CITY_DESCRIPTIONS = {
     'tokyo': {
@@ -80,7 +82,7 @@ def get_city_description(city_name):
         return CITY_DESCRIPTIONS[city_key]
 
     # Use hash of city name to consistently select same template for each city
-    template_index = hash(city_key) % len(GENERIC_TEMPLATES)
+    template_index = stable_index(city_key, len(GENERIC_TEMPLATES))
     template = GENERIC_TEMPLATES[template_index]
 
     return {
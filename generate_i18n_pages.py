@@ -2,162 +2,247 @@
 """
 Internationalization (i18n) Page Generator for SakuraLiveCams
 
-This script generates Japanese versions of all HTML pages by:
-1. Creating a /ja/ directory structure mirroring the English pages
-2. Translating UI text using translation JSON files
-3. Adding hreflang tags for SEO
+This script generates a translated mirror of all HTML pages for every
+translations/<lang>.json other than English by:
+1. Creating a /<lang>/ directory structure mirroring the English pages
+2. Translating UI text using the locale's translation JSON file
+3. Adding hreflang tags and a language switcher listing every locale
 4. Updating internal links to point to correct language versions
+
+The English sources are read (and their hreflang/switcher refreshed) once,
+then the pages of every locale are built from that shared copy in chunks
+spread over the --jobs workers, so an extra language costs about one more
+core rather than another full pass, and a single language still uses them
+all.
 """
 
 import os
 import re
 import json
-import shutil
+import argparse
+import time
+import cProfile
+import pstats
+from collections import namedtuple
+from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
-from html import escape
+
+from translation_rules import RuleSet, RuleProfile, set_profile
+from build_manifest import BuildManifest, content_hash, write_if_changed
+from page_batch import add_jobs_argument, resolve_jobs, run_pages
+from page_templates import PageTemplate
+from structured_data import edit_json_ld
+from site_locales import SOURCE_LANG, TRANSLATIONS_DIR as TRANSLATIONS_DIR_NAME, mirror_locales
 
 # Configuration
 BASE_DIR = Path('/home/user/sakuralivecams')
-TRANSLATIONS_DIR = BASE_DIR / 'translations'
-JA_DIR = BASE_DIR / 'ja'
-
-def load_translations(lang):
-    """Load translations for a given language."""
-    file_path = TRANSLATIONS_DIR / f'{lang}.json'
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
-
-def get_hreflang_tags(page_path, is_japanese=False):
-    """Generate hreflang tags for a page."""
+TRANSLATIONS_DIR = BASE_DIR / TRANSLATIONS_DIR_NAME
+MANIFEST_PATH = BASE_DIR / '.i18n-manifest.json'
+PROFILE_PATH = 'i18n-profile.pstats'
+BASE_URL = 'https://sakuralivecams.com'
+
+# Bump whenever the translation or page rewriting logic changes so every
+# page is rebuilt on the next run.
+GENERATOR_VERSION = '3'
+
+# Top-level translation sections each page type reads. A page is rebuilt
+# when its source or one of these sections changes.
+INDEX_SECTIONS = ('header', 'nav', 'hero', 'stats', 'cities_section', 'city_cards',
+                  'filters', 'why_watch', 'about', 'faq', 'footer')
+CITY_SECTIONS = ('header', 'nav', 'seo', 'city_names', 'city_descriptions', 'city_page',
+                 'city_pro_tip', 'city_about_content', 'city_places', 'explore_other_cities')
+CAMERA_SECTIONS = ('header', 'nav', 'seo', 'city_names', 'camera_page', 'common')
+PAGE_SECTIONS = {'index': INDEX_SECTIONS, 'city': CITY_SECTIONS, 'camera': CAMERA_SECTIONS, 'utility': ()}
+
+UTILITY_PAGES = ['contact.html', 'privacy.html', 'terms.html']
+
+# --profile phase each page kind's build time is reported under
+KIND_PHASES = {'index': 'index', 'city': 'cities', 'camera': 'cameras', 'utility': 'utility pages'}
+
+# One English page, read once and shared by every locale build. name is the
+# city or camera name the translations are keyed on, city the camera's city.
+SourcePage = namedtuple('SourcePage', 'kind path content name city')
+
+# Camera page strings with {camera} in them, as (field, section, key)
+CAMERA_TEMPLATE_KEYS = (
+    ('title', 'seo', 'camera_title'),
+    ('meta_desc', 'seo', 'camera_meta_description'),
+    ('og_title', 'seo', 'camera_og_title'),
+    ('og_desc', 'seo', 'camera_og_description'),
+    ('schema_name', 'seo', 'camera_schema_name'),
+    ('schema_desc', 'seo', 'camera_schema_description'),
+    ('keywords', 'seo', 'camera_keywords'),
+    ('intro', 'camera_page', 'description_intro'),
+    ('stream', 'camera_page', 'description_stream'),
+    ('special_text', 'camera_page', 'what_makes_special_text'),
+    ('optimal_text', 'camera_page', 'optimal_viewing_text'),
+)
+CameraTemplates = namedtuple('CameraTemplates', [field for field, _, _ in CAMERA_TEMPLATE_KEYS])
+CAMERA_SLOT_PATTERN = re.compile(r'\{(?P<named>camera)\}')
+
+# Everything a camera page needs from its city's translations, resolved once
+# per city and locale: {city} is already filled in, so each page only renders
+# its camera name into the templates.
+CityContext = namedtuple('CityContext', 'slug name local_name city_in_japan more_from_city view_all templates')
+
+def merge_translations(base, overrides):
+    """Deep-merge a locale's translations over the English ones."""
+    merged = dict(base)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge_translations(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+def load_translations(lang, translations_dir=TRANSLATIONS_DIR):
+    """Load translations for a given language, falling back to English for missing keys."""
+    translations_dir = Path(translations_dir)
+    with open(translations_dir / f'{SOURCE_LANG}.json', 'r', encoding='utf-8') as f:
+        translations = json.load(f)
+    if lang != SOURCE_LANG:
+        with open(translations_dir / f'{lang}.json', 'r', encoding='utf-8') as f:
+            translations = merge_translations(translations, json.load(f))
+    translations['meta'] = dict(translations.get('meta', {}), lang=lang)
+    return translations
+
+def switcher_labels(locales):
+    """Language switcher label per locale, source language first.
+
+    Read from each locale's own file: the merged translations would give
+    every locale without a label of its own en.json's "EN".
+    """
+    labels = {}
+    for lang in [SOURCE_LANG] + list(locales):
+        with open(TRANSLATIONS_DIR / f'{lang}.json', 'r', encoding='utf-8') as f:
+            meta = json.load(f).get('meta', {})
+        labels[lang] = meta.get('switcher_label') or meta.get('lang_native') or lang.upper()
+    return labels
+
+def translations_hash(translations, sections):
+    """Hash the translation sections a page type depends on."""
+    return content_hash({name: translations.get(name) for name in sections})
+
+def page_build_key(page_path, source_content, sections_hash=''):
+    """Build key for a generated page: generator version, source and translations."""
+    return content_hash(GENERATOR_VERSION, page_path, source_content, sections_hash)
+
+def locale_url(lang, page_path):
+    """Absolute URL of a page in one language."""
+    if lang == SOURCE_LANG:
+        return f'{BASE_URL}/{page_path}'
+    return f'{BASE_URL}/{lang}/{page_path}'
+
+def get_hreflang_tags(page_path, labels):
+    """Generate hreflang tags for a page in every locale."""
     # Normalize path
     if page_path.startswith('/'):
         page_path = page_path[1:]
 
-    base_url = 'https://sakuralivecams.com'
+    tags = [f'    <link rel="alternate" hreflang="{lang}" href="{locale_url(lang, page_path)}">' for lang in labels]
+    tags.append(f'    <link rel="alternate" hreflang="x-default" href="{locale_url(SOURCE_LANG, page_path)}">')
+    return '\n'.join(tags)
 
-    if is_japanese:
-        en_url = f'{base_url}/{page_path}'
-        ja_url = f'{base_url}/ja/{page_path}'
-    else:
-        en_url = f'{base_url}/{page_path}'
-        ja_url = f'{base_url}/ja/{page_path}'
-
-    return f'''    <link rel="alternate" hreflang="en" href="{en_url}">
-    <link rel="alternate" hreflang="ja" href="{ja_url}">
-    <link rel="alternate" hreflang="x-default" href="{en_url}">'''
-
-def get_language_switcher_html(current_lang, page_path):
+def get_language_switcher_html(current_lang, page_path, labels):
     """Generate language switcher HTML."""
-    base_url = 'https://sakuralivecams.com'
-    en_path = f'{base_url}/{page_path}'
-    ja_path = f'{base_url}/ja/{page_path}'
-
+    links = [
+        f'''<a href="{locale_url(lang, page_path)}" class="{'text-white font-semibold' if current_lang == lang else 'text-gray-400 hover:text-white'}">{label}</a>'''
+        for lang, label in labels.items()
+    ]
+    separator = '\n                    <span class="text-gray-500">|</span>\n                    '
     return f'''<div class="flex items-center gap-2 text-sm">
-                    <a href="{en_path}" class="{'text-white font-semibold' if current_lang == 'en' else 'text-gray-400 hover:text-white'}">EN</a>
-                    <span class="text-gray-500">|</span>
-                    <a href="{ja_path}" class="{'text-white font-semibold' if current_lang == 'ja' else 'text-gray-400 hover:text-white'}">日本語</a>
+                    {separator.join(links)}
                 </div>'''
 
 def translate_index_page(content, translations):
     """Translate the main index.html page."""
     t = translations
+    rules = RuleSet('index')
 
     # Change html lang attribute
-    content = re.sub(r'<html lang="en">', '<html lang="ja">', content)
+    rules.literal('<html lang="en">', f'<html lang="{t["meta"]["lang"]}">')
 
     # Translate header tagline
-    content = content.replace(
-        'Watch live webcams across Japan',
-        t['header']['tagline']
-    )
+    rules.literal('Watch live webcams across Japan', t['header']['tagline'])
 
     # Translate navigation
-    content = content.replace('>Cities</a>', f'>{t["nav"]["cities"]}</a>')
-    content = content.replace('>Cameras</a>', f'>{t["nav"]["cameras"]}</a>')
-    content = content.replace('>Contact</a>', f'>{t["nav"]["contact"]}</a>')
+    rules.literal('>Cities</a>', f'>{t["nav"]["cities"]}</a>')
+    rules.literal('>Cameras</a>', f'>{t["nav"]["cameras"]}</a>')
+    rules.literal('>Contact</a>', f'>{t["nav"]["contact"]}</a>')
 
     # Translate hero section
-    content = re.sub(
-        r'Live Japan Webcams - Watch 200\+ Real-Time HD Cameras from Tokyo, Kyoto, Osaka & Beyond',
-        t['hero']['title'],
-        content
+    rules.literal(
+        'Live Japan Webcams - Watch 200+ Real-Time HD Cameras from Tokyo, Kyoto, Osaka & Beyond',
+        t['hero']['title']
     )
-    content = re.sub(
-        r'Experience Japan live with FREE HD webcam streams from 34\+ cities\. Watch Shibuya Crossing, Mt Fuji, temples, airports, and scenic landmarks - all streaming 24/7',
-        t['hero']['subtitle'],
-        content
+    rules.literal(
+        'Experience Japan live with FREE HD webcam streams from 34+ cities. Watch Shibuya Crossing, Mt Fuji, temples, airports, and scenic landmarks - all streaming 24/7',
+        t['hero']['subtitle']
     )
 
     # Translate statistics
-    content = re.sub(r'<div class="text-gray-400">Live Cameras</div>', f'<div class="text-gray-400">{t["stats"]["cameras"]}</div>', content)
-    content = re.sub(r'<div class="text-gray-400">Cities & Regions</div>', f'<div class="text-gray-400">{t["stats"]["cities"]}</div>', content)
-    content = re.sub(r'<div class="text-gray-400">Live Streaming</div>', f'<div class="text-gray-400">{t["stats"]["streaming"]}</div>', content)
-    content = re.sub(r'<div class="text-gray-400">Free Access</div>', f'<div class="text-gray-400">{t["stats"]["free"]}</div>', content)
+    rules.literal('<div class="text-gray-400">Live Cameras</div>', f'<div class="text-gray-400">{t["stats"]["cameras"]}</div>')
+    rules.literal('<div class="text-gray-400">Cities & Regions</div>', f'<div class="text-gray-400">{t["stats"]["cities"]}</div>')
+    rules.literal('<div class="text-gray-400">Live Streaming</div>', f'<div class="text-gray-400">{t["stats"]["streaming"]}</div>')
+    rules.literal('<div class="text-gray-400">Free Access</div>', f'<div class="text-gray-400">{t["stats"]["free"]}</div>')
 
     # Translate cities section
-    content = re.sub(
-        r'Explore Japan by City',
-        t['cities_section']['title'],
-        content
+    rules.literal('Explore Japan by City', t['cities_section']['title'])
+    rules.literal(
+        'Browse our curated collection of live webcams organized by major cities and regions across Japan',
+        t['cities_section']['subtitle']
     )
-    content = re.sub(
-        r'Browse our curated collection of live webcams organized by major cities and regions across Japan',
-        t['cities_section']['subtitle'],
-        content
-    )
-    content = re.sub(r'>View All Cities</button>', f'>{t["cities_section"]["view_all"]}</button>', content)
-    content = re.sub(r'>Show Less', f'>{t["cities_section"]["show_less"]}', content)
-    content = re.sub(r'<h3 class="text-2xl font-bold text-white mb-6">All Locations</h3>',
-                     f'<h3 class="text-2xl font-bold text-white mb-6">{t["cities_section"]["all_locations"]}</h3>', content)
+    rules.literal('>View All Cities</button>', f'>{t["cities_section"]["view_all"]}</button>')
+    rules.literal('>Show Less', f'>{t["cities_section"]["show_less"]}')
+    rules.literal('<h3 class="text-2xl font-bold text-white mb-6">All Locations</h3>',
+                  f'<h3 class="text-2xl font-bold text-white mb-6">{t["cities_section"]["all_locations"]}</h3>')
 
     # Translate city cards
-    content = re.sub(r"Japan's vibrant capital with 33\+ cameras", t['city_cards']['tokyo']['description'], content)
-    content = re.sub(r"Japan's kitchen with 25\+ cameras", t['city_cards']['osaka']['description'], content)
-    content = re.sub(r"Ancient capital with 10\+ cameras", t['city_cards']['kyoto']['description'], content)
-    content = re.sub(r"Northern island with 15\+ cameras", t['city_cards']['hokkaido']['description'], content)
-    content = re.sub(r"Tropical paradise with 8\+ cameras", t['city_cards']['okinawa']['description'], content)
-    content = re.sub(r"Japan's icon with 12\+ cameras", t['city_cards']['mount_fuji']['description'], content)
+    rules.literal("Japan's vibrant capital with 33+ cameras", t['city_cards']['tokyo']['description'])
+    rules.literal("Japan's kitchen with 25+ cameras", t['city_cards']['osaka']['description'])
+    rules.literal("Ancient capital with 10+ cameras", t['city_cards']['kyoto']['description'])
+    rules.literal("Northern island with 15+ cameras", t['city_cards']['hokkaido']['description'])
+    rules.literal("Tropical paradise with 8+ cameras", t['city_cards']['okinawa']['description'])
+    rules.literal("Japan's icon with 12+ cameras", t['city_cards']['mount_fuji']['description'])
 
     # Translate filter section
-    content = re.sub(r'<h2 class="text-xl font-bold text-gray-800">Filter Streams</h2>',
-                     f'<h2 class="text-xl font-bold text-gray-800">{t["filters"]["title"]}</h2>', content)
-    content = re.sub(r'placeholder="Search tags \(e\.g\., skyline, airport\)…"',
-                     f'placeholder="{t["filters"]["search_placeholder"]}"', content)
-    content = re.sub(r'>Clear Filters</button>', f'>{t["filters"]["clear_filters"]}</button>', content)
-    content = re.sub(r'Tip: tap a tag to toggle it\. Tags on cards are clickable too\.',
-                     t['filters']['tip'], content)
+    rules.literal('<h2 class="text-xl font-bold text-gray-800">Filter Streams</h2>',
+                  f'<h2 class="text-xl font-bold text-gray-800">{t["filters"]["title"]}</h2>')
+    rules.literal('placeholder="Search tags (e.g., skyline, airport)…"',
+                  f'placeholder="{t["filters"]["search_placeholder"]}"')
+    rules.literal('>Clear Filters</button>', f'>{t["filters"]["clear_filters"]}</button>')
+    rules.literal('Tip: tap a tag to toggle it. Tags on cards are clickable too.',
+                  t['filters']['tip'])
 
     # Translate "Why Watch" section
-    content = re.sub(r'Why Watch Live Japan Webcams\?', t['why_watch']['title'], content)
-    content = re.sub(r'Experience Japan in real-time from anywhere in the world',
-                     t['why_watch']['subtitle'], content)
-    content = re.sub(r'<h3 class="text-xl font-bold text-gray-900 mb-3">Virtual Tourism & Trip Planning</h3>',
-                     f'<h3 class="text-xl font-bold text-gray-900 mb-3">{t["why_watch"]["tourism"]["title"]}</h3>', content)
-    content = re.sub(r'<h3 class="text-xl font-bold text-gray-900 mb-3">Cultural Connection</h3>',
-                     f'<h3 class="text-xl font-bold text-gray-900 mb-3">{t["why_watch"]["cultural"]["title"]}</h3>', content)
-    content = re.sub(r'<h3 class="text-xl font-bold text-gray-900 mb-3">24/7 Live Coverage</h3>',
-                     f'<h3 class="text-xl font-bold text-gray-900 mb-3">{t["why_watch"]["coverage"]["title"]}</h3>', content)
+    rules.literal('Why Watch Live Japan Webcams?', t['why_watch']['title'])
+    rules.literal('Experience Japan in real-time from anywhere in the world',
+                  t['why_watch']['subtitle'])
+    rules.literal('<h3 class="text-xl font-bold text-gray-900 mb-3">Virtual Tourism & Trip Planning</h3>',
+                  f'<h3 class="text-xl font-bold text-gray-900 mb-3">{t["why_watch"]["tourism"]["title"]}</h3>')
+    rules.literal('<h3 class="text-xl font-bold text-gray-900 mb-3">Cultural Connection</h3>',
+                  f'<h3 class="text-xl font-bold text-gray-900 mb-3">{t["why_watch"]["cultural"]["title"]}</h3>')
+    rules.literal('<h3 class="text-xl font-bold text-gray-900 mb-3">24/7 Live Coverage</h3>',
+                  f'<h3 class="text-xl font-bold text-gray-900 mb-3">{t["why_watch"]["coverage"]["title"]}</h3>')
 
     # Translate "Why Watch" section description paragraphs
-    content = re.sub(
-        r'Plan your Japan trip by checking real-time weather, crowd levels at popular attractions, and seasonal highlights like cherry blossoms or autumn foliage\. See exactly what to expect before you visit\.',
-        t['why_watch']['tourism']['description'],
-        content
+    rules.literal(
+        'Plan your Japan trip by checking real-time weather, crowd levels at popular attractions, and seasonal highlights like cherry blossoms or autumn foliage. See exactly what to expect before you visit.',
+        t['why_watch']['tourism']['description']
     )
-    content = re.sub(
-        r'Stay connected to Japan from anywhere in the world\. Watch daily life unfold at train stations, experience festivals in real-time, or simply enjoy the peaceful ambiance of Japanese temples and gardens\.',
-        t['why_watch']['cultural']['description'],
-        content
+    rules.literal(
+        'Stay connected to Japan from anywhere in the world. Watch daily life unfold at train stations, experience festivals in real-time, or simply enjoy the peaceful ambiance of Japanese temples and gardens.',
+        t['why_watch']['cultural']['description']
     )
-    content = re.sub(
-        r"Never miss a moment with round-the-clock streaming from 200\+ cameras\. Watch sunrise over Mt Fuji, rush hour at Tokyo Station, or late-night neon lights in Osaka's Dotonbori district\.",
-        t['why_watch']['coverage']['description'],
-        content
+    rules.literal(
+        "Never miss a moment with round-the-clock streaming from 200+ cameras. Watch sunrise over Mt Fuji, rush hour at Tokyo Station, or late-night neon lights in Osaka's Dotonbori district.",
+        t['why_watch']['coverage']['description']
     )
 
     # Translate About section
-    content = re.sub(r'<h2 class="text-2xl font-bold mb-3">About SakuraLive - Your Gateway to Japan</h2>',
-                     f'<h2 class="text-2xl font-bold mb-3">{t["about"]["title"]}</h2>', content)
+    rules.literal('<h2 class="text-2xl font-bold mb-3">About SakuraLive - Your Gateway to Japan</h2>',
+                  f'<h2 class="text-2xl font-bold mb-3">{t["about"]["title"]}</h2>')
 
     # Replace first About paragraph (with city links)
     about_p1 = t['about']['description_1']
@@ -166,10 +251,9 @@ def translate_index_page(content, translations):
                 {about_p1}
                 {about_p1_cities}
             </p>'''
-    content = re.sub(
+    rules.regex(
         r'<p class="text-gray-700 leading-relaxed mb-4">\s*SakuraLive is your premier destination.*?</p>',
         new_p1,
-        content,
         flags=re.DOTALL
     )
 
@@ -178,10 +262,9 @@ def translate_index_page(content, translations):
     new_p2 = f'''<p class="text-gray-700 leading-relaxed mb-4">
                 {about_p2_landmarks}
             </p>'''
-    content = re.sub(
+    rules.regex(
         r'<p class="text-gray-700 leading-relaxed mb-4">\s*Our cameras capture everything.*?</p>',
         new_p2,
-        content,
         flags=re.DOTALL
     )
 
@@ -190,211 +273,200 @@ def translate_index_page(content, translations):
     new_p3 = f'''<p class="text-gray-700 leading-relaxed">
                 {about_p3}
             </p>'''
-    content = re.sub(
+    rules.regex(
         r'<p class="text-gray-700 leading-relaxed">\s*Whether you\'re planning your first trip.*?</p>',
         new_p3,
-        content,
         flags=re.DOTALL
     )
 
     # Translate FAQ section
-    content = re.sub(r'<h3 class="text-xl font-semibold mb-3">Frequently Asked Questions</h3>',
-                     f'<h3 class="text-xl font-semibold mb-3">{t["faq"]["title"]}</h3>', content)
-    content = re.sub(r'<summary class="cursor-pointer font-medium">Are these official live cameras\?</summary>',
-                     f'<summary class="cursor-pointer font-medium">{t["faq"]["q1"]["question"]}</summary>', content)
-    content = re.sub(r'<summary class="cursor-pointer font-medium">How do I find specific locations\?</summary>',
-                     f'<summary class="cursor-pointer font-medium">{t["faq"]["q2"]["question"]}</summary>', content)
-    content = re.sub(r'<summary class="cursor-pointer font-medium">Can I watch on mobile\?</summary>',
-                     f'<summary class="cursor-pointer font-medium">{t["faq"]["q3"]["question"]}</summary>', content)
-    content = re.sub(r'<summary class="cursor-pointer font-medium">What are the best times to watch\?</summary>',
-                     f'<summary class="cursor-pointer font-medium">{t["faq"]["q4"]["question"]}</summary>', content)
+    rules.literal('<h3 class="text-xl font-semibold mb-3">Frequently Asked Questions</h3>',
+                  f'<h3 class="text-xl font-semibold mb-3">{t["faq"]["title"]}</h3>')
+    rules.literal('<summary class="cursor-pointer font-medium">Are these official live cameras?</summary>',
+                  f'<summary class="cursor-pointer font-medium">{t["faq"]["q1"]["question"]}</summary>')
+    rules.literal('<summary class="cursor-pointer font-medium">How do I find specific locations?</summary>',
+                  f'<summary class="cursor-pointer font-medium">{t["faq"]["q2"]["question"]}</summary>')
+    rules.literal('<summary class="cursor-pointer font-medium">Can I watch on mobile?</summary>',
+                  f'<summary class="cursor-pointer font-medium">{t["faq"]["q3"]["question"]}</summary>')
+    rules.literal('<summary class="cursor-pointer font-medium">What are the best times to watch?</summary>',
+                  f'<summary class="cursor-pointer font-medium">{t["faq"]["q4"]["question"]}</summary>')
 
     # Translate footer
-    content = re.sub(r'<h4 class="font-semibold text-white mb-4">Major Cities</h4>',
-                     f'<h4 class="font-semibold text-white mb-4">{t["footer"]["major_cities"]}</h4>', content)
-    content = re.sub(r'<h4 class="font-semibold text-white mb-4">Popular Cameras</h4>',
-                     f'<h4 class="font-semibold text-white mb-4">{t["footer"]["popular_cameras"]}</h4>', content)
-    content = re.sub(r'<h4 class="font-semibold text-white mb-4">Resources</h4>',
-                     f'<h4 class="font-semibold text-white mb-4">{t["footer"]["resources"]}</h4>', content)
-    content = re.sub(r'<h4 class="font-semibold text-white mb-3 text-sm">Browse by Type</h4>',
-                     f'<h4 class="font-semibold text-white mb-3 text-sm">{t["footer"]["browse_by_type"]}</h4>', content)
-    content = re.sub(r'>View All Cities →</a>', f'>{t["footer"]["view_all_cities"]}</a>', content)
-    content = re.sub(r'>Browse All Cameras →</a>', f'>{t["footer"]["browse_all_cameras"]}</a>', content)
-    content = re.sub(r'<p class="text-gray-400">Live webcams from across Japan in HD quality</p>',
-                     f'<p class="text-gray-400">{t["footer"]["quality_tagline"]}</p>', content)
-
-    # Update links to point to Japanese versions
-    content = re.sub(r'href="cities/', 'href="cities/', content)
-    content = re.sub(r'href="cameras/', 'href="cameras/', content)
-    content = re.sub(r'href="contact\.html"', 'href="contact.html"', content)
-    content = re.sub(r'href="privacy\.html"', 'href="privacy.html"', content)
-    content = re.sub(r'href="terms\.html"', 'href="terms.html"', content)
-
-    return content
+    rules.literal('<h4 class="font-semibold text-white mb-4">Major Cities</h4>',
+                  f'<h4 class="font-semibold text-white mb-4">{t["footer"]["major_cities"]}</h4>')
+    rules.literal('<h4 class="font-semibold text-white mb-4">Popular Cameras</h4>',
+                  f'<h4 class="font-semibold text-white mb-4">{t["footer"]["popular_cameras"]}</h4>')
+    rules.literal('<h4 class="font-semibold text-white mb-4">Resources</h4>',
+                  f'<h4 class="font-semibold text-white mb-4">{t["footer"]["resources"]}</h4>')
+    rules.literal('<h4 class="font-semibold text-white mb-3 text-sm">Browse by Type</h4>',
+                  f'<h4 class="font-semibold text-white mb-3 text-sm">{t["footer"]["browse_by_type"]}</h4>')
+    rules.literal('>View All Cities →</a>', f'>{t["footer"]["view_all_cities"]}</a>')
+    rules.literal('>Browse All Cameras →</a>', f'>{t["footer"]["browse_all_cameras"]}</a>')
+    rules.literal('<p class="text-gray-400">Live webcams from across Japan in HD quality</p>',
+                  f'<p class="text-gray-400">{t["footer"]["quality_tagline"]}</p>')
+
+    # Links to cities/, cameras/ and the utility pages already resolve inside
+    # the mirror because they are relative, so they are left untouched.
+
+    return rules.apply(content)
 
 def translate_city_page(content, translations, city_name):
     """Translate a city page."""
     t = translations
+    lang = t['meta']['lang']
+    rules = RuleSet('city')
 
     # Get city slug for lookup
     city_slug = city_name.lower().replace(' ', '-')
 
-    # Get Japanese city name
-    ja_city_name = t.get('city_names', {}).get(city_slug, city_name)
+    # Get the translated city name
+    local_city_name = t.get('city_names', {}).get(city_slug, city_name)
 
-    # Get Japanese description for page content
-    ja_description = t.get('city_descriptions', {}).get(city_slug, t.get('city_descriptions', {}).get('default', ''))
+    # Get translated description for page content
+    local_description = t.get('city_descriptions', {}).get(city_slug, t.get('city_descriptions', {}).get('default', ''))
 
     # Get SEO translations
     seo = t.get('seo', {})
-    ja_meta_desc = seo.get('city_meta_description', '').replace('{city}', ja_city_name)
-    ja_og_title = seo.get('city_og_title', '').replace('{city}', ja_city_name)
-    ja_schema_name = seo.get('city_schema_name', '').replace('{city}', ja_city_name)
-    ja_schema_desc = seo.get('city_schema_description', '').replace('{city}', ja_city_name)
+    local_meta_desc = seo.get('city_meta_description', '').replace('{city}', local_city_name)
+    local_og_title = seo.get('city_og_title', '').replace('{city}', local_city_name)
+    local_schema_name = seo.get('city_schema_name', '').replace('{city}', local_city_name)
+    local_schema_desc = seo.get('city_schema_description', '').replace('{city}', local_city_name)
+    local_keywords = seo.get('city_keywords', '').replace('{city}', local_city_name).replace('{city_en}', city_name)
+    local_title = seo.get('city_title', '').replace('{city}', local_city_name)
+
+    cp = t.get('city_page', {})
 
     # Change html lang attribute
-    content = re.sub(r'<html lang="en">', '<html lang="ja">', content)
+    rules.literal('<html lang="en">', f'<html lang="{lang}">')
 
     # Translate header tagline
-    content = content.replace(
-        'Live Webcams from Japan',
-        t['header']['tagline_short']
-    )
+    rules.literal('Live Webcams from Japan', t['header']['tagline_short'])
 
     # Translate meta description
-    content = re.sub(
+    rules.regex(
         r'<meta name="description" content="[^"]*">',
-        f'<meta name="description" content="{ja_meta_desc}">',
-        content
+        f'<meta name="description" content="{local_meta_desc}">'
     )
 
-    # Translate meta keywords to Japanese
-    content = re.sub(
+    # Translate meta keywords
+    rules.regex(
         r'<meta name="keywords" content="[^"]*">',
-        f'<meta name="keywords" content="{ja_city_name}ライブカメラ, {ja_city_name}ウェブカメラ, 日本ライブカメラ, {city_name}リアルタイム配信, 無料ライブカメラ">',
-        content
+        f'<meta name="keywords" content="{local_keywords}">'
     )
 
     # Translate OG title
-    content = re.sub(
+    rules.regex(
         r'<meta property="og:title" content="[^"]*">',
-        f'<meta property="og:title" content="{ja_og_title}">',
-        content
+        f'<meta property="og:title" content="{local_og_title}">'
     )
 
     # Translate OG description
-    content = re.sub(
+    rules.regex(
         r'<meta property="og:description" content="[^"]*">',
-        f'<meta property="og:description" content="{ja_meta_desc}">',
-        content
+        f'<meta property="og:description" content="{local_meta_desc}">'
     )
 
-    # Update OG URL to Japanese version
-    content = re.sub(
-        r'<meta property="og:url" content="https://sakuralivecams\.com/cities/',
-        '<meta property="og:url" content="https://sakuralivecams.com/ja/cities/',
-        content
+    # Update OG URL to the mirrored version
+    rules.literal(
+        '<meta property="og:url" content="https://sakuralivecams.com/cities/',
+        f'<meta property="og:url" content="https://sakuralivecams.com/{lang}/cities/'
     )
 
-    # Translate Schema.org CollectionPage
-    content = re.sub(
-        r'"name": "[^"]*Live Webcams"',
-        f'"name": "{ja_schema_name}"',
-        content
-    )
-    content = re.sub(
+    # Translate Schema.org CollectionPage. The schema name usually sits
+    # between "@type" and "description", so it is also rewritten inside the
+    # CollectionPage match.
+    schema_name_pattern = r'"name": "[^"]*Live Webcams"'
+    schema_name_rules = RuleSet('city-schema')
+    schema_name_rules.regex(schema_name_pattern, f'"name": "{local_schema_name}"')
+    rules.regex(schema_name_pattern, f'"name": "{local_schema_name}"')
+    rules.regex(
         r'("@type": "CollectionPage"[^}]*"description": ")[^"]*(")',
-        lambda m: f'{m.group(1)}{ja_schema_desc}{m.group(2)}',
-        content,
+        lambda m: f'{schema_name_rules.apply(m.group(1))}{local_schema_desc}{m.group(2)}',
         flags=re.DOTALL
     )
 
-    # Update Schema URL to Japanese version
-    content = re.sub(
-        r'"url": "https://sakuralivecams\.com/cities/',
-        '"url": "https://sakuralivecams.com/ja/cities/',
-        content
+    # Update Schema URL to the mirrored version
+    rules.literal(
+        '"url": "https://sakuralivecams.com/cities/',
+        f'"url": "https://sakuralivecams.com/{lang}/cities/'
     )
 
     # Translate page title in <title> tag
-    content = re.sub(
+    rules.regex(
         rf'<title>{re.escape(city_name)} Live Webcams[^<]*</title>',
-        f'<title>{ja_city_name}ライブカメラ | SakuraLive</title>',
-        content
+        f'<title>{local_title}</title>',
+        label='<title>{city} Live Webcams'
     )
 
     # Translate h1 heading
-    content = re.sub(
+    rules.regex(
         rf'<h1[^>]*>{re.escape(city_name)} Live Webcams</h1>',
-        f'<h1 class="text-4xl md:text-6xl font-bold text-white mb-6">{ja_city_name}ライブカメラ</h1>',
-        content
+        f'<h1 class="text-4xl md:text-6xl font-bold text-white mb-6">{cp.get("heading", "").replace("{city}", local_city_name)}</h1>',
+        label='<h1>{city} Live Webcams'
     )
 
     # Translate the description paragraph - match various patterns
-    content = re.sub(
+    rules.regex(
         r'<p class="text-xl md:text-2xl text-white/90 mb-8 max-w-3xl">[^<]+</p>',
-        f'<p class="text-xl md:text-2xl text-white/90 mb-8 max-w-3xl">{ja_description}</p>',
-        content
+        f'<p class="text-xl md:text-2xl text-white/90 mb-8 max-w-3xl">{local_description}</p>'
     )
 
     # Translate breadcrumb
-    content = re.sub(r'>Home</a>', f'>{t["nav"]["home"]}</a>', content)
+    rules.literal('>Home</a>', f'>{t["nav"]["home"]}</a>')
 
     # Translate breadcrumb city name
-    content = re.sub(
-        rf'<span class="text-white font-semibold">{re.escape(city_name)}</span>',
-        f'<span class="text-white font-semibold">{ja_city_name}</span>',
-        content
+    rules.literal(
+        f'<span class="text-white font-semibold">{city_name}</span>',
+        f'<span class="text-white font-semibold">{local_city_name}</span>',
+        label='breadcrumb {city}'
     )
 
     # Translate "All X Webcams" section header
-    content = re.sub(
+    all_webcams = cp.get('all_webcams', '').replace('{city}', local_city_name)
+    rules.regex(
         rf'All {re.escape(city_name)} Webcams \((\d+)\)',
-        lambda m: f'{ja_city_name}のカメラ一覧（{m.group(1)}台）',
-        content
+        lambda m: all_webcams.replace('{count}', m.group(1)),
+        label='All {city} Webcams (N)'
     )
 
     # Translate statistics labels
-    content = re.sub(r'<div class="text-sm opacity-90">Live Cameras</div>',
-                     f'<div class="text-sm opacity-90">{t["city_page"]["live_cameras"]}</div>', content)
-    content = re.sub(r'<div class="text-sm opacity-90">Live Streaming</div>',
-                     f'<div class="text-sm opacity-90">{t["city_page"]["live_streaming"]}</div>', content)
-    content = re.sub(r'<div class="text-sm opacity-90">Quality</div>',
-                     f'<div class="text-sm opacity-90">{t["city_page"]["quality"]}</div>', content)
-    content = re.sub(r'<div class="text-sm opacity-90">No Subscription</div>',
-                     f'<div class="text-sm opacity-90">{t["city_page"]["no_subscription"]}</div>', content)
+    rules.literal('<div class="text-sm opacity-90">Live Cameras</div>',
+                  f'<div class="text-sm opacity-90">{cp["live_cameras"]}</div>')
+    rules.literal('<div class="text-sm opacity-90">Live Streaming</div>',
+                  f'<div class="text-sm opacity-90">{cp["live_streaming"]}</div>')
+    rules.literal('<div class="text-sm opacity-90">Quality</div>',
+                  f'<div class="text-sm opacity-90">{cp["quality"]}</div>')
+    rules.literal('<div class="text-sm opacity-90">No Subscription</div>',
+                  f'<div class="text-sm opacity-90">{cp["no_subscription"]}</div>')
 
     # Translate current time label
-    content = re.sub(r'Current Time \(JST\):',
-                     f'{t["city_page"]["current_time"]}:', content)
+    rules.literal('Current Time (JST):', f'{cp["current_time"]}:')
 
     # Translate "About X Webcams" section
-    content = re.sub(
+    rules.regex(
         rf'<h2[^>]*>About {re.escape(city_name)} Webcams</h2>',
-        f'<h2 class="text-3xl font-bold text-gray-900 mb-6">{ja_city_name}ライブカメラについて</h2>',
-        content
+        f'<h2 class="text-3xl font-bold text-gray-900 mb-6">{cp.get("about_heading", "").replace("{city}", local_city_name)}</h2>',
+        label='<h2>About {city} Webcams'
     )
 
     # Translate "Places to Visit" section
-    content = re.sub(
+    rules.regex(
         rf'<h3[^>]*>Places to Visit in {re.escape(city_name)}</h3>',
-        f'<h3 class="text-2xl font-bold text-gray-900 mb-6">{ja_city_name}の観光スポット</h3>',
-        content
+        f'<h3 class="text-2xl font-bold text-gray-900 mb-6">{cp.get("places_heading", "").replace("{city}", local_city_name)}</h3>',
+        label='<h3>Places to Visit in {city}'
     )
 
     # Translate "Pro Tip" label
-    content = re.sub(
-        r'<strong class="text-rose-700">Pro Tip:</strong>',
-        '<strong class="text-rose-700">ヒント：</strong>',
-        content
+    rules.literal(
+        '<strong class="text-rose-700">Pro Tip:</strong>',
+        f'<strong class="text-rose-700">{cp.get("pro_tip_label", "Pro Tip:")}</strong>'
     )
 
     # Translate Pro Tip text content
-    pro_tip_text = t.get('city_pro_tip', {}).get('default', '').replace('{city}', ja_city_name)
-    content = re.sub(
+    pro_tip_text = t.get('city_pro_tip', {}).get('default', '').replace('{city}', local_city_name)
+    rules.regex(
         r'Use our live webcams to check current\s+weather conditions and crowd levels before visiting popular attractions in [^.]+\.',
         pro_tip_text,
-        content,
         flags=re.DOTALL
     )
 
@@ -404,7 +476,7 @@ def translate_city_page(content, translations, city_name):
 
     if about_paragraphs:
         # Replace default placeholder in paragraphs if needed
-        about_paragraphs = [p.replace('{city}', ja_city_name) for p in about_paragraphs]
+        about_paragraphs = [p.replace('{city}', local_city_name) for p in about_paragraphs]
 
         # Build the new about content HTML
         new_about_html = '<div class="prose prose-lg text-gray-700 space-y-4">\n'
@@ -412,11 +484,11 @@ def translate_city_page(content, translations, city_name):
             new_about_html += f'                        <p>\n                            {para}\n                        </p>\n'
         new_about_html += '                    </div>'
 
-        # Replace the existing about content
-        content = re.sub(
-            r'<div class="prose prose-lg text-gray-700 space-y-4">.*?</div>\s*</div>\s*<div>\s*<h3',
-            new_about_html + '\n                </div>\n\n                <div>\n                    <h3',
-            content,
+        # Replace the existing about content. The following <h3> is only
+        # looked ahead at so the "Places to Visit" rule can still rewrite it.
+        rules.regex(
+            r'<div class="prose prose-lg text-gray-700 space-y-4">.*?</div>\s*</div>\s*<div>\s*(?=<h3)',
+            new_about_html + '\n                </div>\n\n                <div>\n                    ',
             flags=re.DOTALL
         )
 
@@ -432,217 +504,229 @@ def translate_city_page(content, translations, city_name):
         new_places_html += '                    </ul>'
 
         # Replace the existing places list
-        content = re.sub(
+        rules.regex(
             r'<ul class="space-y-3 text-gray-700">.*?</ul>',
             new_places_html,
-            content,
             flags=re.DOTALL
         )
 
     # Translate "Explore Other Cities" section header
-    explore_title = t.get('explore_other_cities', {}).get('title', 'その他の都市を探す')
-    content = re.sub(
-        r'<h2 class="text-2xl font-bold text-gray-900 mb-6">Explore Other Cities</h2>',
-        f'<h2 class="text-2xl font-bold text-gray-900 mb-6">{explore_title}</h2>',
-        content
+    explore_title = t.get('explore_other_cities', {}).get('title', 'Explore Other Cities')
+    rules.literal(
+        '<h2 class="text-2xl font-bold text-gray-900 mb-6">Explore Other Cities</h2>',
+        f'<h2 class="text-2xl font-bold text-gray-900 mb-6">{explore_title}</h2>'
     )
 
     # Translate footer section headers
-    content = re.sub(r'<h4 class="text-white font-semibold mb-3">Popular Cities</h4>',
-                     '<h4 class="text-white font-semibold mb-3">人気の都市</h4>', content)
-    content = re.sub(r'<h4 class="text-white font-semibold mb-3">More Destinations</h4>',
-                     '<h4 class="text-white font-semibold mb-3">その他の地域</h4>', content)
-    content = re.sub(r'<h4 class="text-white font-semibold mb-3">Information</h4>',
-                     '<h4 class="text-white font-semibold mb-3">その他</h4>', content)
+    rules.literal('<h4 class="text-white font-semibold mb-3">Popular Cities</h4>',
+                  f'<h4 class="text-white font-semibold mb-3">{cp.get("footer_popular_cities", "Popular Cities")}</h4>')
+    rules.literal('<h4 class="text-white font-semibold mb-3">More Destinations</h4>',
+                  f'<h4 class="text-white font-semibold mb-3">{cp.get("footer_more_destinations", "More Destinations")}</h4>')
+    rules.literal('<h4 class="text-white font-semibold mb-3">Information</h4>',
+                  f'<h4 class="text-white font-semibold mb-3">{cp.get("footer_information", "Information")}</h4>')
 
-    # Update link to index
-    content = re.sub(r'href="\.\./index\.html"', 'href="../index.html"', content)
+    return rules.apply(content)
 
-    return content
-
-def translate_camera_page(content, translations, camera_name, city_name):
-    """Translate a camera page."""
+def city_context(translations, city_name):
+    """Resolve a city's camera page strings for one locale."""
     t = translations
-
-    # Get city slug for lookup
     city_slug = city_name.lower().replace(' ', '-')
+    local_city_name = t.get('city_names', {}).get(city_slug, city_name)
+    cp = t.get('camera_page', {})
 
-    # Get Japanese city name
-    ja_city_name = t.get('city_names', {}).get(city_slug, city_name)
+    # The og:title and schema name never had {city} filled in
+    templates = CameraTemplates(*(
+        PageTemplate(
+            t.get(section, {}).get(key, '') if field in ('og_title', 'schema_name')
+            else t.get(section, {}).get(key, '').replace('{city}', local_city_name),
+            pattern=CAMERA_SLOT_PATTERN
+        )
+        for field, section, key in CAMERA_TEMPLATE_KEYS
+    ))
+
+    return CityContext(
+        slug=city_slug,
+        name=city_name,
+        local_name=local_city_name,
+        city_in_japan=cp.get('city_in_japan', '').replace('{city}', local_city_name),
+        more_from_city=cp.get('more_from_city', '').replace('{city}', local_city_name),
+        view_all=cp.get('view_all_in_city', '').replace('{city}', local_city_name),
+        templates=templates,
+    )
 
-    # Get SEO translations
-    seo = t.get('seo', {})
-    ja_title = seo.get('camera_title', '').replace('{camera}', camera_name).replace('{city}', ja_city_name)
-    ja_meta_desc = seo.get('camera_meta_description', '').replace('{camera}', camera_name).replace('{city}', ja_city_name)
-    ja_og_title = seo.get('camera_og_title', '').replace('{camera}', camera_name)
-    ja_og_desc = seo.get('camera_og_description', '').replace('{camera}', camera_name).replace('{city}', ja_city_name)
-    ja_schema_name = seo.get('camera_schema_name', '').replace('{camera}', camera_name)
-    ja_schema_desc = seo.get('camera_schema_description', '').replace('{camera}', camera_name).replace('{city}', ja_city_name)
+def city_contexts(translations, sources):
+    """CityContext for the city of every camera page, built once per city."""
+    cities = sorted({page.city for page in sources if page.kind == 'camera'})
+    return {city: city_context(translations, city) for city in cities}
+
+def translate_camera_page(content, translations, camera_name, city_name, context=None):
+    """Translate a camera page.
+
+    context is the city's CityContext from city_contexts(); it is resolved
+    here when not given.
+    """
+    t = translations
+    lang = t['meta']['lang']
+    rules = RuleSet('camera')
+
+    if context is None:
+        context = city_context(translations, city_name)
+    city_slug = context.slug
+    local_city_name = context.local_name
+
+    # Fill the camera name into the city's templates
+    local = CameraTemplates(*(template.render(camera=camera_name) for template in context.templates))
+    local_title = local.title
+    local_meta_desc = local.meta_desc
+    local_og_title = local.og_title
+    local_og_desc = local.og_desc
+    local_schema_name = local.schema_name
+    local_schema_desc = local.schema_desc
+    local_keywords = local.keywords
+
+    # Get camera page translations
+    cp = t.get('camera_page', {})
 
     # Change html lang attribute
-    content = re.sub(r'<html lang="en">', '<html lang="ja">', content)
+    rules.literal('<html lang="en">', f'<html lang="{lang}">')
 
     # Translate page title
-    content = re.sub(
-        r'<title>[^<]*</title>',
-        f'<title>{ja_title}</title>',
-        content
-    )
+    rules.regex(r'<title>[^<]*</title>', f'<title>{local_title}</title>')
 
     # Translate meta description
-    content = re.sub(
+    rules.regex(
         r'<meta name="description" content="[^"]*">',
-        f'<meta name="description" content="{ja_meta_desc}">',
-        content
+        f'<meta name="description" content="{local_meta_desc}">'
     )
 
     # Translate meta keywords
-    content = re.sub(
+    rules.regex(
         r'<meta name="keywords" content="[^"]*">',
-        f'<meta name="keywords" content="{camera_name}, {ja_city_name}ライブカメラ, 日本ウェブカメラ, ライブ配信, 無料カメラ">',
-        content
+        f'<meta name="keywords" content="{local_keywords}">'
     )
 
     # Translate OG title
-    content = re.sub(
+    rules.regex(
         r'<meta property="og:title" content="[^"]*">',
-        f'<meta property="og:title" content="{ja_og_title}">',
-        content
+        f'<meta property="og:title" content="{local_og_title}">'
     )
 
     # Translate OG description
-    content = re.sub(
+    rules.regex(
         r'<meta property="og:description" content="[^"]*">',
-        f'<meta property="og:description" content="{ja_og_desc}">',
-        content
-    )
-
-    # Update OG URL to Japanese version
-    content = re.sub(
-        r'<meta property="og:url" content="https://sakuralivecams\.com/cameras/',
-        '<meta property="og:url" content="https://sakuralivecams.com/ja/cameras/',
-        content
-    )
-
-    # Translate Schema.org VideoObject
-    content = re.sub(
-        r'"name": "[^"]*- Live Webcam"',
-        f'"name": "{ja_schema_name}"',
-        content
-    )
-    content = re.sub(
-        r'("@type": "VideoObject"[^}]*"description": ")[^"]*(")',
-        lambda m: f'{m.group(1)}{ja_schema_desc}{m.group(2)}',
-        content,
-        flags=re.DOTALL
-    )
-
-    # Update Schema inLanguage to Japanese
-    content = re.sub(
-        r'"inLanguage": "en"',
-        '"inLanguage": "ja"',
-        content
+        f'<meta property="og:description" content="{local_og_desc}">'
     )
 
-    # Translate Breadcrumb Schema - "Home" to Japanese
-    content = re.sub(
-        r'("@type": "BreadcrumbList"[^}]*"name": ")Home(")',
-        lambda m: f'{m.group(1)}ホーム{m.group(2)}',
-        content,
-        flags=re.DOTALL
+    # Update OG URL to the mirrored version
+    rules.literal(
+        '<meta property="og:url" content="https://sakuralivecams.com/cameras/',
+        f'<meta property="og:url" content="https://sakuralivecams.com/{lang}/cameras/'
     )
 
     # Translate header tagline
-    content = content.replace(
-        'Live Webcams from Japan',
-        t['header']['tagline_short']
-    )
+    rules.literal('Live Webcams from Japan', t['header']['tagline_short'])
 
     # Translate breadcrumb - Home link
-    content = re.sub(r'>Home</a>', f'>{t["nav"]["home"]}</a>', content)
+    rules.literal('>Home</a>', f'>{t["nav"]["home"]}</a>')
 
     # Translate breadcrumb - city link text (but keep the href)
-    content = re.sub(
-        rf'href="(\.\./cities/{re.escape(city_slug)}\.html)" class="hover:text-white">{re.escape(city_name)}',
-        lambda m: f'href="{m.group(1)}" class="hover:text-white">{ja_city_name}',
-        content
+    rules.literal(
+        f'href="../cities/{city_slug}.html" class="hover:text-white">{city_name}',
+        f'href="../cities/{city_slug}.html" class="hover:text-white">{local_city_name}',
+        label='breadcrumb {city} link'
     )
 
-    # Translate location link under camera title
-    content = re.sub(
-        rf'<a href="\.\./cities/{re.escape(city_slug)}\.html" class="hover:text-white">{re.escape(city_name)}, Japan</a>',
-        f'<a href="../cities/{city_slug}.html" class="hover:text-white">{ja_city_name}、日本</a>',
-        content
-    )
+    # Translate location link under camera title. The breadcrumb rule above
+    # also rewrites the city name in this link, so the "{city}, Japan" form
+    # is only produced when the city has no translated name.
+    if local_city_name == city_name:
+        rules.literal(
+            f'<a href="../cities/{city_slug}.html" class="hover:text-white">{city_name}, Japan</a>',
+            f'<a href="../cities/{city_slug}.html" class="hover:text-white">{context.city_in_japan}</a>',
+            label='{city}, Japan link'
+        )
 
     # Translate "LIVE" badge
-    content = re.sub(r'>\s*LIVE\s*</span>', '>ライブ</span>', content)
+    rules.regex(r'>\s*LIVE\s*</span>', f'>{t["common"]["live"]}</span>')
 
-    # Translate "About This Camera" heading
-    content = re.sub(r'<h2 class="text-2xl font-bold mb-4">About This Camera</h2>',
-                     f'<h2 class="text-2xl font-bold mb-4">{t["camera_page"]["about_camera"]}</h2>', content)
+    # Translate the play button label of the click-to-play player
+    rules.regex(
+        r'aria-label="Play ([^"]*)"',
+        lambda m: f'aria-label="{cp["play_video"].format(title=m.group(1))}"',
+        label='aria-label="Play {title}"'
+    )
 
-    # Get camera page translations
-    cp = t.get('camera_page', {})
+    # Translate "About This Camera" heading
+    rules.literal('<h2 class="text-2xl font-bold mb-4">About This Camera</h2>',
+                  f'<h2 class="text-2xl font-bold mb-4">{cp["about_camera"]}</h2>')
 
-    # Build Japanese description content
-    ja_intro = cp.get('description_intro', '').replace('{camera}', camera_name).replace('{city}', ja_city_name)
-    ja_stream = cp.get('description_stream', '').replace('{camera}', camera_name).replace('{city}', ja_city_name)
-    ja_special_label = cp.get('what_makes_special', 'このカメラの特徴：')
-    ja_special_text = cp.get('what_makes_special_text', '').replace('{camera}', camera_name).replace('{city}', ja_city_name)
-    ja_optimal_label = cp.get('optimal_viewing', 'おすすめの視聴時間：')
-    ja_optimal_text = cp.get('optimal_viewing_text', '').replace('{camera}', camera_name).replace('{city}', ja_city_name)
+    # Build translated description content
+    local_intro = local.intro
+    local_stream = local.stream
+    local_special_label = cp.get('what_makes_special', '')
+    local_special_text = local.special_text
+    local_optimal_label = cp.get('optimal_viewing', '')
+    local_optimal_text = local.optimal_text
 
     # Build the new description HTML
     new_desc_html = f'''<div class="text-gray-300 space-y-3 mb-4">
-                        <p>{ja_intro}</p>
+                        <p>{local_intro}</p>
 
-                        <p>{ja_stream}</p>
+                        <p>{local_stream}</p>
 
-                        <p><strong class="text-white">{ja_special_label}</strong> {ja_special_text}</p>
+                        <p><strong class="text-white">{local_special_label}</strong> {local_special_text}</p>
 
-                        <p><strong class="text-white">{ja_optimal_label}</strong> {ja_optimal_text}</p>
+                        <p><strong class="text-white">{local_optimal_label}</strong> {local_optimal_text}</p>
                     </div>'''
 
     # Replace the existing description content
-    content = re.sub(
+    rules.regex(
         r'<div class="text-gray-300 space-y-3 mb-4">.*?</div>\s*<div class="flex flex-wrap gap-2',
         new_desc_html + '\n                    <div class="flex flex-wrap gap-2',
-        content,
         flags=re.DOTALL
     )
 
     # Translate "Share This Camera" heading
-    content = re.sub(r'<h3 class="text-xl font-bold mb-3">Share This Camera</h3>',
-                     f'<h3 class="text-xl font-bold mb-3">{t["camera_page"]["share_camera"]}</h3>', content)
+    rules.literal('<h3 class="text-xl font-bold mb-3">Share This Camera</h3>',
+                  f'<h3 class="text-xl font-bold mb-3">{cp["share_camera"]}</h3>')
 
     # Translate "More from X" heading
-    content = re.sub(
+    rules.regex(
         rf'<h3[^>]*>More from {re.escape(city_name)}</h3>',
-        f'<h3 class="text-xl font-bold mb-4">{ja_city_name}のその他のカメラ</h3>',
-        content
+        f'<h3 class="text-xl font-bold mb-4">{context.more_from_city}</h3>',
+        label='<h3>More from {city}'
     )
 
     # Translate "View All X Cameras" link
-    content = re.sub(
-        rf'>View All {re.escape(city_name)} Cameras →</a>',
-        f'>{ja_city_name}のカメラをすべて見る →</a>',
-        content
+    rules.literal(
+        f'>View All {city_name} Cameras →</a>',
+        f'>{context.view_all} →</a>',
+        label='View All {city} Cameras'
     )
 
-    # Update links
-    content = re.sub(r'href="\.\./index\.html"', 'href="../index.html"', content)
-    content = re.sub(r'href="\.\./cities/', 'href="../cities/', content)
-
-    return content
-
-def add_hreflang_to_content(content, page_path, is_japanese):
+    # Translate the Schema.org VideoObject and BreadcrumbList
+    def translate_schema(data):
+        if data.get('@type') == 'VideoObject':
+            if data.get('name', '').endswith('- Live Webcam'):
+                data['name'] = local_schema_name
+            data['description'] = local_schema_desc
+            if data.get('inLanguage') == 'en':
+                data['inLanguage'] = lang
+        elif data.get('@type') == 'BreadcrumbList':
+            for item in data.get('itemListElement', []):
+                if item.get('name') == 'Home':
+                    item['name'] = t['nav']['home']
+
+    return edit_json_ld(rules.apply(content), translate_schema)
+
+def add_hreflang_to_content(content, page_path, labels):
     """Add hreflang tags to the HTML content."""
-    hreflang_tags = get_hreflang_tags(page_path, is_japanese)
+    hreflang_tags = get_hreflang_tags(page_path, labels)
 
-    # First, remove any existing hreflang tags to avoid duplicates
+    # First, remove any existing hreflang tags (and their indentation) to
+    # avoid duplicates
     content = re.sub(
-        r'\s*<link rel="alternate" hreflang="[^"]*" href="[^"]*">\s*',
+        r'\n?[ \t]*<link rel="alternate" hreflang="[^"]*" href="[^"]*">',
         '',
         content
     )
@@ -658,13 +742,14 @@ def add_hreflang_to_content(content, page_path, is_japanese):
 
     return content
 
-def add_language_switcher(content, current_lang, page_path):
+def add_language_switcher(content, current_lang, page_path, labels):
     """Add language switcher to the header."""
-    switcher_html = get_language_switcher_html(current_lang, page_path)
+    switcher_html = get_language_switcher_html(current_lang, page_path, labels)
 
     # First, remove any existing language switchers to avoid duplicates
     content = re.sub(
-        r'<div class="flex items-center gap-2 text-sm">\s*<a href="[^"]*"[^>]*>EN</a>\s*<span class="text-gray-500">\|</span>\s*<a href="[^"]*"[^>]*>日本語</a>\s*</div>\s*',
+        r'<div class="flex items-center gap-2 text-sm">\s*<a href="[^"]*"[^>]*>[^<]*</a>'
+        r'(?:\s*<span class="text-gray-500">\|</span>\s*<a href="[^"]*"[^>]*>[^<]*</a>)+\s*</div>\s*',
         '',
         content,
         flags=re.DOTALL
@@ -678,294 +763,313 @@ def add_language_switcher(content, current_lang, page_path):
 
     return content
 
-def update_canonical_url(content, page_path, is_japanese):
-    """Update canonical URL for Japanese pages."""
-    if is_japanese:
-        base_url = 'https://sakuralivecams.com/ja'
-        content = re.sub(
-            r'<link rel="canonical" href="https://sakuralivecams\.com/([^"]*)"',
-            f'<link rel="canonical" href="{base_url}/\\1"',
-            content
-        )
-    return content
-
-def process_index_page(translations):
-    """Process and generate Japanese version of index.html."""
-    print("Processing index.html...")
+def update_canonical_url(content, lang):
+    """Point the canonical URL at the mirrored page."""
+    return re.sub(
+        r'<link rel="canonical" href="https://sakuralivecams\.com/([^"]*)"',
+        f'<link rel="canonical" href="{BASE_URL}/{lang}/\\1"',
+        content
+    )
 
-    source_path = BASE_DIR / 'index.html'
-    dest_path = JA_DIR / 'index.html'
-
-    with open(source_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+def rebase_srcset(content, old_prefix, new_prefix):
+    """Rewrite the URLs starting with old_prefix inside srcset attributes."""
+    pattern = re.compile(r'(^|,\s*)' + re.escape(old_prefix))
+    return re.sub(r'srcset="([^"]*)"',
+                  lambda m: 'srcset="' + pattern.sub(lambda u: u.group(1) + new_prefix, m.group(1)) + '"',
+                  content)
+
+def translate_page(page, translations, contexts=None):
+    """Translate the text of an English page; contexts is from city_contexts()."""
+    if page.kind == 'index':
+        return translate_index_page(page.content, translations)
+    if page.kind == 'city':
+        return translate_city_page(page.content, translations, page.name)
+    if page.kind == 'camera':
+        context = contexts.get(page.city) if contexts else None
+        return translate_camera_page(page.content, translations, page.name, page.city, context)
+    return re.sub(r'<html lang="en">', f'<html lang="{translations["meta"]["lang"]}">', page.content)
+
+def localize_page(page, translations, labels, contexts=None):
+    """Build one locale's version of an English page."""
+    lang = translations['meta']['lang']
 
     # Translate content
-    content = translate_index_page(content, translations)
+    content = translate_page(page, translations, contexts)
 
     # Add hreflang tags
-    content = add_hreflang_to_content(content, 'index.html', is_japanese=True)
+    content = add_hreflang_to_content(content, page.path, labels)
 
     # Add language switcher
-    content = add_language_switcher(content, 'ja', 'index.html')
+    content = add_language_switcher(content, lang, page.path, labels)
 
     # Update canonical URL
-    content = update_canonical_url(content, 'index.html', is_japanese=True)
-
-    # Update relative paths to go up one level for assets
-    content = re.sub(r'href="assets/', 'href="../assets/', content)
-    content = re.sub(r'src="assets/', 'src="../assets/', content)
-    content = re.sub(r"'https://sakuralivecams\.com/assets/", "'../assets/", content)
-
-    # Update links to other pages to stay in Japanese version
-    content = re.sub(r'href="cities/', 'href="cities/', content)
-    content = re.sub(r'href="cameras/', 'href="cameras/', content)
-    content = re.sub(r'href="contact\.html"', 'href="contact.html"', content)
-    content = re.sub(r'href="privacy\.html"', 'href="privacy.html"', content)
-    content = re.sub(r'href="terms\.html"', 'href="terms.html"', content)
-
-    with open(dest_path, 'w', encoding='utf-8') as f:
-        f.write(content)
-
-    print(f"  ✅ Created {dest_path}")
-
-def process_city_pages(translations):
-    """Process and generate Japanese versions of city pages."""
-    print("\nProcessing city pages...")
-
-    cities_dir = BASE_DIR / 'cities'
-    ja_cities_dir = JA_DIR / 'cities'
-
-    for city_file in cities_dir.glob('*.html'):
-        city_name = city_file.stem.title()
-        dest_path = ja_cities_dir / city_file.name
-
-        with open(city_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Translate content
-        content = translate_city_page(content, translations, city_name)
-
-        # Add hreflang tags
-        content = add_hreflang_to_content(content, f'cities/{city_file.name}', is_japanese=True)
-
-        # Add language switcher
-        content = add_language_switcher(content, 'ja', f'cities/{city_file.name}')
-
-        # Update canonical URL
-        content = update_canonical_url(content, f'cities/{city_file.name}', is_japanese=True)
+    content = update_canonical_url(content, lang)
+
+    # Assets are one level further up from the mirror. Links to other pages
+    # are relative and already resolve inside the mirror.
+    up = '../' * page.path.count('/')
+    content = re.sub(rf'href="{re.escape(up)}assets/', f'href="../{up}assets/', content)
+    content = re.sub(rf'src="{re.escape(up)}assets/', f'src="../{up}assets/', content)
+    content = rebase_srcset(content, f'{up}assets/', f'../{up}assets/')
+    if page.kind == 'index':
+        # Data URLs in the page script
+        content = re.sub(r"'https://sakuralivecams\.com/assets/", f"'../{up}assets/", content)
 
-        # Update relative paths (go up two levels now)
-        content = re.sub(r'href="\.\./assets/', 'href="../../assets/', content)
-        content = re.sub(r'src="\.\./assets/', 'src="../../assets/', content)
-
-        # Keep camera links within Japanese version
-        content = re.sub(r'href="\.\./cameras/', 'href="../cameras/', content)
-        content = re.sub(r'href="\.\./index\.html"', 'href="../index.html"', content)
-
-        with open(dest_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-
-        print(f"  ✅ Created {dest_path.name}")
-
-def process_camera_pages(translations):
-    """Process and generate Japanese versions of camera pages."""
-    print("\nProcessing camera pages...")
-
-    cameras_dir = BASE_DIR / 'cameras'
-    ja_cameras_dir = JA_DIR / 'cameras'
-
-    count = 0
-    for camera_file in cameras_dir.glob('*.html'):
-        camera_name = camera_file.stem.replace('-', ' ').title()
-        dest_path = ja_cameras_dir / camera_file.name
-
-        with open(camera_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+    return content
 
+def locale_work(locales, sources, jobs=1):
+    """Split the locale builds into (lang, pages) work items for run_pages().
+
+    A serial run builds each locale as one item. A parallel one cuts every
+    locale into chunks of pages, so even a single locale keeps every worker
+    busy.
+    """
+    jobs = resolve_jobs(jobs)
+    if jobs == 1:
+        return [(lang, sources) for lang in locales]
+    size = max(1, len(sources) * len(locales) // (jobs * 4))
+    return [(lang, sources[start:start + size])
+            for lang in locales for start in range(0, len(sources), size)]
+
+def build_pages(work, labels, manifest):
+    """Build one work item: some or all pages of one locale's mirror.
+
+    Returns ([(output path, build key)] of the pages built, {page kind:
+    [created, unchanged, skipped]}, [(profile phase, wall, cpu)] per page)
+    for the parent to merge into the manifest and the totals.
+    """
+    lang, pages = work
+    phases = []
+    with timed_phase(phases, 'locale setup'):
+        translations = load_translations(lang)
+        locale_dir = BASE_DIR / lang
+        sections_hashes = {kind: translations_hash(translations, sections) for kind, sections in PAGE_SECTIONS.items()}
+        # Every page lists every locale, so adding one rebuilds them all
+        labels_hash = content_hash(labels)
+        # Shared by every camera page of the item
+        contexts = city_contexts(translations, pages)
+
+    built = []
+    counts = {kind: [0, 0, 0] for kind in PAGE_SECTIONS}
+    for page in pages:
+        with timed_phase(phases, KIND_PHASES[page.kind]):
+            dest_path = locale_dir / page.path
+            build_key = page_build_key(f'{lang}/{page.path}', page.content,
+                                       sections_hashes[page.kind] + labels_hash)
+            if manifest.is_current(dest_path, build_key):
+                counts[page.kind][2] += 1
+                continue
+
+            content = localize_page(page, translations, labels, contexts)
+            if write_if_changed(dest_path, content):
+                counts[page.kind][0] += 1
+            else:
+                counts[page.kind][1] += 1
+            built.append((dest_path, build_key))
+
+    return built, counts, phases
+
+def source_paths(root):
+    """(page kind, site-relative path) of every English page that gets mirrored."""
+    root = Path(root)
+    paths = [('index', 'index.html')]
+    paths += [('city', f'cities/{p.name}') for p in sorted((root / 'cities').glob('*.html'))]
+    paths += [('camera', f'cameras/{p.name}') for p in sorted((root / 'cameras').glob('*.html'))]
+    for page_name in UTILITY_PAGES:
+        if (root / page_name).exists():
+            paths.append(('utility', page_name))
+        else:
+            print(f"  ⚠️  {page_name} not found, skipping...")
+    return paths
+
+def source_page(kind, path, content):
+    """SourcePage for an English page, with the names its translation is keyed on."""
+    name = city = None
+    stem = Path(path).stem
+    if kind == 'city':
+        name = stem.title()
+    elif kind == 'camera':
+        name = stem.replace('-', ' ').title()
         # Extract city name from breadcrumb
         city_match = re.search(r'href="\.\./cities/([^"]+)\.html"', content)
-        city_name = city_match.group(1).title() if city_match else 'Japan'
-
-        # Translate content
-        content = translate_camera_page(content, translations, camera_name, city_name)
-
-        # Add hreflang tags
-        content = add_hreflang_to_content(content, f'cameras/{camera_file.name}', is_japanese=True)
-
-        # Add language switcher
-        content = add_language_switcher(content, 'ja', f'cameras/{camera_file.name}')
-
-        # Update canonical URL
-        content = update_canonical_url(content, f'cameras/{camera_file.name}', is_japanese=True)
-
-        # Update relative paths (go up two levels now)
-        content = re.sub(r'href="\.\./assets/', 'href="../../assets/', content)
-        content = re.sub(r'src="\.\./assets/', 'src="../../assets/', content)
-
-        # Keep links within Japanese version
-        content = re.sub(r'href="\.\./cities/', 'href="../cities/', content)
-        content = re.sub(r'href="\.\./cameras/', 'href="../cameras/', content)
-        content = re.sub(r'href="\.\./index\.html"', 'href="../index.html"', content)
-
-        with open(dest_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-
-        count += 1
-
-    print(f"  ✅ Created {count} camera pages")
-
-def process_utility_pages(translations):
-    """Process utility pages (contact, privacy, terms)."""
-    print("\nProcessing utility pages...")
-
-    utility_pages = ['contact.html', 'privacy.html', 'terms.html']
-
-    for page_name in utility_pages:
-        source_path = BASE_DIR / page_name
-        dest_path = JA_DIR / page_name
-
-        if not source_path.exists():
-            print(f"  ⚠️  {page_name} not found, skipping...")
-            continue
-
-        with open(source_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Change lang attribute
-        content = re.sub(r'<html lang="en">', '<html lang="ja">', content)
-
-        # Add hreflang tags
-        content = add_hreflang_to_content(content, page_name, is_japanese=True)
-
-        # Add language switcher
-        content = add_language_switcher(content, 'ja', page_name)
+        city = city_match.group(1).title() if city_match else 'Japan'
+    return SourcePage(kind, path, content, name, city)
 
-        # Update canonical URL
-        content = update_canonical_url(content, page_name, is_japanese=True)
-
-        # Update relative paths
-        content = re.sub(r'href="assets/', 'href="../assets/', content)
-        content = re.sub(r'src="assets/', 'src="../assets/', content)
-
-        # Update links to stay in Japanese version
-        content = re.sub(r'href="index\.html"', 'href="index.html"', content)
-        content = re.sub(r'href="cities/', 'href="cities/', content)
-
-        with open(dest_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-
-        print(f"  ✅ Created {page_name}")
-
-def add_hreflang_to_english_pages():
-    """Add hreflang tags and language switcher to all English pages."""
-    print("\nAdding hreflang tags to English pages...")
-
-    # Process index.html
-    index_path = BASE_DIR / 'index.html'
-    with open(index_path, 'r', encoding='utf-8') as f:
+def english_page(kind, path, labels):
+    """Read an English page, refreshing its hreflang tags and language switcher."""
+    page_path = BASE_DIR / path
+    with open(page_path, 'r', encoding='utf-8') as f:
         content = f.read()
 
-    if 'hreflang="ja"' not in content:
-        content = add_hreflang_to_content(content, 'index.html', is_japanese=False)
-    content = add_language_switcher(content, 'en', 'index.html')
-
-    with open(index_path, 'w', encoding='utf-8') as f:
-        f.write(content)
-    print("  ✅ Updated index.html")
-
-    # Process city pages
-    cities_dir = BASE_DIR / 'cities'
-    for city_file in cities_dir.glob('*.html'):
-        with open(city_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        if 'hreflang="ja"' not in content:
-            content = add_hreflang_to_content(content, f'cities/{city_file.name}', is_japanese=False)
-        content = add_language_switcher(content, 'en', f'cities/{city_file.name}')
-
-        with open(city_file, 'w', encoding='utf-8') as f:
-            f.write(content)
-
-    print("  ✅ Updated city pages")
-
-    # Process camera pages
-    cameras_dir = BASE_DIR / 'cameras'
-    for camera_file in cameras_dir.glob('*.html'):
-        with open(camera_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        if 'hreflang="ja"' not in content:
-            content = add_hreflang_to_content(content, f'cameras/{camera_file.name}', is_japanese=False)
-        content = add_language_switcher(content, 'en', f'cameras/{camera_file.name}')
-
-        with open(camera_file, 'w', encoding='utf-8') as f:
-            f.write(content)
-
-    print("  ✅ Updated camera pages")
-
-    # Process utility pages
-    for page_name in ['contact.html', 'privacy.html', 'terms.html']:
-        page_path = BASE_DIR / page_name
-        if page_path.exists():
-            with open(page_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            if 'hreflang="ja"' not in content:
-                content = add_hreflang_to_content(content, page_name, is_japanese=False)
-            content = add_language_switcher(content, 'en', page_name)
-
-            with open(page_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-
-    print("  ✅ Updated utility pages")
-
-def create_directory_structure():
-    """Create the Japanese pages directory structure."""
+    listed = re.findall(r'<link rel="alternate" hreflang="([^"]*)"', content)
+    if sorted(listed) != sorted(list(labels) + ['x-default']):
+        content = add_hreflang_to_content(content, path, labels)
+    content = add_language_switcher(content, SOURCE_LANG, path, labels)
+
+    return source_page(kind, path, content), write_if_changed(page_path, content)
+
+def load_source_pages(labels):
+    """Read every English page once, updating its hreflang tags and switcher."""
+    print("\nReading English pages...")
+
+    sources = []
+    updated = 0
+    for kind, path in source_paths(BASE_DIR):
+        page, written = english_page(kind, path, labels)
+        sources.append(page)
+        updated += written
+
+    print(f"  ✅ Read {len(sources)} pages")
+    print(f"  • {updated} English pages rewritten")
+    return sources
+
+@contextmanager
+def timed_phase(phases, name):
+    """Record the wall and CPU time of a block as (name, wall, cpu)."""
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        yield
+    finally:
+        phases.append((name, time.perf_counter() - wall_start, time.process_time() - cpu_start))
+
+def sum_phases(phases):
+    """Add up (name, wall, cpu) records by name, in first-seen order."""
+    totals = {}
+    for name, wall, cpu in phases:
+        total_wall, total_cpu = totals.get(name, (0.0, 0.0))
+        totals[name] = (total_wall + wall, total_cpu + cpu)
+    return [(name, wall, cpu) for name, (wall, cpu) in totals.items()]
+
+def print_profile_report(phases, rule_profile, profiler, stats_path):
+    """Print phase and rule timings and dump the cProfile stats."""
+    print(f"\n⏱️  Phase timings")
+    print(f"{'Phase':<20}{'Wall':>12}{'CPU':>12}")
+    print("-" * 44)
+    for name, wall, cpu in phases:
+        print(f"{name:<20}{wall * 1000:>9.1f} ms{cpu * 1000:>9.1f} ms")
+    print(f"{'total':<20}{sum(p[1] for p in phases) * 1000:>9.1f} ms{sum(p[2] for p in phases) * 1000:>9.1f} ms")
+
+    print(f"\n🔎 Translation rules by time")
+    for line in rule_profile.report():
+        print(line)
+
+    stats = pstats.Stats(profiler)
+    stats.dump_stats(stats_path)
+    print(f"\n🐢 Top functions by own time")
+    top = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)[:10]
+    for (filename, line, function), (_, calls, own, cumulative, _) in top:
+        location = f"{os.path.basename(filename)}:{line}({function})"
+        print(f"  {own * 1000:>8.1f} ms own {cumulative * 1000:>8.1f} ms cum {calls:>8}  {location}")
+    print(f"\n  cProfile stats written to {stats_path} (python3 -m pstats {stats_path})")
+
+def create_directory_structure(locales):
+    """Create the mirror directory structure for every locale."""
     print("Creating directory structure...")
 
-    # Create main ja directory
-    JA_DIR.mkdir(exist_ok=True)
-
-    # Create subdirectories
-    (JA_DIR / 'cities').mkdir(exist_ok=True)
-    (JA_DIR / 'cameras').mkdir(exist_ok=True)
-
-    print("  ✅ Created /ja/, /ja/cities/, /ja/cameras/")
+    for lang in locales:
+        # Create the locale directory and its subdirectories
+        (BASE_DIR / lang / 'cities').mkdir(parents=True, exist_ok=True)
+        (BASE_DIR / lang / 'cameras').mkdir(exist_ok=True)
+        print(f"  ✅ Created /{lang}/, /{lang}/cities/, /{lang}/cameras/")
 
 def main():
-    """Main function to generate all Japanese pages."""
+    """Main function to generate every locale's pages."""
+    parser = argparse.ArgumentParser(description='Generate the translated mirrors of the site.')
+    parser.add_argument('--locales', help='comma-separated locales to build (default: every translations/*.json)')
+    parser.add_argument('--force', action='store_true',
+                        help='rebuild every page, ignoring the build manifest')
+    parser.add_argument('--profile', nargs='?', const=PROFILE_PATH, metavar='PSTATS',
+                        help=f'report phase and per-rule timings and write a cProfile dump (default: {PROFILE_PATH})')
+    add_jobs_argument(parser)
+    args = parser.parse_args()
+
     print("="*60)
     print("SakuraLiveCams i18n Page Generator")
     print("="*60)
 
-    # Load Japanese translations
+    jobs = args.jobs
+    profiler = None
+    if args.profile:
+        if jobs != 1:
+            print("⚠️  --profile runs in a single process, ignoring --jobs")
+            jobs = 1
+        rule_profile = RuleProfile()
+        set_profile(rule_profile)
+        profiler = cProfile.Profile()
+        profiler.enable()
+    phases = []
+
+    # Every locale is listed on every page, even when only some are rebuilt
+    locales = mirror_locales(BASE_DIR)
+    selected = [lang.strip() for lang in args.locales.split(',') if lang.strip()] if args.locales else locales
+    unknown = [lang for lang in selected if lang not in locales]
+    if unknown:
+        raise SystemExit(f"❌ No translations/<lang>.json for: {', '.join(unknown)}")
+
     print("\nLoading translations...")
-    ja_translations = load_translations('ja')
-    print("  ✅ Loaded Japanese translations")
+    with timed_phase(phases, 'translations'):
+        labels = switcher_labels(locales)
+    print(f"  ✅ Locales: {', '.join(f'{lang} ({label})' for lang, label in labels.items())}")
 
     # Create directory structure
-    create_directory_structure()
-
-    # Process all pages
-    process_index_page(ja_translations)
-    process_city_pages(ja_translations)
-    process_camera_pages(ja_translations)
-    process_utility_pages(ja_translations)
-
-    # Add hreflang to English pages
-    add_hreflang_to_english_pages()
+    create_directory_structure(selected)
+
+    # Load the build manifest so unchanged pages are skipped
+    manifest = BuildManifest(MANIFEST_PATH, GENERATOR_VERSION)
+    if args.force:
+        manifest.entries = {}
+
+    # One read of the English pages, shared by every locale
+    with timed_phase(phases, 'english hreflang'):
+        sources = load_source_pages(labels)
+
+    # Every locale's pages, fanned out over the workers
+    print(f"\nBuilding {len(selected)} locale(s)...")
+    started = time.perf_counter()
+    totals = {lang: {kind: [0, 0, 0] for kind in PAGE_SECTIONS} for lang in selected}
+    page_phases = []
+    build = partial(build_pages, labels=labels, manifest=manifest)
+    for result in run_pages(build, locale_work(selected, sources, jobs), jobs=jobs, chunksize=1):
+        print(result.output, end='')
+        if result.error:
+            raise result.error
+        lang = result.path[0]
+        built, counts, timings = result.value
+        for dest_path, build_key in built:
+            manifest.record(dest_path, build_key)
+        for kind, kind_counts in counts.items():
+            totals[lang][kind] = [total + count for total, count in zip(totals[lang][kind], kind_counts)]
+        page_phases.extend(timings)
+    manifest.save()
+
+    for lang, counts in totals.items():
+        print(f"🌐 {lang} ({labels[lang]})")
+        for kind, (created, unchanged, skipped) in counts.items():
+            print(f"  ✅ {kind:<8} {created:>4} written, {unchanged:>4} unchanged, {skipped:>4} up to date")
+    print(f"  ⏱️  Built in {time.perf_counter() - started:.2f}s")
+    # Each page kind summed over every locale
+    phases.extend(sum_phases(page_phases))
+
+    if profiler:
+        profiler.disable()
+        set_profile(None)
 
     print("\n" + "="*60)
     print("Generation complete!")
     print("="*60)
 
     # Count generated files
-    ja_files = list(JA_DIR.rglob('*.html'))
-    print(f"\nTotal Japanese pages generated: {len(ja_files)}")
-    print(f"  - Index: 1")
-    print(f"  - Cities: {len(list((JA_DIR / 'cities').glob('*.html')))}")
-    print(f"  - Cameras: {len(list((JA_DIR / 'cameras').glob('*.html')))}")
-    print(f"  - Utility: {len([f for f in JA_DIR.glob('*.html') if f.name != 'index.html'])}")
+    for lang in selected:
+        locale_dir = BASE_DIR / lang
+        print(f"\nTotal {lang} pages: {len(list(locale_dir.rglob('*.html')))}")
+        print(f"  - Index: 1")
+        print(f"  - Cities: {len(list((locale_dir / 'cities').glob('*.html')))}")
+        print(f"  - Cameras: {len(list((locale_dir / 'cameras').glob('*.html')))}")
+        print(f"  - Utility: {len([f for f in locale_dir.glob('*.html') if f.name != 'index.html'])}")
+
+    if profiler:
+        print_profile_report(phases, rule_profile, profiler, args.profile)
 
 if __name__ == '__main__':
     main()
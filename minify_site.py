@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Minify the site HTML for deployment.
+
+The generated pages keep the deep indentation, blank lines and section
+comments of their templates. minify_html() removes what a browser ignores:
+
+    - comments (<!-- Google Tag Manager -->, <!-- About Section -->, ...);
+      conditional comments (<!--[if ...]>) are kept
+    - whitespace-only gaps inside <head> and next to block-level tags;
+      other whitespace runs collapse to a single space, so inline spacing
+      renders the same
+    - JSON-LD bodies, re-serialized compactly with json.dumps (left alone
+      if they don't parse)
+
+Tags and their attributes are copied verbatim, and <pre>, <textarea>,
+<style> and non-JSON <script> bodies are not touched. The output depends
+only on the input, so repeated runs are byte-stable.
+
+The maintenance scripts patch the committed pages with patterns that
+expect the formatted markup, so run this on the deploy copy, after them
+and before compress_site.py.
+
+Usage:
+    python3 minify_site.py --dry-run        # report savings only
+    python3 minify_site.py --root _deploy --jobs 0
+"""
+
+import os
+import re
+import json
+import argparse
+from functools import partial
+
+from build_manifest import write_if_changed
+from page_batch import add_jobs_argument, run_pages
+from site_locales import find_pages
+from structured_data import JSON_LD_PATTERN
+
+# Raw-text regions, comments, tags and text, in document order
+TOKEN_PATTERN = re.compile(
+    r'(?P<raw><(?P<raw_tag>script|style|pre|textarea)\b[^>]*>.*?</(?P=raw_tag)\s*>)'
+    r'|(?P<comment><!--.*?-->)'
+    r'|(?P<tag></?[A-Za-z!][^>]*>)'
+    r'|(?P<text>[^<]+|<)',
+    re.DOTALL | re.IGNORECASE,
+)
+TAG_NAME_PATTERN = re.compile(r'</?([A-Za-z][A-Za-z0-9-]*)')
+# HTML whitespace only; \s would also eat non-breaking spaces
+WHITESPACE_PATTERN = re.compile(r'[ \t\n\r\f]+')
+
+# Elements whose surrounding whitespace never renders
+BLOCK_TAGS = {
+    'html', 'head', 'body', 'title', 'meta', 'link', 'base', 'noscript',
+    'header', 'footer', 'main', 'nav', 'section', 'article', 'aside',
+    'div', 'p', 'ul', 'ol', 'li', 'dl', 'dt', 'dd', 'h1', 'h2', 'h3', 'h4',
+    'h5', 'h6', 'table', 'thead', 'tbody', 'tfoot', 'tr', 'td', 'th',
+    'form', 'fieldset', 'figure', 'figcaption', 'blockquote', 'hr', 'br',
+    'iframe', 'select', 'option', '!doctype',
+}
+
+
+def compact_json_ld(match):
+    """Re-serialize one JSON-LD script body without whitespace."""
+    opening, body, closing = match.groups()
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return match.group(0)
+    return opening + json.dumps(data, ensure_ascii=False, separators=(',', ':')) + closing
+
+
+def tag_name(token):
+    """Lowercased element name of a tag token ('!doctype' for the doctype)."""
+    if token.startswith('<!'):
+        return '!doctype'
+    match = TAG_NAME_PATTERN.match(token)
+    return match.group(1).lower() if match else ''
+
+
+def minify_html(content):
+    """Minify an HTML document (see the module docstring for the rules)."""
+    tokens = []
+    for match in TOKEN_PATTERN.finditer(content):
+        tokens.append((match.lastgroup, match.group(0)))
+
+    # Block-ness of the tag on each side of every token
+    names = [tag_name(text) if kind in ('tag', 'raw') else None for kind, text in tokens]
+
+    output = []
+    previous_block = True
+    in_head = False
+    for i, (kind, text) in enumerate(tokens):
+        if kind == 'comment':
+            if text.startswith('<!--[if'):
+                output.append(text)
+            continue
+        if kind in ('tag', 'raw'):
+            if kind == 'raw' and names[i] == 'script':
+                text = JSON_LD_PATTERN.sub(compact_json_ld, text)
+            if names[i] == 'head':
+                in_head = not text.startswith('</')
+            output.append(text)
+            previous_block = names[i] in BLOCK_TAGS
+            continue
+
+        # Whitespace between head elements never renders
+        if in_head and not WHITESPACE_PATTERN.sub('', text):
+            continue
+
+        # Text: find the next tag, skipping comments that are about to vanish
+        next_block = True
+        for j in range(i + 1, len(tokens)):
+            if tokens[j][0] in ('tag', 'raw'):
+                next_block = names[j] in BLOCK_TAGS
+                break
+            if tokens[j][0] == 'text':
+                next_block = False
+                break
+        text = WHITESPACE_PATTERN.sub(' ', text)
+        if previous_block:
+            text = text.lstrip(' ')
+        if next_block:
+            text = text.rstrip(' ')
+        # Collapse across a removed comment: "a <!-- x --> b" -> "a b"
+        if text.startswith(' ') and output and output[-1].endswith(' '):
+            text = text[1:]
+        if text:
+            output.append(text)
+            previous_block = False
+    return ''.join(output).strip() + '\n'
+
+
+def minify_file(path, dry_run=False):
+    """Minify one page; returns (bytes before, bytes after)."""
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    minified = minify_html(content)
+    if not dry_run:
+        write_if_changed(path, minified)
+    return len(content.encode('utf-8')), len(minified.encode('utf-8'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Minify the site HTML for deployment.')
+    parser.add_argument('--root', default='.', help='site root to minify in place (default: current directory)')
+    parser.add_argument('--dry-run', action='store_true', help='report savings without writing files')
+    add_jobs_argument(parser)
+    args = parser.parse_args()
+
+    pages = find_pages(args.root)
+    print(f"🧹 Minifying {len(pages)} HTML pages{' (dry run)' if args.dry_run else ''}...")
+
+    stats = {}
+    changed_count = failed_count = 0
+    for result in run_pages(partial(minify_file, dry_run=args.dry_run), pages, jobs=args.jobs):
+        print(result.output, end='')
+        if result.error:
+            print(f"  ❌ {result.path}: {result.error}")
+            failed_count += 1
+            continue
+        before, after = result.value
+        if after != before:
+            changed_count += 1
+        directory = os.path.relpath(os.path.dirname(result.path), args.root)
+        row = stats.setdefault(directory, [0, 0, 0])
+        row[0] += 1
+        row[1] += before
+        row[2] += after
+
+    print(f"\n  {'Directory':<16} {'Pages':>6} {'Before':>12} {'After':>12} {'Saved':>7}")
+    totals = [0, 0, 0]
+    for directory in sorted(stats):
+        totals = [total + value for total, value in zip(totals, stats[directory])]
+        print_savings_row(directory, *stats[directory])
+    print_savings_row('Total', *totals)
+
+    print(f"\n{'='*60}")
+    print(f"Summary{' (dry run)' if args.dry_run else ''}:")
+    print(f"  ✅ Minified: {changed_count}")
+    print(f"  ⏭️  Already minimal: {len(pages) - changed_count - failed_count}")
+    if failed_count:
+        print(f"  ❌ Failed: {failed_count}")
+    print(f"{'='*60}")
+
+
+def print_savings_row(label, pages, before, after):
+    saved = 1 - after / before if before else 0
+    print(f"  {label:<16} {pages:>6} {before:>12,} {after:>12,} {saved:>7.1%}")
+
+if __name__ == '__main__':
+    main()
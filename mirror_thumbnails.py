@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Mirror the YouTube stream thumbnails into assets/thumbs/.
+
+Every card, facade and VideoObject on the site points at
+img.youtube.com/vi/<id>/hqdefault.jpg, so a full list view makes 200+
+third-party image requests for 480x360 JPEGs that are a quarter letterbox.
+This works from a local directory of thumbnails fetched beforehand (one
+<video id>.jpg/.png/.webp per stream; --list-missing prints the URLs still
+to fetch), crops the letterbox bars to 16:9, scales down to THUMB_WIDTH and
+re-encodes as WebP under a content-hashed name:
+
+    assets/thumbs/<video id>-<hash>.webp
+
+assets/thumbs/manifest.json maps video IDs to those files; the home page
+cards look thumbnails up there and fall back to YouTube for streams without
+one. Pages are then rewritten in place: <img src> of mirrored streams point
+at the local file (relative to the page) and JSON-LD thumbnailUrl at its
+absolute URL. Rewriting is idempotent, and a stream whose thumbnail changed
+gets its new name on the next run. The rewrite lives in site_thumbs.py so
+build_site.py and the 'thumbnails' stage of transform_pages.py apply it to
+the pages they render too, and regenerating a page keeps its mirrored
+thumbnails.
+
+Thumbnails already mirrored stay in the manifest when the source directory
+doesn't have them again, so a fetch of just the new streams is enough.
+--prune drops streams no longer in the catalog; their pages go back to the
+YouTube URL and the unreferenced files are deleted.
+
+Needs Pillow (pip install pillow).
+
+Usage:
+    python3 mirror_thumbnails.py --list-missing > urls.txt
+    python3 mirror_thumbnails.py --source _thumbs --jobs 0
+    python3 mirror_thumbnails.py               # re-apply the manifest to the pages
+    python3 mirror_thumbnails.py --prune
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+from functools import partial
+from pathlib import Path
+
+from build_manifest import content_hash, write_if_changed
+from check_catalog import video_id
+from page_batch import add_jobs_argument, run_pages
+from site_locales import find_pages
+from site_thumbs import THUMBS_DIR, MANIFEST_NAME, YOUTUBE_THUMB_URL, load_thumbs, rewrite_thumbnails
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+CATALOG_PATH = 'assets/output2.json'
+
+# Cards are at most ~420 CSS px wide; hqdefault itself is 480 px
+THUMB_WIDTH = 480
+THUMB_QUALITY = 70
+# Bump when the encoding settings change so every thumbnail is re-encoded
+THUMB_VERSION = '1'
+
+SOURCE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp')
+VIDEO_ID_PATTERN = re.compile(r'^[\w-]{11}$')
+
+
+def thumb_name(video, data):
+    """Content-hashed file name for a stream's thumbnail."""
+    return f'{video}-{content_hash(data, THUMB_WIDTH, THUMB_QUALITY, THUMB_VERSION)[:12]}.webp'
+
+
+def find_sources(source_dir):
+    """Map video ID -> fetched thumbnail path; also returns files that aren't named by a video ID."""
+    sources, skipped = {}, []
+    for path in sorted(Path(source_dir).iterdir()):
+        if path.suffix.lower() not in SOURCE_EXTENSIONS:
+            continue
+        if VIDEO_ID_PATTERN.match(path.stem):
+            sources[path.stem] = path
+        else:
+            skipped.append(path.name)
+    return sources, skipped
+
+
+def render_thumbnail(path, thumbs_dir):
+    """Crop one thumbnail to 16:9, scale it down and write it as WebP; returns (name, source bytes, output bytes)."""
+    name = thumb_name(path.stem, path.read_bytes())
+    target = os.path.join(thumbs_dir, name)
+    with Image.open(path) as image:
+        image = image.convert('RGB')
+        # hqdefault letterboxes a 16:9 frame into 4:3; keep the frame
+        height = min(image.height, round(image.width * 9 / 16))
+        top = (image.height - height) // 2
+        image = image.crop((0, top, image.width, top + height))
+        if image.width > THUMB_WIDTH:
+            image = image.resize((THUMB_WIDTH, round(height * THUMB_WIDTH / image.width)), Image.LANCZOS)
+        image.save(target, format='WEBP', quality=THUMB_QUALITY, method=6)
+    return name, os.path.getsize(path), os.path.getsize(target)
+
+
+def rewrite_page(path, root, thumbs):
+    """Point a page's thumbnail URLs at the mirrored files; returns URLs changed."""
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    depth = len(Path(os.path.relpath(path, root)).parts) - 1
+    content, count = rewrite_thumbnails(content, depth, thumbs)
+    write_if_changed(path, content)
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Mirror the YouTube thumbnails into assets/thumbs/ and point the pages at them.')
+    parser.add_argument('--root', default='.', help='site root (default: current directory)')
+    parser.add_argument('--source', help='directory of fetched thumbnails named <video id>.jpg')
+    parser.add_argument('--catalog', default=CATALOG_PATH, help=f'stream catalog (default: {CATALOG_PATH})')
+    parser.add_argument('--prune', action='store_true', help='drop thumbnails of streams no longer in the catalog')
+    parser.add_argument('--list-missing', action='store_true', help='print the URLs of catalog thumbnails not mirrored yet and exit')
+    add_jobs_argument(parser)
+    args = parser.parse_args()
+
+    with open(os.path.join(args.root, args.catalog), 'r', encoding='utf-8') as f:
+        catalog_ids = list(dict.fromkeys(filter(None, (video_id(entry.get('Link')) for entry in json.load(f)))))
+
+    thumbs_dir = os.path.join(args.root, THUMBS_DIR)
+    manifest_path = os.path.join(thumbs_dir, MANIFEST_NAME)
+    thumbs = load_thumbs(manifest_path)
+
+    if args.list_missing:
+        for video in catalog_ids:
+            if video not in thumbs:
+                print(YOUTUBE_THUMB_URL.format(video_id=video))
+        return
+
+    if Image is None:
+        print("❌ Pillow is not installed (pip install pillow)")
+        sys.exit(1)
+
+    os.makedirs(thumbs_dir, exist_ok=True)
+    sources, skipped = find_sources(args.source) if args.source else ({}, [])
+    for name in skipped:
+        print(f"  ⚠️  {name}: not named by a video ID, skipped")
+
+    print(f"🖼️  Mirroring {len(sources)} thumbnails into {THUMBS_DIR}/...")
+    names = {video: thumb_name(video, path.read_bytes()) for video, path in sources.items()}
+    stale = [path for video, path in sources.items()
+             if not os.path.exists(os.path.join(thumbs_dir, names[video]))]
+    previous = dict(thumbs)
+    thumbs.update(names)
+
+    source_total = thumb_total = failed_count = 0
+    for result in run_pages(partial(render_thumbnail, thumbs_dir=thumbs_dir), stale, jobs=args.jobs):
+        print(result.output, end='')
+        video = result.path.stem
+        if result.error:
+            print(f"  ❌ {result.path.name}: {result.error}")
+            # Keep whatever was mirrored before rather than a file that doesn't exist
+            if video in previous:
+                thumbs[video] = previous[video]
+            else:
+                del thumbs[video]
+            failed_count += 1
+            continue
+        _, source_size, thumb_size = result.value
+        source_total += source_size
+        thumb_total += thumb_size
+        print(f"  ✅ {video}: {source_size:,} -> {thumb_size:,} bytes")
+
+    if args.prune:
+        for video in sorted(set(thumbs) - set(catalog_ids)):
+            del thumbs[video]
+            print(f"  🗑️  Dropped {video} (not in the catalog)")
+
+    referenced = set(thumbs.values())
+    removed = sorted(name for name in os.listdir(thumbs_dir)
+                     if name != MANIFEST_NAME and name not in referenced)
+    for name in removed:
+        os.remove(os.path.join(thumbs_dir, name))
+
+    thumbs = dict(sorted(thumbs.items()))
+    write_if_changed(manifest_path, json.dumps(thumbs, ensure_ascii=False, separators=(',', ':')) + '\n')
+
+    print("\n📝 Rewriting thumbnail URLs...")
+    rewritten = {}
+    for page in find_pages(args.root):
+        count = rewrite_page(page, args.root, thumbs)
+        if count:
+            rewritten[os.path.relpath(page, args.root)] = count
+    for page, count in rewritten.items():
+        print(f"  ✅ {page}: {count} URLs")
+
+    missing = [video for video in catalog_ids if video not in thumbs]
+    print(f"\n{'='*60}")
+    print("Summary:")
+    print(f"  ✅ Encoded: {len(stale) - failed_count}")
+    print(f"  ⏭️  Cached: {len(sources) - len(stale)}")
+    if failed_count:
+        print(f"  ❌ Failed: {failed_count}")
+    if removed:
+        print(f"  🗑️  Removed: {len(removed)} unreferenced files")
+    print(f"  🖼️  Mirrored: {len(catalog_ids) - len(missing)} of {len(catalog_ids)} catalog streams")
+    if missing:
+        print(f"  ⚠️  Not fetched yet: {len(missing)} (--list-missing for the URLs)")
+    print(f"  📝 URLs rewritten: {sum(rewritten.values())} on {len(rewritten)} pages")
+    if source_total:
+        print(f"  📉 Encoded: {source_total:,} -> {thumb_total:,} bytes ({1 - thumb_total / source_total:.1%} saved)")
+    print(f"{'='*60}")
+
+if __name__ == '__main__':
+    main()
@@ -6,30 +6,30 @@ Adds power words and location-specific keywords to improve rankings.
 
 import os
 import re
+import argparse
 
-def optimize_title(file_path):
-    """Optimize the title tag in a camera page"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+from page_batch import add_jobs_argument, run_pages
 
+def optimize_title_content(content, file_path=None):
+    """Return content with an optimized title and description, or None if unchanged"""
     # Find existing title
     title_pattern = r'<title>([^<]+)</title>'
     title_match = re.search(title_pattern, content)
 
     if not title_match:
-        return False
+        return None
 
     existing_title = title_match.group(1)
 
     # Skip if already optimized with "Watch" at start
     if existing_title.startswith('Watch '):
-        return False
+        return None
 
     # Extract camera name and city from existing title
     # Format is usually: "Camera Name - Live Webcam from City, Japan | SakuraLive"
     parts = existing_title.split(' - ')
     if len(parts) < 2:
-        return False
+        return None
 
     camera_name = parts[0].strip()
 
@@ -58,16 +58,31 @@ def optimize_title(file_path):
                     f'<meta name="description" content="{new_desc}"'
                 )
 
-            # Write back
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            return content
+
+    return None
 
-            return True
+def optimize_title(file_path):
+    """Optimize the title tag in a camera page"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
 
-    return False
+    content = optimize_title_content(content, file_path)
+    if content is None:
+        return False
+
+    # Write back
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+    return True
 
 def main():
     """Process all camera HTML files"""
+    parser = argparse.ArgumentParser(description='Optimize camera page title tags.')
+    add_jobs_argument(parser)
+    args = parser.parse_args()
+
     cameras_dir = 'cameras'
 
     if not os.path.exists(cameras_dir):
@@ -79,15 +94,15 @@ def main():
 
     updated_count = 0
 
-    for filename in camera_files:
-        file_path = os.path.join(cameras_dir, filename)
-        try:
-            if optimize_title(file_path):
-                updated_count += 1
-                if updated_count % 50 == 0:
-                    print(f"  ✓ Optimized {updated_count} titles...")
-        except Exception as e:
-            print(f"  ❌ Error processing {filename}: {e}")
+    file_paths = [os.path.join(cameras_dir, filename) for filename in camera_files]
+    for result in run_pages(optimize_title, file_paths, jobs=args.jobs):
+        print(result.output, end='')
+        if result.error:
+            print(f"  ❌ Error processing {os.path.basename(result.path)}: {result.error}")
+        elif result.value:
+            updated_count += 1
+            if updated_count % 50 == 0:
+                print(f"  ✓ Optimized {updated_count} titles...")
 
     print(f"\n✅ Optimized {updated_count} camera page titles!")
     print(f"\nTitle improvements:")
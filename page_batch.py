@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Shared page-batch runner for the maintenance scripts.
+
+Every script applies a per-file function (read, regex/HTMLParser work, write)
+to a list of pages. run_pages() runs that function serially or fans the pages
+out over a ProcessPoolExecutor in chunks, and hands the per-file results back
+to the parent in input order so each script can keep printing the same
+progress lines and summaries. Anything a worker prints is captured and
+replayed by the parent, so parallel runs read exactly like serial ones.
+
+Scripts expose the pool through a --jobs option (see add_jobs_argument).
+"""
+
+import io
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+
+# value: what the page function returned, output: text it printed (parallel
+# runs only), error: the exception it raised, if any
+PageResult = namedtuple('PageResult', 'path value output error')
+
+
+def add_jobs_argument(parser):
+    """Add the standard --jobs option to an argparse parser."""
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='number of worker processes (0 = one per CPU, default: 1)')
+
+
+def resolve_jobs(jobs):
+    """Turn a --jobs value into a worker count."""
+    if not jobs or jobs < 1:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def _run_page(func, path):
+    """Run func on one page in a worker, capturing what it prints."""
+    buffer = io.StringIO()
+    value = error = None
+    with redirect_stdout(buffer):
+        try:
+            value = func(path)
+        except Exception as e:
+            error = e
+    return PageResult(path, value, buffer.getvalue(), error)
+
+
+def _run_chunk(func, paths):
+    return [_run_page(func, path) for path in paths]
+
+
+def _chunks(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def run_pages(func, paths, jobs=1, chunksize=None):
+    """Apply func to every path and yield a PageResult per page, in order.
+
+    func must be a module-level function (or functools.partial of one) so it
+    can be sent to worker processes. With jobs == 1 pages are processed in
+    this process and func prints directly.
+    """
+    paths = list(paths)
+    jobs = min(resolve_jobs(jobs), len(paths)) if paths else 1
+
+    if jobs == 1:
+        for path in paths:
+            try:
+                yield PageResult(path, func(path), '', None)
+            except Exception as e:
+                yield PageResult(path, None, '', e)
+        return
+
+    if chunksize is None:
+        chunksize = max(1, len(paths) // (jobs * 4))
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(_run_chunk, func, chunk)
+                   for chunk in _chunks(paths, chunksize)]
+        for future in futures:
+            yield from future.result()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Content-accurate lastmod dates for the sitemap.
+
+LastmodStore keeps, for every URL, a fingerprint of the page's meaningful
+content and the date that fingerprint last changed. Volatile bits that
+change without the page changing (copyright year, the JST clock
+placeholder, whitespace) are masked before hashing, so a deploy only moves
+lastmod for pages whose content really changed and crawlers don't re-fetch
+the whole site every time.
+
+The store lives in .lastmod.json at the site root. Unlike the build caches
+it is history, not a cache: commit it so dates survive fresh checkouts.
+URLs new to the store take their date from the previous sitemap when one is
+given, so the first run does not reset every date.
+"""
+
+import os
+import re
+import json
+from datetime import date
+
+from build_manifest import content_hash, write_if_changed
+
+STORE_NAME = '.lastmod.json'
+
+# Bump when the normalization changes; fingerprints are then re-seeded
+# without moving any dates
+FINGERPRINT_VERSION = '1'
+
+VOLATILE_PATTERNS = [
+    (re.compile(r'(&copy;|©)\s*\d{4}(\s*[-–]\s*\d{4})?'), r'\1 YEAR'),
+    (re.compile(r'(<span id="copyright-year">)[^<]*(</span>)'), r'\1\2'),
+    (re.compile(r'(id="current-time"[^>]*>)[^<]*(<)'), r'\1\2'),
+    (re.compile(r'\s+'), ' '),
+]
+
+LASTMOD_PATTERN = re.compile(r'<loc>([^<]+)</loc>.*?<lastmod>([^<]+)</lastmod>', re.DOTALL)
+
+
+def page_fingerprint(content):
+    """Hash of a page with the volatile bits masked out."""
+    for pattern, replacement in VOLATILE_PATTERNS:
+        content = pattern.sub(replacement, content)
+    return content_hash(FINGERPRINT_VERSION, content)
+
+
+def page_file(url_path):
+    """Site-relative file behind a URL path ('' and 'ja/' are index pages)."""
+    if not url_path or url_path.endswith('/'):
+        return f'{url_path}index.html'
+    return url_path
+
+
+def read_sitemap_lastmods(paths, base_url):
+    """Map URL path -> lastmod from existing sitemap files."""
+    lastmods = {}
+    for path in paths:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except FileNotFoundError:
+            continue
+        for loc, lastmod in LASTMOD_PATTERN.findall(content):
+            if loc.startswith(base_url):
+                lastmods[loc[len(base_url):].lstrip('/')] = lastmod
+    return lastmods
+
+
+class LastmodStore:
+    """URL path -> (content fingerprint, lastmod) store persisted as JSON."""
+
+    def __init__(self, path, today=None, seed=None):
+        self.path = path
+        self.today = today or date.today().isoformat()
+        self.seed = seed or {}
+        self.pages = {}
+        self.changed = []
+        self.removed = []
+        self.seen = set()
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.pages = json.load(f).get('pages', {})
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.pages = {}
+
+    def save(self):
+        """Persist the store, sorted so it diffs cleanly."""
+        data = {'pages': self.pages}
+        return write_if_changed(self.path, json.dumps(data, indent=1, sort_keys=True) + '\n')
+
+    def lastmod(self, url_path, content):
+        """Return the lastmod for a page, advancing it if the content changed."""
+        self.seen.add(url_path)
+        fingerprint = page_fingerprint(content)
+        entry = self.pages.get(url_path)
+
+        if entry is None:
+            # First sighting: keep the date the previous sitemap had, if any
+            lastmod = self.seed.get(url_path)
+            if lastmod is None:
+                self.changed.append(url_path)
+                lastmod = self.today
+        elif entry['hash'] == fingerprint or entry.get('version') != FINGERPRINT_VERSION:
+            lastmod = entry['lastmod']
+        else:
+            self.changed.append(url_path)
+            lastmod = self.today
+
+        self.pages[url_path] = {'hash': fingerprint, 'lastmod': lastmod, 'version': FINGERPRINT_VERSION}
+        return lastmod
+
+    def file_lastmod(self, root, url_path):
+        """lastmod for the file behind a URL, or None if the file is missing."""
+        try:
+            with open(os.path.join(root, page_file(url_path)), 'r', encoding='utf-8') as f:
+                return self.lastmod(url_path, f.read())
+        except FileNotFoundError:
+            return None
+
+    def prune(self):
+        """Forget URLs not seen in this run; return them."""
+        self.removed = sorted(set(self.pages) - self.seen)
+        for url_path in self.removed:
+            del self.pages[url_path]
+        return self.removed
+
+
+def print_change_report(changed, removed, base_url, output=None):
+    """Print the changed and removed URLs (for CDN purging), optionally to a file."""
+    urls = [f'{base_url}/{path}' for path in changed + removed]
+    if changed:
+        print(f"\n🔄 Changed URLs ({len(changed)}):")
+        for path in changed:
+            print(f"  {base_url}/{path}")
+    if removed:
+        print(f"\n🗑️  Removed URLs ({len(removed)}):")
+        for path in removed:
+            print(f"  {base_url}/{path}")
+    if not urls:
+        print("\n⏭️  No URL content changed")
+    if output:
+        write_if_changed(output, ''.join(f'{url}\n' for url in urls))
+        print(f"  Purge list written to {output}")
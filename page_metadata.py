@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Parse-once page metadata shared by the maintenance scripts.
+
+The scripts used to carry their own HTMLParser subclasses, each feeding the
+whole page just to find the h1, the city and the tag badges. get_page_metadata()
+scans a page once and returns a compact PageMetadata record with everything
+they need. Records are memoized by content hash, in memory and in a small
+on-disk cache (one JSON file per page version), so re-running a script over
+unchanged pages skips the parse entirely. Entries no run has used for
+CACHE_MAX_AGE are evicted, in one sweep at most once a day, so the cache
+holds whatever pages the scripts actually work on, however many there are.
+"""
+
+import os
+import re
+import json
+import time
+from collections import namedtuple
+from html.parser import HTMLParser
+from pathlib import Path
+
+from build_manifest import content_hash
+
+# Bump when the parser or the record layout changes to invalidate the cache
+PARSER_VERSION = '1'
+CACHE_DIR = Path(__file__).resolve().parent / '.page-cache' / 'metadata'
+# Entries unused this long are dropped; the sweep runs at most once per interval
+CACHE_MAX_AGE = 30 * 24 * 3600
+CACHE_PRUNE_INTERVAL = 24 * 3600
+PRUNE_MARKER = CACHE_DIR / '.pruned'
+
+# camera_name:     first h1 text (the city heading on city pages)
+# breadcrumb_city: first <nav> text that isn't Home, "/" or View All
+# city_name:       first text of a ../cities/ link, ", Japan" stripped
+# city_slug:       slug of the first ../cities/*.html link
+# tags:            tag badge texts, in page order, without duplicates
+# video_id:        YouTube ID of the embedded player
+# canonical_url:   <link rel="canonical"> href
+# json_ld:         raw text of every application/ld+json script block
+PageMetadata = namedtuple(
+    'PageMetadata',
+    'camera_name breadcrumb_city city_name city_slug tags video_id canonical_url json_ld'
+)
+
+TAG_CLASSES = ('bg-blue-500/20', 'text-blue-400')
+TAG_PATTERN = re.compile(r'<span[^>]*text-blue-400[^>]*>([^<]+)</span>')
+CITY_HREF_PATTERN = re.compile(r'cities/([^.]+)\.html')
+VIDEO_ID_PATTERN = re.compile(r'youtube\.com/(?:embed|live)/([^"?&/]+)')
+
+_memo = {}
+_pruned = False
+
+
+class PageMetadataParser(HTMLParser):
+    """Collect every field of PageMetadata in a single pass."""
+    def __init__(self):
+        super().__init__()
+        self.camera_name = None
+        self.breadcrumb_city = None
+        self.city_name = None
+        self.city_slug = None
+        self.tags = []
+        self.video_id = None
+        self.canonical_url = None
+        self.json_ld = []
+        self.in_h1 = False
+        self.in_nav = False
+        self.in_city_link = False
+        self.in_tag_span = False
+        self.tag_depth = 0
+        self.ld_parts = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs_dict = dict(attrs)
+        if tag == 'h1':
+            self.in_h1 = True
+        elif tag == 'nav':
+            self.in_nav = True
+        elif tag == 'a':
+            href = attrs_dict.get('href') or ''
+            if '../cities/' in href:
+                self.in_city_link = True
+                city_match = CITY_HREF_PATTERN.search(href)
+                if city_match and not self.city_slug:
+                    self.city_slug = city_match.group(1)
+        elif tag == 'span':
+            css_class = attrs_dict.get('class') or ''
+            if any(name in css_class for name in TAG_CLASSES):
+                self.in_tag_span = True
+                self.tag_depth += 1
+        elif tag == 'link':
+            if attrs_dict.get('rel') == 'canonical' and not self.canonical_url:
+                self.canonical_url = attrs_dict.get('href')
+        elif tag == 'iframe':
+            video_match = VIDEO_ID_PATTERN.search(attrs_dict.get('src') or '')
+            if video_match and not self.video_id:
+                self.video_id = video_match.group(1)
+        elif tag == 'script':
+            if attrs_dict.get('type') == 'application/ld+json':
+                self.ld_parts = []
+
+    def handle_endtag(self, tag):
+        if tag == 'h1':
+            self.in_h1 = False
+        elif tag == 'nav':
+            self.in_nav = False
+        elif tag == 'a':
+            self.in_city_link = False
+        elif tag == 'span' and self.in_tag_span:
+            self.tag_depth -= 1
+            if self.tag_depth == 0:
+                self.in_tag_span = False
+        elif tag == 'script' and self.ld_parts is not None:
+            self.json_ld.append(''.join(self.ld_parts).strip())
+            self.ld_parts = None
+
+    def handle_data(self, data):
+        if self.ld_parts is not None:
+            self.ld_parts.append(data)
+            return
+        data = data.strip()
+        if not data:
+            return
+        if self.in_h1 and not self.camera_name:
+            self.camera_name = data
+        if self.in_nav and not self.breadcrumb_city and data not in ('Home', '/', 'View All'):
+            city = data.replace(', Japan', '')
+            if city and city not in ('Home', '/'):
+                self.breadcrumb_city = city
+        if self.in_city_link and not self.city_name and not data.startswith('View All'):
+            self.city_name = data.replace(', Japan', '')
+        if self.in_tag_span:
+            self.tags.append(data)
+
+    def metadata(self, content):
+        """Build the PageMetadata record once the page has been fed."""
+        # Badges the parser missed (malformed nesting) are picked up by regex
+        tags = self.tags + TAG_PATTERN.findall(content)
+        video_id = self.video_id
+        if not video_id:
+            video_match = VIDEO_ID_PATTERN.search(content)
+            video_id = video_match.group(1) if video_match else None
+        return PageMetadata(
+            self.camera_name, self.breadcrumb_city, self.city_name, self.city_slug,
+            tuple(dict.fromkeys(tags)), video_id, self.canonical_url, tuple(self.json_ld)
+        )
+
+
+def parse_page_metadata(content):
+    """Parse a page without touching the cache."""
+    parser = PageMetadataParser()
+    parser.feed(content)
+    parser.close()
+    return parser.metadata(content)
+
+
+def _cache_file(key):
+    return CACHE_DIR / key[:2] / f'{key}.json'
+
+
+def _load_cached(key):
+    path = _cache_file(key)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            fields = json.load(f)
+        fields['tags'] = tuple(fields['tags'])
+        fields['json_ld'] = tuple(fields['json_ld'])
+        metadata = PageMetadata(**fields)
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+    # Mark the entry as recently used for _prune_cache()
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return metadata
+
+
+def _prune_cache():
+    """Drop entries unused for CACHE_MAX_AGE, unless another run swept recently."""
+    now = time.time()
+    try:
+        if now - PRUNE_MARKER.stat().st_mtime < CACHE_PRUNE_INTERVAL:
+            return
+    except OSError:
+        pass
+    # Claim the sweep first so parallel workers don't all walk the cache
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    PRUNE_MARKER.touch()
+    for path in CACHE_DIR.glob('*/*'):
+        try:
+            if now - path.stat().st_mtime > CACHE_MAX_AGE:
+                path.unlink()
+        except OSError:
+            pass
+
+
+def _store_cached(key, metadata):
+    # Write to a temp file and rename, so parallel workers never see partial JSON
+    global _pruned
+    path = _cache_file(key)
+    try:
+        if not _pruned:
+            _pruned = True
+            _prune_cache()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(metadata._asdict(), f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def get_page_metadata(content, use_cache=True):
+    """Return the PageMetadata for a page's HTML, memoized by content hash."""
+    key = content_hash(PARSER_VERSION, content)
+    metadata = _memo.get(key)
+    if metadata is not None:
+        return metadata
+
+    if use_cache:
+        metadata = _load_cached(key)
+    if metadata is None:
+        metadata = parse_page_metadata(content)
+        if use_cache:
+            _store_cached(key, metadata)
+
+    _memo[key] = metadata
+    return metadata
+
+
+def read_page_metadata(file_path, use_cache=True):
+    """Read a page from disk and return its PageMetadata."""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return get_page_metadata(f.read(), use_cache)
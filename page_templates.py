@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Precompiled page templates.
+
+Templates use string.Template syntax ($name or ${name}, $$ for a literal $),
+but are parsed only once: the source is split into its static text segments
+and slot positions, and the compiled form is cached by the hash of the
+template text. Rendering copies the part list, drops the values into the
+slot positions and joins it once, so rendering thousands of pages does not
+re-scan or re-build the large HTML blocks.
+
+    FOOTER = PageTemplate('<p>&copy; $year $site</p>')
+    FOOTER.render(year=2026, site='SakuraLive')
+
+Other slot syntaxes can be compiled by passing a pattern with a 'named'
+group, e.g. the {camera} placeholders of the translation files:
+
+    TITLE = PageTemplate('{camera} live', pattern=re.compile(r'\{(?P<named>camera)\}'))
+"""
+
+import re
+
+from build_manifest import content_hash
+
+SLOT_PATTERN = re.compile(r'\$(?:(?P<escaped>\$)|(?P<named>[_a-z][_a-z0-9]*)|\{(?P<braced>[_a-z][_a-z0-9]*)\})', re.IGNORECASE)
+
+# template hash -> (parts, slots); parts holds the static segments with None
+# at each slot, slots is a tuple of (part index, slot name)
+_compiled = {}
+_stats = {'hits': 0, 'misses': 0}
+
+
+def compile_template(source, pattern=SLOT_PATTERN):
+    """Split template text into static parts and slots, cached by content hash."""
+    key = content_hash(pattern.pattern, source)
+    compiled = _compiled.get(key)
+    if compiled is not None:
+        _stats['hits'] += 1
+        return compiled
+    _stats['misses'] += 1
+
+    parts = []
+    slots = []
+    text = []
+    pos = 0
+    for match in pattern.finditer(source):
+        groups = match.groupdict()
+        text.append(source[pos:match.start()])
+        pos = match.end()
+        if groups.get('escaped'):
+            text.append('$')
+            continue
+        parts.append(''.join(text))
+        text = []
+        slots.append((len(parts), groups.get('named') or groups.get('braced')))
+        parts.append(None)
+    text.append(source[pos:])
+    parts.append(''.join(text))
+
+    compiled = (tuple(parts), tuple(slots))
+    _compiled[key] = compiled
+    return compiled
+
+
+def cache_info():
+    """Return compile cache statistics (hits, misses, size)."""
+    return {'hits': _stats['hits'], 'misses': _stats['misses'], 'size': len(_compiled)}
+
+
+class PageTemplate:
+    """A template compiled once into static segments and slot positions."""
+
+    def __init__(self, source, pattern=SLOT_PATTERN):
+        self.source = source
+        self.parts, self.slots = compile_template(source, pattern)
+        self.names = frozenset(name for _, name in self.slots)
+
+    def render(self, mapping=None, **values):
+        """Fill every slot and join the parts. Missing names raise KeyError."""
+        if mapping:
+            values = {**mapping, **values}
+        parts = list(self.parts)
+        for index, name in self.slots:
+            value = values[name]
+            parts[index] = value if isinstance(value, str) else str(value)
+        return ''.join(parts)
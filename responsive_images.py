@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Responsive variants for the site images.
+
+The city card images (assets/images/city-images/*.webp) and
+assets/images/thumbnail.jpg are single files served at full size to every
+device. This renders each at several widths (never wider than the source)
+as AVIF and WebP into assets/images/responsive/, then rewrites the <img>
+tags that show them on the home and city pages, in every language, into
+
+    <picture>
+        <source type="image/avif" srcset="...-320.avif 320w, ..." sizes="...">
+        <img src="...-640.webp" srcset="...-320.webp 320w, ..." sizes="..."
+             width=".." height=".." loading="lazy" decoding="async" alt=".." class="..">
+    </picture>
+
+keeping the page's own URL style (relative or absolute) and the tag's other
+attributes. Rewriting is idempotent: a generated <picture> is rebuilt from
+its <img>, not wrapped again.
+
+Variants are cached in .image-manifest.json by source hash and encoder
+settings, so only new or edited sources are re-encoded; encoding runs on
+the page_batch pool (--jobs). The report compares each source with the
+variant a phone-sized screen downloads.
+
+Needs Pillow (pip install pillow); AVIF is skipped with a warning when the
+installed Pillow can't encode it.
+
+Usage:
+    python3 responsive_images.py
+    python3 responsive_images.py --jobs 0 --force
+"""
+
+import os
+import re
+import sys
+import argparse
+from functools import partial
+from pathlib import Path
+
+from build_manifest import BuildManifest, content_hash, write_if_changed
+from page_batch import add_jobs_argument, run_pages
+from site_locales import mirror_locales
+
+try:
+    from PIL import Image, features
+except ImportError:
+    Image = features = None
+
+SOURCE_IMAGES = ['assets/images/city-images/*.webp', 'assets/images/thumbnail.jpg']
+OUTPUT_DIR = 'assets/images/responsive'
+MANIFEST_PATH = '.image-manifest.json'
+# English pages showing the images; each language mirror has the same ones
+PAGE_GLOBS = ['index.html', 'cities/*.html']
+
+WIDTHS = [320, 480, 640, 960, 1280]
+# Width a phone-sized screen picks; used for the fallback src and the report
+FALLBACK_WIDTH = 640
+QUALITY = {'avif': 50, 'webp': 75}
+# Bump when the encoding settings change so every variant is re-encoded
+IMAGE_VERSION = '1'
+
+# City cards: one column on phones, two on tablets, three on desktops
+SIZES = '(min-width: 1024px) 33vw, (min-width: 768px) 50vw, 100vw'
+
+MIME_TYPES = {'avif': 'image/avif', 'webp': 'image/webp'}
+# Attributes this stage manages; everything else on the <img> is kept
+MANAGED_ATTRS = {'src', 'srcset', 'sizes', 'width', 'height', 'loading', 'decoding'}
+ATTR_PATTERN = re.compile(r'([a-zA-Z-]+)(?:\s*=\s*("[^"]*"|\'[^\']*\'))?')
+
+
+def available_formats():
+    """Formats the installed Pillow can encode, best first."""
+    return [fmt for fmt in ('avif', 'webp') if features.check(fmt)]
+
+
+def find_sources(root):
+    """Source images, site-relative, in a stable order."""
+    sources = []
+    for pattern in SOURCE_IMAGES:
+        sources.extend(sorted(path.relative_to(root).as_posix() for path in Path(root).glob(pattern)))
+    return sources
+
+
+def variant_widths(source_width):
+    """Widths to render for a source: the standard widths below it, plus its own."""
+    widths = [width for width in WIDTHS if width < source_width]
+    return widths + [source_width] if source_width <= WIDTHS[-1] else widths
+
+
+def variant_name(source, width, fmt):
+    """Output file name for one variant of a source image."""
+    return f'{Path(source).stem}-{width}.{fmt}'
+
+
+def render_variants(path, root, formats):
+    """Encode every variant of one source; returns (source size, [(name, width, height, bytes)])."""
+    output_dir = os.path.join(root, OUTPUT_DIR)
+    source = os.path.relpath(path, root)
+    variants = []
+    with Image.open(path) as image:
+        image = image.convert('RGB')
+        for width in variant_widths(image.width):
+            height = round(image.height * width / image.width)
+            resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+            for fmt in formats:
+                target = os.path.join(output_dir, variant_name(source, width, fmt))
+                resized.save(target, format=fmt.upper(), quality=QUALITY[fmt])
+                variants.append((variant_name(source, width, fmt), width, height, os.path.getsize(target)))
+    return os.path.getsize(path), variants
+
+
+def image_dimensions(path):
+    """(width, height) of an image file."""
+    with Image.open(path) as image:
+        return image.size
+
+
+def parse_attrs(tag):
+    """Ordered attributes of an <img> tag."""
+    return [(name.lower(), value[1:-1] if value else None)
+            for name, value in ATTR_PATTERN.findall(tag[len('<img'):].rstrip('/>'))]
+
+
+def render_picture(attrs, url_prefix, source, dimensions, formats, indent):
+    """<picture> markup for one image with the page's other <img> attributes."""
+    widths = variant_widths(dimensions[0])
+    height = dimensions[1]
+
+    def srcset(fmt):
+        return ', '.join(f'{url_prefix}{variant_name(source, width, fmt)} {width}w' for width in widths)
+
+    fallback_format = formats[-1]
+    fallback_width = max([w for w in widths if w <= FALLBACK_WIDTH] or widths[:1])
+    kept = ''.join(f' {name}="{value}"' if value is not None else f' {name}'
+                   for name, value in attrs if name not in MANAGED_ATTRS)
+
+    lines = ['<picture>']
+    for fmt in formats[:-1]:
+        lines.append(f'{indent}    <source type="{MIME_TYPES[fmt]}" srcset="{srcset(fmt)}" sizes="{SIZES}">')
+    lines.append(f'{indent}    <img src="{url_prefix}{variant_name(source, fallback_width, fallback_format)}"'
+                 f' srcset="{srcset(fallback_format)}" sizes="{SIZES}"'
+                 f' width="{dimensions[0]}" height="{height}" loading="lazy" decoding="async"{kept}>')
+    lines.append(f'{indent}</picture>')
+    return '\n'.join(lines)
+
+
+def rewrite_page(path, sources, dimensions, formats):
+    """Point a page's <img> tags for the source images at their variants; returns images rewritten."""
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    names = '|'.join(re.escape(source.split('assets/images/', 1)[1]) for source in sources)
+    variants = '|'.join(re.escape(Path(source).stem) for source in sources)
+    # A bare <img> for a source, or a <picture> this stage generated earlier
+    pattern = re.compile(
+        r'(?P<indent>[ \t]*)(?:<picture>\s*(?:<source\b[^>]*>\s*)*(?P<pic_img><img\b[^>]*'
+        r'src="(?P<pic_prefix>[^"]*?)images/responsive/(?P<variant>' + variants + r')-\d+\.\w+"[^>]*>)\s*</picture>'
+        r'|(?P<img><img\b[^>]*src="(?P<prefix>[^"]*?)images/(?P<name>' + names + r')"[^>]*>))'
+    )
+    by_name = {source.split('assets/images/', 1)[1]: source for source in sources}
+    by_stem = {Path(source).stem: source for source in sources}
+    count = 0
+
+    def replace(match):
+        nonlocal count
+        indent = match.group('indent')
+        if match.group('img'):
+            tag, prefix, source = match.group('img'), match.group('prefix'), by_name[match.group('name')]
+        else:
+            tag, prefix, source = match.group('pic_img'), match.group('pic_prefix'), by_stem[match.group('variant')]
+        count += 1
+        url_prefix = f'{prefix}images/responsive/'
+        return indent + render_picture(parse_attrs(tag), url_prefix, source, dimensions[source], formats, indent)
+
+    write_if_changed(path, pattern.sub(replace, content))
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Render responsive image variants and rewrite <img> tags.')
+    parser.add_argument('--root', default='.', help='site root (default: current directory)')
+    parser.add_argument('--force', action='store_true', help='re-encode every variant')
+    add_jobs_argument(parser)
+    args = parser.parse_args()
+
+    if Image is None:
+        print("❌ Pillow is not installed (pip install pillow)")
+        sys.exit(1)
+    formats = available_formats()
+    if 'avif' not in formats:
+        print("⚠️  This Pillow can't encode AVIF; writing WebP variants only")
+    if not formats:
+        print("❌ This Pillow can't encode WebP either")
+        sys.exit(1)
+
+    sources = find_sources(args.root)
+    os.makedirs(os.path.join(args.root, OUTPUT_DIR), exist_ok=True)
+    manifest = BuildManifest(os.path.join(args.root, MANIFEST_PATH), f'{IMAGE_VERSION}:{",".join(formats)}')
+    if args.force:
+        manifest.entries = {}
+
+    print(f"🖼️  Rendering {', '.join(formats)} variants for {len(sources)} images...")
+    keys = {}
+    stale = []
+    for source in sources:
+        path = os.path.join(args.root, source)
+        keys[source] = content_hash(Path(path).read_bytes(), WIDTHS, QUALITY)
+        if not manifest.is_current(path, keys[source]):
+            stale.append(path)
+
+    failed_count = 0
+    for result in run_pages(partial(render_variants, root=args.root, formats=formats), stale, jobs=args.jobs):
+        print(result.output, end='')
+        source = os.path.relpath(result.path, args.root)
+        if result.error:
+            print(f"  ❌ {source}: {result.error}")
+            failed_count += 1
+            continue
+        manifest.record(result.path, keys[source])
+        print(f"  ✅ {source}: {len(result.value[1])} variants")
+    manifest.save()
+
+    dimensions = {source: image_dimensions(os.path.join(args.root, source)) for source in sources}
+
+    print("\n📝 Rewriting <img> tags...")
+    pages = []
+    globs = PAGE_GLOBS + [f'{lang}/{pattern}' for lang in mirror_locales(args.root) for pattern in PAGE_GLOBS]
+    for pattern in globs:
+        pages.extend(sorted(str(path) for path in Path(args.root).glob(pattern)))
+    rewritten = {}
+    for page in pages:
+        count = rewrite_page(page, sources, dimensions, formats)
+        if count:
+            rewritten[os.path.relpath(page, args.root)] = count
+            print(f"  ✅ {os.path.relpath(page, args.root)}: {count} images")
+
+    # What a phone downloads now versus the single original file
+    print(f"\n  {'Image':<42} {'Source':>9} " + ' '.join(f"{f'{fmt} {FALLBACK_WIDTH}w':>10}" for fmt in formats) + f" {'Saved':>7}")
+    source_total = best_total = 0
+    for source in sources:
+        source_size = os.path.getsize(os.path.join(args.root, source))
+        width = max([w for w in variant_widths(dimensions[source][0]) if w <= FALLBACK_WIDTH]
+                    or variant_widths(dimensions[source][0])[:1])
+        sizes = [os.path.getsize(os.path.join(args.root, OUTPUT_DIR, variant_name(source, width, fmt)))
+                 for fmt in formats]
+        source_total += source_size
+        best_total += min(sizes)
+        print(f"  {source:<42} {source_size:>9,} " + ' '.join(f"{size:>10,}" for size in sizes)
+              + f" {1 - min(sizes) / source_size:>7.1%}")
+
+    print(f"\n{'='*60}")
+    print("Summary:")
+    print(f"  ✅ Encoded: {len(stale) - failed_count}")
+    print(f"  ⏭️  Cached: {len(sources) - len(stale)}")
+    if failed_count:
+        print(f"  ❌ Failed: {failed_count}")
+    print(f"  📝 Images rewritten: {sum(rewritten.values())} on {len(rewritten)} pages")
+    print(f"  📉 Phone download: {source_total:,} -> {best_total:,} bytes "
+          f"({1 - best_total / source_total if source_total else 0:.1%} saved)")
+    print(f"{'='*60}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Languages the site is published in.
+
+English pages are the source; every other translations/<lang>.json is
+mirrored under /<lang>/ by generate_i18n_pages.py. Scripts that walk or
+link the mirrors ask here instead of hard-coding 'ja', so adding a
+translation file is all it takes to add a language. find_pages() lists the
+pages of every language for the scripts that process the whole site.
+"""
+
+import os
+
+SOURCE_LANG = 'en'
+TRANSLATIONS_DIR = 'translations'
+
+# English page directories; each language mirror has the same ones under /<lang>/
+HTML_DIRS = ['.', 'cameras', 'cities']
+
+
+def mirror_locales(root='.'):
+    """Language codes that get a /<lang>/ mirror, sorted."""
+    directory = os.path.join(root, TRANSLATIONS_DIR)
+    if not os.path.isdir(directory):
+        return []
+    return sorted(name[:-len('.json')] for name in os.listdir(directory)
+                  if name.endswith('.json') and name[:-len('.json')] != SOURCE_LANG)
+
+
+def site_locales(root='.'):
+    """The source language followed by every mirrored language."""
+    return [SOURCE_LANG] + mirror_locales(root)
+
+
+def find_pages(root='.'):
+    """HTML pages under the site directories, in a stable order."""
+    pages = []
+    mirror_dirs = [os.path.normpath(os.path.join(lang, directory))
+                   for lang in mirror_locales(root) for directory in HTML_DIRS]
+    for directory in HTML_DIRS + mirror_dirs:
+        path = os.path.join(root, directory)
+        if os.path.isdir(path):
+            pages.extend(os.path.join(path, name) for name in sorted(os.listdir(path)) if name.endswith('.html'))
+    return pages
@@ -0,0 +1,627 @@
+#!/usr/bin/env python3
+"""
+Page templates for build_site.py.
+
+Each template is compiled once at import time (page_templates) and filled
+with $placeholders from the stream catalog. Values are inserted verbatim, so
+callers escape text for HTML before rendering. The markup mirrors what the
+page maintenance scripts produce, so a catalog build and a patched page look
+the same.
+"""
+
+from page_templates import PageTemplate
+
+# Tag badge on a camera page
+CAMERA_TAG_TEMPLATE = PageTemplate(
+    '<span class="px-3 py-1 bg-blue-500/20 text-blue-400 rounded-full text-sm font-medium border border-blue-500/30">$tag</span>'
+)
+
+# Tag badge on a city page camera card
+CITY_TAG_TEMPLATE = PageTemplate(
+    '<span class="px-3 py-1 bg-rose-50 text-rose-700 rounded-full text-xs font-medium">$tag</span>'
+)
+
+# Other-city button at the bottom of a city page
+OTHER_CITY_TEMPLATE = PageTemplate(
+    '<a href="$slug.html" class="px-6 py-3 bg-white hover:bg-rose-600 hover:text-white rounded-lg font-semibold transition shadow">$name</a>'
+)
+
+# Place list item in the city About section
+PLACE_TEMPLATE = PageTemplate(
+    '                <li class="flex items-start gap-2"><span class="text-rose-600 mt-1">•</span><span>$place</span></li>'
+)
+
+# Paragraph in the city About section
+ABOUT_PARAGRAPH_TEMPLATE = PageTemplate('''                        <p>
+                            $text
+                        </p>
+''')
+
+# "More from <city>" sidebar entry on a camera page
+RELATED_CAMERA_TEMPLATE = PageTemplate('''        <a href="$slug.html" class="related-camera">
+            <img src="https://img.youtube.com/vi/$video_id/hqdefault.jpg" alt="$name" class="w-full aspect-video object-cover">
+            <div class="p-3">
+                <h4 class="font-semibold text-sm">$name</h4>
+            </div>
+        </a>
+''')
+
+# Camera card in the city page grid
+CAMERA_CARD_TEMPLATE = PageTemplate('''        <article class="camera-card">
+            <a href="../cameras/$slug.html">
+                <div class="camera-thumbnail">
+                    <img src="https://img.youtube.com/vi/$video_id/hqdefault.jpg" 
+                         alt="$name live webcam" 
+                         loading="lazy" class="w-full h-full object-cover">
+                    <div class="play-overlay">
+                        <svg xmlns="http://www.w3.org/2000/svg" class="h-7 w-7 text-white ml-1" viewBox="0 0 24 24" fill="currentColor">
+                            <path d="M8 5v14l11-7z"/>
+                        </svg>
+                    </div>
+                </div>
+                <div class="p-4">
+                    <h3 class="font-semibold text-lg text-gray-900 mb-2">$name</h3>
+                    <div class="flex flex-wrap gap-2">$tag_badges</div>
+                </div>
+            </a>
+        </article>
+        
+''')
+
+# AdSense loader some city pages carry in <head>
+ADSENSE_SCRIPT = '    <script async src="https://pagead2.googlesyndication.com/pagead/js/adsbygoogle.js?client=ca-pub-4968708525818749" crossorigin="anonymous"></script>\n'
+
+# Full camera page (cameras/<slug>.html)
+CAMERA_PAGE_TEMPLATE = PageTemplate('''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <link rel="alternate" hreflang="en" href="https://sakuralivecams.com/cameras/$slug.html">
+    <link rel="alternate" hreflang="ja" href="https://sakuralivecams.com/ja/cameras/$slug.html">
+    <link rel="alternate" hreflang="x-default" href="https://sakuralivecams.com/cameras/$slug.html">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Watch $name Live - FREE HD Webcam $city, Japan 24/7 | SakuraLive</title>
+    <meta name="description" content="Watch $name live webcam from $city, Japan - FREE HD streaming 24/7. Real-time views, no registration required. Best Japan webcam site with 200+ cameras.">
+    <meta name="keywords" content="$name, $city webcam, Japan live cam, $meta_keywords">
+    <meta name="robots" content="index, follow">
+    <link rel="canonical" href="https://sakuralivecams.com/cameras/$slug.html">
+    
+    <meta property="og:type" content="video.other">
+    <meta property="og:title" content="$name - Live Webcam">
+    <meta property="og:description" content="Watch $name live from $city, Japan">
+    <meta property="og:url" content="https://sakuralivecams.com/cameras/$slug.html">
+    <meta property="og:image" content="https://img.youtube.com/vi/$video_id/maxresdefault.jpg">
+    
+    <link rel="icon" href="../assets/images/favicon_io/favicon.ico" type="image/x-icon">
+    <script src="https://cdn.tailwindcss.com"></script>
+    
+    <script type="application/ld+json">
+    {
+        "@context": "https://schema.org",
+        "@type": "VideoObject",
+        "name": "$schema_name - Live Webcam",
+        "description": "Watch $schema_name live from $schema_city, Japan. Real-time HD webcam streaming 24/7. Free live view of $schema_name.",
+        "thumbnailUrl": "https://img.youtube.com/vi/$video_id/maxresdefault.jpg",
+        "uploadDate": "2024-01-01T00:00:00Z",
+        "duration": "PT0S",
+        "embedUrl": "https://www.youtube.com/embed/$video_id",
+        "contentUrl": "https://www.youtube.com/live/$video_id",
+        "keywords": "$schema_keywords",
+        "inLanguage": "en",
+        "isFamilyFriendly": true,
+        "contentLocation": {
+            "@type": "Place",
+            "name": "$schema_city, Japan",
+            "address": {
+                "@type": "PostalAddress",
+                "addressLocality": "$schema_city",
+                "addressCountry": "JP"
+            }
+        },
+        "publisher": {
+            "@type": "Organization",
+            "name": "SakuraLive",
+            "url": "https://sakuralivecams.com",
+            "logo": {
+                "@type": "ImageObject",
+                "url": "https://sakuralivecams.com/assets/images/logo.png",
+                "width": 512,
+                "height": 512
+            },
+            "sameAs": [
+                "https://play.google.com/store/apps/details?id=com.sakuralive"
+            ]
+        },
+        "isLiveBroadcast": true,
+        "publication": {
+            "@type": "BroadcastEvent",
+            "isLiveBroadcast": true,
+            "startDate": "2024-01-01T00:00:00Z"
+        }
+    }
+    </script>
+    <!-- Breadcrumb Schema for SEO -->
+    <script type="application/ld+json">
+    {
+        "@context": "https://schema.org",
+        "@type": "BreadcrumbList",
+        "itemListElement": [
+            {
+                "@type": "ListItem",
+                "position": 1,
+                "name": "Home",
+                "item": "https://sakuralivecams.com/"
+            },
+            {
+                "@type": "ListItem",
+                "position": 2,
+                "name": "$schema_city",
+                "item": "https://sakuralivecams.com/cities/$city_slug.html"
+            },
+            {
+                "@type": "ListItem",
+                "position": 3,
+                "name": "$schema_name",
+                "item": "https://sakuralivecams.com/cameras/$slug.html"
+            }
+        ]
+    }
+    </script>
+
+    <style>
+        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; background: linear-gradient(to bottom, #0f172a, #1e293b); min-height: 100vh; color: white; }
+        .video-container { position: relative; width: 100%; max-width: 1400px; margin: 0 auto; aspect-ratio: 16/9; background: #000; border-radius: 16px; overflow: hidden; box-shadow: 0 20px 60px rgba(0,0,0,0.5); }
+        .info-card { background: rgba(255, 255, 255, 0.05); backdrop-filter: blur(10px); border: 1px solid rgba(255, 255, 255, 0.1); border-radius: 12px; padding: 1.5rem; }
+        .related-camera { display: block; background: rgba(255, 255, 255, 0.05); border-radius: 12px; overflow: hidden; transition: all 0.3s ease; border: 1px solid rgba(255, 255, 255, 0.1); }
+        .related-camera:hover { transform: translateY(-4px); box-shadow: 0 8px 24px rgba(59, 130, 246, 0.3); }
+    </style>
+    <!-- Google Tag Manager -->
+    <script>(function(w,d,s,l,i){w[l]=w[l]||[];w[l].push({'gtm.start':
+    new Date().getTime(),event:'gtm.js'});var f=d.getElementsByTagName(s)[0],
+    j=d.createElement(s),dl=l!='dataLayer'?'&l='+l:'';j.async=true;j.src=
+    'https://www.googletagmanager.com/gtm.js?id='+i+dl;f.parentNode.insertBefore(j,f);
+    })(window,document,'script','dataLayer','GTM-5CGB48MH');</script>
+    <!-- End Google Tag Manager -->
+
+    <!-- Google tag (gtag.js) -->
+    <script async src="https://www.googletagmanager.com/gtag/js?id=G-BLTYH5F771"></script>
+    <script>
+      window.dataLayer = window.dataLayer || [];
+      function gtag(){dataLayer.push(arguments);}
+      gtag('js', new Date());
+      gtag('config', 'G-BLTYH5F771');
+    </script>
+
+</head>
+<body>
+  <!-- Google Tag Manager (noscript) -->
+  <noscript><iframe src="https://www.googletagmanager.com/ns.html?id=GTM-5CGB48MH"
+  height="0" width="0" style="display:none;visibility:hidden"></iframe></noscript>
+  <!-- End Google Tag Manager (noscript) -->
+
+    <header class="bg-black/50 backdrop-blur sticky top-0 z-50">
+        <div class="max-w-7xl mx-auto px-4 py-4 flex items-center justify-between">
+            <a href="../index.html" class="flex items-center gap-3">
+                <img src="../assets/images/logo.png" alt="SakuraLive" class="h-10 w-10 rounded">
+                <div>
+                    <div class="text-xl font-bold">SakuraLive</div>
+                    <div class="text-xs text-gray-400">Live Webcams from Japan</div>
+                </div>
+            </a>
+            <div class="flex items-center gap-2 text-sm">
+                    <a href="https://sakuralivecams.com/cameras/$slug.html" class="text-white font-semibold">EN</a>
+                    <span class="text-gray-500">|</span>
+                    <a href="https://sakuralivecams.com/ja/cameras/$slug.html" class="text-gray-400 hover:text-white">日本語</a>
+                </div>
+            <a href="https://play.google.com/store/apps/details?id=com.sakuralive" target="_blank">
+                <img src="../assets/images/download-playstore-img.png" alt="Get it on Google Play" class="h-10">
+            </a>
+        </div>
+    </header>
+
+    <main class="max-w-7xl mx-auto px-4 py-8">
+        <nav class="text-sm text-gray-400 mb-6">
+            <a href="../index.html" class="hover:text-white">Home</a>
+            <span class="mx-2">/</span>
+            <a href="../cities/$city_slug.html" class="hover:text-white">$city</a>
+            <span class="mx-2">/</span>
+            <span class="text-white">$name</span>
+        </nav>
+
+        <div class="mb-8">
+            <h1 class="text-4xl md:text-5xl font-bold mb-4">$name</h1>
+            <div class="flex flex-wrap items-center gap-4 text-gray-300">
+                <span class="flex items-center gap-2">
+                    <svg class="w-5 h-5" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                        <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M17.657 16.657L13.414 20.9a1.998 1.998 0 01-2.827 0l-4.244-4.243a8 8 0 1111.314 0z"/>
+                        <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M15 11a3 3 0 11-6 0 3 3 0 016 0z"/>
+                    </svg>
+                    <a href="../cities/$city_slug.html" class="hover:text-white">$city, Japan</a>
+                </span>
+                <span class="flex items-center gap-2">
+                    <span class="w-2 h-2 bg-red-500 rounded-full animate-pulse"></span>
+                    LIVE
+                </span>
+                <span class="flex items-center gap-2">
+                    <svg class="w-5 h-5" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                        <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M12 8v4l3 3m6-3a9 9 0 11-18 0 9 9 0 0118 0z"/>
+                    </svg>
+                    <span id="current-time" class="font-medium">--:--:-- JST</span>
+                </span>
+            </div>
+        </div>
+
+        <div class="video-container mb-8">
+            <button type="button" class="lite-embed group absolute inset-0 w-full h-full grid place-items-center"
+                    data-video-id="$video_id" data-title="$name live stream" aria-label="Play $name live stream">
+                <img src="https://img.youtube.com/vi/$video_id/hqdefault.jpg" alt="$name live stream"
+                     class="absolute inset-0 w-full h-full object-cover" decoding="async">
+                <span class="relative h-16 w-16 rounded-full bg-red-600/90 grid place-items-center shadow-lg group-hover:scale-110 transition">
+                    <svg xmlns="http://www.w3.org/2000/svg" class="h-8 w-8 text-white ml-1" viewBox="0 0 24 24" fill="currentColor"><path d="M8 5v14l11-7z"/></svg>
+                </span>
+            </button>
+        </div>
+
+        <div class="grid md:grid-cols-3 gap-8">
+            <div class="md:col-span-2 space-y-6">
+                <div class="info-card">
+                    <h2 class="text-2xl font-bold mb-4">About This Camera</h2>
+                                        $description
+                    <div class="flex flex-wrap gap-2">$tag_badges</div>
+                </div>
+
+                <div class="info-card">
+                    <h3 class="text-xl font-bold mb-3">Share This Camera</h3>
+                    <div class="flex gap-3">
+                        <a href="https://twitter.com/intent/tweet?text=$share_text&url=https://sakuralivecams.com/cameras/$slug.html" 
+                           target="_blank" class="px-6 py-3 bg-blue-500 hover:bg-blue-600 rounded-lg font-semibold transition">Twitter</a>
+                        <a href="https://www.facebook.com/sharer/sharer.php?u=https://sakuralivecams.com/cameras/$slug.html" 
+                           target="_blank" class="px-6 py-3 bg-blue-700 hover:bg-blue-800 rounded-lg font-semibold transition">Facebook</a>
+                        <button onclick="navigator.clipboard.writeText(window.location.href);alert('Link copied!');" 
+                                class="px-6 py-3 bg-gray-700 hover:bg-gray-600 rounded-lg font-semibold transition">Copy Link</button>
+                    </div>
+                </div>
+            </div>
+
+            <div class="space-y-6">
+                <div class="info-card">
+                    <h3 class="text-xl font-bold mb-4">More from $city</h3>
+                    <div class="space-y-4">$related_cameras</div>
+                    <a href="../cities/$city_slug.html" class="block mt-4 text-center py-3 bg-blue-600 hover:bg-blue-700 rounded-lg font-semibold transition">
+                        View All $city Cameras
+                    </a>
+                </div>
+            </div>
+        </div>
+    </main>
+
+    <footer class="bg-black py-12 mt-12">
+        <div class="max-w-7xl mx-auto px-4">
+            <div class="grid md:grid-cols-4 gap-8 mb-8">
+                <!-- About Section -->
+                <div class="md:col-span-1">
+                    <h3 class="text-white font-bold text-lg mb-3">SakuraLive</h3>
+                    <p class="text-gray-400 text-sm">Experience Japan in real-time with 200+ live webcams across Tokyo, Osaka, Kyoto, and more. Watch live streams 24/7 from iconic landmarks, bustling streets, and scenic locations.</p>
+                </div>
+
+                <!-- Popular Cities -->
+                <div>
+                    <h4 class="text-white font-semibold mb-3">Popular Cities</h4>
+                    <ul class="space-y-2 text-sm">
+                        <li><a href="../cities/tokyo.html" class="text-gray-400 hover:text-white transition">Tokyo Webcams</a></li>
+                        <li><a href="../cities/osaka.html" class="text-gray-400 hover:text-white transition">Osaka Webcams</a></li>
+                        <li><a href="../cities/kyoto.html" class="text-gray-400 hover:text-white transition">Kyoto Webcams</a></li>
+                        <li><a href="../cities/okinawa.html" class="text-gray-400 hover:text-white transition">Okinawa Webcams</a></li>
+                        <li><a href="../cities/hokkaido.html" class="text-gray-400 hover:text-white transition">Hokkaido Webcams</a></li>
+                    </ul>
+                </div>
+
+                <!-- More Destinations -->
+                <div>
+                    <h4 class="text-white font-semibold mb-3">More Destinations</h4>
+                    <ul class="space-y-2 text-sm">
+                        <li><a href="../cities/yokohama.html" class="text-gray-400 hover:text-white transition">Yokohama Webcams</a></li>
+                        <li><a href="../cities/fukuoka.html" class="text-gray-400 hover:text-white transition">Fukuoka Webcams</a></li>
+                        <li><a href="../cities/hiroshima.html" class="text-gray-400 hover:text-white transition">Hiroshima Webcams</a></li>
+                        <li><a href="../cities/nagano.html" class="text-gray-400 hover:text-white transition">Nagano Webcams</a></li>
+                        <li><a href="../index.html" class="text-gray-400 hover:text-white transition">Browse All Cameras</a></li>
+                    </ul>
+                </div>
+
+                <!-- Information -->
+                <div>
+                    <h4 class="text-white font-semibold mb-3">Information</h4>
+                    <ul class="space-y-2 text-sm">
+                        <li><a href="../privacy.html" class="text-gray-400 hover:text-white transition">Privacy Policy</a></li>
+                        <li><a href="../terms.html" class="text-gray-400 hover:text-white transition">Terms of Service</a></li>
+                        <li><a href="../contact.html" class="text-gray-400 hover:text-white transition">Contact Us</a></li>
+                    </ul>
+                </div>
+            </div>
+
+            <!-- Copyright -->
+            <div class="border-t border-gray-800 pt-6 text-center text-gray-400 text-sm">
+                <p>&copy; <span id="copyright-year"></span> SakuraLive. All rights reserved. Live webcams from Japan - Tokyo, Osaka, Kyoto and beyond.</p>
+            </div>
+        </div>
+    </footer>
+
+    <script>
+        function updateTime() {
+            const now = new Date();
+            const options = {
+                timeZone: 'Asia/Tokyo',
+                hour: '2-digit',
+                minute: '2-digit',
+                second: '2-digit',
+                hour12: false
+            };
+            const timeString = now.toLocaleTimeString('en-US', options) + ' JST';
+            document.getElementById('current-time').textContent = timeString;
+        }
+
+        updateTime();
+        setInterval(updateTime, 1000);
+        document.getElementById('copyright-year').textContent = new Date().getFullYear();
+    </script>
+
+    <script>
+        document.querySelectorAll('.lite-embed').forEach(function(btn) {
+            btn.addEventListener('click', function() {
+                const iframe = document.createElement('iframe');
+                iframe.src = 'https://www.youtube.com/embed/' + btn.dataset.videoId + '?autoplay=1&mute=1';
+                iframe.allow = 'accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture';
+                iframe.allowFullscreen = true;
+                iframe.title = btn.dataset.title;
+                iframe.className = 'w-full h-full border-none';
+                btn.replaceWith(iframe);
+            }, { once: true });
+        });
+    </script>
+</body>
+</html>''')
+
+# Full city page (cities/<slug>.html)
+CITY_PAGE_TEMPLATE = PageTemplate('''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <link rel="alternate" hreflang="en" href="https://sakuralivecams.com/cities/$slug.html">
+    <link rel="alternate" hreflang="ja" href="https://sakuralivecams.com/ja/cities/$slug.html">
+    <link rel="alternate" hreflang="x-default" href="https://sakuralivecams.com/cities/$slug.html">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>$title</title>
+    <meta name="description" content="$description">
+    <meta name="keywords" content="$keywords">
+    <meta name="robots" content="index, follow">
+    <link rel="canonical" href="https://sakuralivecams.com/cities/$slug.html">
+    
+    <meta property="og:type" content="website">
+    <meta property="og:title" content="$og_title">
+    <meta property="og:description" content="$og_description">
+    <meta property="og:url" content="https://sakuralivecams.com/cities/$slug.html">
+    <meta property="og:image" content="$og_image">
+    
+    <link rel="icon" href="../assets/images/favicon_io/favicon.ico" type="image/x-icon">
+    <script src="https://cdn.tailwindcss.com"></script>
+    
+    <script type="application/ld+json">
+    {
+        "@context": "https://schema.org",
+        "@type": "CollectionPage",
+        "name": "$name Live Webcams",
+        "description": "$schema_description",
+        "url": "https://sakuralivecams.com/cities/$slug.html"
+    }
+    </script>
+    
+    <style>
+        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%); min-height: 100vh; }
+        .header { background: rgba(0,0,0,0.95); backdrop-filter: blur(10px); }
+        .hero-section { background: linear-gradient(135deg, #e94560 0%, #0f3460 100%); position: relative; overflow: hidden; }
+        .camera-card { background: white; border-radius: 16px; overflow: hidden; transition: all 0.3s ease; box-shadow: 0 4px 6px rgba(0,0,0,0.1); }
+        .camera-card:hover { transform: translateY(-8px); box-shadow: 0 12px 24px rgba(233, 69, 96, 0.3); }
+        .camera-thumbnail { position: relative; aspect-ratio: 16/9; overflow: hidden; background: #000; }
+        .play-overlay { position: absolute; top: 50%; left: 50%; transform: translate(-50%, -50%); width: 64px; height: 64px; background: rgba(233, 69, 96, 0.9); border-radius: 50%; display: flex; align-items: center; justify-content: center; }
+    </style>
+    <!-- Google Tag Manager -->
+    <script>(function(w,d,s,l,i){w[l]=w[l]||[];w[l].push({'gtm.start':
+    new Date().getTime(),event:'gtm.js'});var f=d.getElementsByTagName(s)[0],
+    j=d.createElement(s),dl=l!='dataLayer'?'&l='+l:'';j.async=true;j.src=
+    'https://www.googletagmanager.com/gtm.js?id='+i+dl;f.parentNode.insertBefore(j,f);
+    })(window,document,'script','dataLayer','GTM-5CGB48MH');</script>
+    <!-- End Google Tag Manager -->
+
+    <!-- Google tag (gtag.js) -->
+    <script async src="https://www.googletagmanager.com/gtag/js?id=G-BLTYH5F771"></script>
+    <script>
+      window.dataLayer = window.dataLayer || [];
+      function gtag(){dataLayer.push(arguments);}
+      gtag('js', new Date());
+      gtag('config', 'G-BLTYH5F771');
+    </script>
+
+$head_scripts</head>
+<body>
+  <!-- Google Tag Manager (noscript) -->
+  <noscript><iframe src="https://www.googletagmanager.com/ns.html?id=GTM-5CGB48MH"
+  height="0" width="0" style="display:none;visibility:hidden"></iframe></noscript>
+  <!-- End Google Tag Manager (noscript) -->
+
+    <header class="header sticky top-0 z-50">
+        <div class="max-w-7xl mx-auto px-4 py-4 flex items-center justify-between">
+            <a href="../index.html" class="flex items-center gap-3">
+                <img src="../assets/images/logo.png" alt="SakuraLive" class="h-10 w-10 rounded">
+                <div>
+                    <div class="text-xl font-bold text-white">SakuraLive</div>
+                    <div class="text-xs text-gray-400">Live Webcams from Japan</div>
+                </div>
+            </a>
+            <div class="flex items-center gap-2 text-sm">
+                    <a href="https://sakuralivecams.com/cities/$slug.html" class="text-white font-semibold">EN</a>
+                    <span class="text-gray-500">|</span>
+                    <a href="https://sakuralivecams.com/ja/cities/$slug.html" class="text-gray-400 hover:text-white">日本語</a>
+                </div>
+            <a href="https://play.google.com/store/apps/details?id=com.sakuralive" target="_blank">
+                <img src="../assets/images/download-playstore-img.png" alt="Get it on Google Play" class="h-10">
+            </a>
+        </div>
+    </header>
+
+    <section class="hero-section py-16 md:py-24">
+        <div class="max-w-7xl mx-auto px-4">
+            <nav class="text-sm text-white/80 mb-6">
+                <a href="../index.html" class="hover:text-white">Home</a>
+                <span class="mx-2">/</span>
+                <span class="text-white font-semibold">$name</span>
+            </nav>
+            
+            <h1 class="text-4xl md:text-6xl font-bold text-white mb-6">$name Live Webcams</h1>
+            <p class="text-xl md:text-2xl text-white/90 mb-8 max-w-3xl">$intro</p>
+            
+            <div class="grid grid-cols-2 md:grid-cols-4 gap-4">
+                <div class="bg-white/10 backdrop-blur rounded-xl p-4 border border-white/20">
+                    <div class="text-3xl font-bold mb-1">$camera_count+</div>
+                    <div class="text-sm opacity-90">Live Cameras</div>
+                </div>
+                <div class="bg-white/10 backdrop-blur rounded-xl p-4 border border-white/20">
+                    <div class="text-3xl font-bold mb-1">24/7</div>
+                    <div class="text-sm opacity-90">Live Streaming</div>
+                </div>
+                <div class="bg-white/10 backdrop-blur rounded-xl p-4 border border-white/20">
+                    <div class="text-3xl font-bold mb-1">HD</div>
+                    <div class="text-sm opacity-90">Quality</div>
+                </div>
+                <div class="bg-white/10 backdrop-blur rounded-xl p-4 border border-white/20">
+                    <div class="text-3xl font-bold mb-1">Free</div>
+                    <div class="text-sm opacity-90">No Subscription</div>
+                </div>
+            </div>
+
+            <div class="mt-6 flex items-center gap-2 text-white">
+                <svg class="w-6 h-6" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                    <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M12 8v4l3 3m6-3a9 9 0 11-18 0 9 9 0 0118 0z"/>
+                </svg>
+                <span class="text-lg font-semibold">Current Time (JST): <span id="current-time" class="font-bold">--:--:--</span></span>
+            </div>
+                    </div>
+        </div>
+    </section>
+
+    <section class="py-12 bg-gray-50">
+        <div class="max-w-7xl mx-auto px-4">
+            <h2 class="text-3xl font-bold text-gray-900 mb-8">All $name Webcams ($camera_count)</h2>
+            <div class="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
+                
+$camera_cards            </div>
+        </div>
+    </section>
+
+    <section class="py-12 bg-white">
+        <div class="max-w-7xl mx-auto px-4">
+            <div class="grid md:grid-cols-2 gap-12">
+                <div>
+                    <h2 class="text-3xl font-bold text-gray-900 mb-6">About $name Webcams</h2>
+                    <div class="prose prose-lg text-gray-700 space-y-4">
+$about_paragraphs                    </div>
+                </div>
+
+                <div>
+                    <h3 class="text-2xl font-bold text-gray-900 mb-6">Places to Visit in $name</h3>
+                    <ul class="space-y-3 text-gray-700">
+$places                    </ul>
+                    <div class="mt-6 p-4 bg-rose-50 rounded-lg">
+                        <p class="text-sm text-gray-700">
+                            <strong class="text-rose-700">Pro Tip:</strong> Use our live webcams to check current
+                            weather conditions and crowd levels before visiting popular attractions in $name.
+                        </p>
+                    </div>
+                </div>
+            </div>
+    </section>
+
+    <section class="py-12 bg-gray-50">
+        <div class="max-w-7xl mx-auto px-4">
+            <h2 class="text-2xl font-bold text-gray-900 mb-6">Explore Other Cities</h2>
+            <div class="flex flex-wrap gap-4">$other_cities</div>
+        </div>
+    </section>
+
+    <footer class="bg-black py-12 mt-12">
+        <div class="max-w-7xl mx-auto px-4">
+            <div class="grid md:grid-cols-4 gap-8 mb-8">
+                <!-- About Section -->
+                <div class="md:col-span-1">
+                    <h3 class="text-white font-bold text-lg mb-3">SakuraLive</h3>
+                    <p class="text-gray-400 text-sm">Experience Japan in real-time with 200+ live webcams across Tokyo, Osaka, Kyoto, and more. Watch live streams 24/7 from iconic landmarks, bustling streets, and scenic locations.</p>
+                </div>
+
+                <!-- Popular Cities -->
+                <div>
+                    <h4 class="text-white font-semibold mb-3">Popular Cities</h4>
+                    <ul class="space-y-2 text-sm">
+                        <li><a href="tokyo.html" class="text-gray-400 hover:text-white transition">Tokyo Webcams</a></li>
+                        <li><a href="osaka.html" class="text-gray-400 hover:text-white transition">Osaka Webcams</a></li>
+                        <li><a href="kyoto.html" class="text-gray-400 hover:text-white transition">Kyoto Webcams</a></li>
+                        <li><a href="okinawa.html" class="text-gray-400 hover:text-white transition">Okinawa Webcams</a></li>
+                        <li><a href="hokkaido.html" class="text-gray-400 hover:text-white transition">Hokkaido Webcams</a></li>
+                    </ul>
+                </div>
+
+                <!-- More Destinations -->
+                <div>
+                    <h4 class="text-white font-semibold mb-3">More Destinations</h4>
+                    <ul class="space-y-2 text-sm">
+                        <li><a href="yokohama.html" class="text-gray-400 hover:text-white transition">Yokohama Webcams</a></li>
+                        <li><a href="fukuoka.html" class="text-gray-400 hover:text-white transition">Fukuoka Webcams</a></li>
+                        <li><a href="hiroshima.html" class="text-gray-400 hover:text-white transition">Hiroshima Webcams</a></li>
+                        <li><a href="nagano.html" class="text-gray-400 hover:text-white transition">Nagano Webcams</a></li>
+                        <li><a href="../index.html" class="text-gray-400 hover:text-white transition">Browse All Cameras</a></li>
+                    </ul>
+                </div>
+
+                <!-- Information -->
+                <div>
+                    <h4 class="text-white font-semibold mb-3">Information</h4>
+                    <ul class="space-y-2 text-sm">
+                        <li><a href="../privacy.html" class="text-gray-400 hover:text-white transition">Privacy Policy</a></li>
+                        <li><a href="../terms.html" class="text-gray-400 hover:text-white transition">Terms of Service</a></li>
+                        <li><a href="../contact.html" class="text-gray-400 hover:text-white transition">Contact Us</a></li>
+                    </ul>
+                </div>
+            </div>
+
+            <!-- Copyright -->
+            <div class="border-t border-gray-800 pt-6 text-center text-gray-400 text-sm">
+                <p>&copy; <span id="copyright-year"></span> SakuraLive. All rights reserved. Live webcams from Japan - Tokyo, Osaka, Kyoto and beyond.</p>
+            </div>
+        </div>
+    </footer>
+
+    <script>
+        function updateTime() {
+            const now = new Date();
+            const options = {
+                timeZone: 'Asia/Tokyo',
+                hour: '2-digit',
+                minute: '2-digit',
+                second: '2-digit',
+                hour12: false
+            };
+            const timeString = now.toLocaleTimeString('en-US', options);
+            const timeElement = document.getElementById('current-time');
+            if (timeElement) {
+                timeElement.textContent = timeString;
+            }
+        }
+
+        updateTime();
+        setInterval(updateTime, 1000);
+
+        const copyrightYear = document.getElementById('copyright-year');
+        if (copyrightYear) {
+            copyrightYear.textContent = new Date().getFullYear();
+        }
+    </script>
+</body>
+</html>''')
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Self-hosted stream thumbnails.
+
+mirror_thumbnails.py copies the YouTube thumbnails into assets/thumbs/ and
+lists them in assets/thumbs/manifest.json (video ID -> file name). Every
+template still writes img.youtube.com URLs, so anything that renders a page
+(build_site.py, the 'thumbnails' stage of transform_pages.py) runs it
+through rewrite_thumbnails() afterwards, and the mirror survives a rebuild.
+"""
+
+import os
+import re
+import json
+from pathlib import Path
+
+THUMBS_DIR = 'assets/thumbs'
+MANIFEST_NAME = 'manifest.json'
+BASE_URL = 'https://sakuralivecams.com'
+
+YOUTUBE_THUMB_URL = 'https://img.youtube.com/vi/{video_id}/hqdefault.jpg'
+
+# A YouTube thumbnail URL, or a mirrored one, in an <img src> or a JSON-LD
+# thumbnailUrl
+THUMB_URL_PATTERN = re.compile(
+    r'(?P<lead>\bsrc="|"thumbnailUrl"\s*:\s*")'
+    r'(?:https://img\.youtube\.com/vi/(?P<youtube_id>[\w-]{11})/(?:hq|maxres)default\.jpg'
+    r'|[^"]*?assets/thumbs/(?P<local_id>[\w-]{11})-[0-9a-f]+\.webp)"'
+)
+
+
+def load_thumbs(manifest_path=os.path.join(THUMBS_DIR, MANIFEST_NAME)):
+    """The current video ID -> file name mapping ({} if there is none yet)."""
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def rewrite_thumbnails(content, depth, thumbs):
+    """Point thumbnail URLs at the mirrored files; returns (content, URLs changed).
+
+    depth is how many directories below the site root the page sits.
+    <img src> gets a relative URL, thumbnailUrl an absolute one. Streams no
+    longer mirrored go back to their YouTube thumbnail.
+    """
+    relative_base = '../' * depth + THUMBS_DIR + '/'
+    count = 0
+
+    def replace(match):
+        nonlocal count
+        lead = match.group('lead')
+        video = match.group('youtube_id') or match.group('local_id')
+        if video in thumbs:
+            base = f'{BASE_URL}/{THUMBS_DIR}/' if lead.startswith('"') else relative_base
+            url = base + thumbs[video]
+        elif match.group('local_id'):
+            url = YOUTUBE_THUMB_URL.format(video_id=video)
+        else:
+            return match.group(0)
+        replacement = f'{lead}{url}"'
+        count += replacement != match.group(0)
+        return replacement
+
+    return THUMB_URL_PATTERN.sub(replace, content), count
+
+
+def rewrite_thumbnails_content(content, file_path):
+    """Page transform for transform_pages.py; file_path is relative to the site root."""
+    content, count = rewrite_thumbnails(content, len(Path(file_path).parts) - 1, load_thumbs())
+    return content if count else None
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Precomputed data for the home page stream list.
+
+The home page filters assets/output2.json by location, by a clicked tag and
+by a free-text tag search. Instead of scanning and lowercasing every
+stream's tags on each keystroke, the page loads this index next to the
+catalog and answers filters with set lookups:
+
+    locations   lowercased location -> stream ids
+    tags        lowercased tag -> stream ids
+    tag_list    the lowercased tag vocabulary
+    tag_trie    trie over every suffix of every tag; walking the search text
+                from the root and collecting the "$t" tag numbers below that
+                node gives all tags *containing* the text, matching the old
+                substring search
+
+Stream ids are positions in the catalog array, so results come out in
+catalog order. count lets the page detect an index that is out of step with
+the catalog and fall back to scanning.
+
+The catalog is also split into one shard per location under assets/streams/
+so the page can render the selected location without downloading every
+stream. manifest.json lists each location's shard file, stream count, tags
+and the catalog ids of the shard's entries, in order; the page loads the
+selected shard first and prefetches the rest when idle.
+"""
+
+import os
+import re
+import json
+import argparse
+
+from build_manifest import write_if_changed
+
+CATALOG_PATH = 'assets/output2.json'
+SHARD_DIR = 'assets/streams'
+MANIFEST_NAME = 'manifest.json'
+INDEX_VERSION = 1
+
+# Trie key holding the tag numbers of suffixes ending at a node; never a
+# single character, so it can't collide with a child
+TERMINAL_KEY = '$t'
+
+
+def index_path(catalog_path=CATALOG_PATH):
+    """Path of the index that sits next to a catalog file."""
+    root, ext = os.path.splitext(catalog_path)
+    return f'{root}.index{ext}'
+
+
+def build_tag_trie(tag_list):
+    """Suffix trie over tag_list; terminal nodes list tag numbers."""
+    trie = {}
+    for number, tag in enumerate(tag_list):
+        for start in range(len(tag)):
+            node = trie
+            for char in tag[start:]:
+                node = node.setdefault(char, {})
+            terminal = node.setdefault(TERMINAL_KEY, [])
+            if not terminal or terminal[-1] != number:
+                terminal.append(number)
+    return trie
+
+
+def build_stream_index(entries):
+    """Build the filter index for a list of catalog entries."""
+    locations = {}
+    tags = {}
+    for stream_id, entry in enumerate(entries):
+        location = (entry.get('Location') or '').lower()
+        locations.setdefault(location, []).append(stream_id)
+        for tag in dict.fromkeys(t.lower() for t in entry.get('Tags') or ()):
+            tags.setdefault(tag, []).append(stream_id)
+
+    tag_list = sorted(tags)
+    return {
+        'version': INDEX_VERSION,
+        'count': len(entries),
+        'locations': locations,
+        'tags': {tag: tags[tag] for tag in tag_list},
+        'tag_list': tag_list,
+        'tag_trie': build_tag_trie(tag_list),
+    }
+
+
+def tags_containing(index, text):
+    """Tags containing text (the lookup the front end does with the trie)."""
+    node = index['tag_trie']
+    for char in text.lower():
+        node = node.get(char)
+        if node is None:
+            return []
+    numbers = set()
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        for key, value in node.items():
+            if key == TERMINAL_KEY:
+                numbers.update(value)
+            else:
+                stack.append(value)
+    return [index['tag_list'][number] for number in sorted(numbers)]
+
+
+def render_stream_index(catalog_path=CATALOG_PATH):
+    """Serialized index for a catalog file."""
+    with open(catalog_path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    return json.dumps(build_stream_index(entries), ensure_ascii=False, separators=(',', ':'))
+
+
+def shard_name(location, taken):
+    """Shard file name for a location, unique among taken."""
+    base = re.sub(r'[^a-z0-9]+', '-', location.lower()).strip('-') or 'other'
+    name, n = f'{base}.json', 2
+    while name in taken or name == MANIFEST_NAME:
+        name, n = f'{base}-{n}.json', n + 1
+    return name
+
+
+def build_catalog_shards(entries):
+    """Split catalog entries by location; returns (manifest, {file name: entries})."""
+    groups = {}
+    for stream_id, entry in enumerate(entries):
+        location = entry.get('Location') or ''
+        # The page matches locations case-insensitively; first spelling wins
+        groups.setdefault(location.lower(), (location, []))[1].append(stream_id)
+
+    locations = []
+    shards = {}
+    for name, ids in groups.values():
+        file_name = shard_name(name, shards)
+        shards[file_name] = [entries[i] for i in ids]
+        tags = dict.fromkeys(tag for i in ids for tag in entries[i].get('Tags') or ())
+        locations.append({'name': name, 'file': file_name, 'count': len(ids), 'ids': ids, 'tags': list(tags)})
+
+    manifest = {'version': INDEX_VERSION, 'count': len(entries), 'locations': locations}
+    return manifest, shards
+
+
+def render_catalog_shards(catalog_path=CATALOG_PATH):
+    """Serialized manifest and shards as {file name: content}."""
+    with open(catalog_path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    manifest, shards = build_catalog_shards(entries)
+    files = {MANIFEST_NAME: json.dumps(manifest, ensure_ascii=False, separators=(',', ':'))}
+    for file_name, shard in shards.items():
+        files[file_name] = json.dumps(shard, ensure_ascii=False, separators=(',', ':'))
+    return files
+
+
+def stale_shards(shard_dir, file_names):
+    """JSON files in shard_dir that are not in file_names."""
+    try:
+        existing = os.listdir(shard_dir)
+    except FileNotFoundError:
+        return []
+    return sorted(name for name in existing if name.endswith('.json') and name not in file_names)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the home page stream index and catalog shards.')
+    parser.add_argument('--catalog', default=CATALOG_PATH, help=f'catalog JSON (default: {CATALOG_PATH})')
+    parser.add_argument('--output', help='index file (default: next to the catalog)')
+    parser.add_argument('--shard-dir', default=SHARD_DIR, help=f'directory for the location shards (default: {SHARD_DIR})')
+    args = parser.parse_args()
+
+    outputs = {args.output or index_path(args.catalog): render_stream_index(args.catalog)}
+    shards = render_catalog_shards(args.catalog)
+    for file_name, content in shards.items():
+        outputs[os.path.join(args.shard_dir, file_name)] = content
+
+    os.makedirs(args.shard_dir, exist_ok=True)
+    written = 0
+    for path, content in outputs.items():
+        if write_if_changed(path, content):
+            print(f"✅ Wrote {path}")
+            written += 1
+    for file_name in stale_shards(args.shard_dir, shards):
+        os.remove(os.path.join(args.shard_dir, file_name))
+        print(f"🗑️  Removed {os.path.join(args.shard_dir, file_name)}")
+    print(f"\n{written} of {len(outputs)} files written ({len(shards) - 1} location shards)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Validate and normalize the JSON-LD structured data of every page.
+
+The VideoObject and BreadcrumbList blocks of the camera pages are written
+by string templates (enhance_video_schema.py, add_breadcrumb_schema.py,
+site_templates.py) and patched again by the i18n generator, so a stray
+quote in a camera name quietly breaks the JSON and search engines drop the
+whole block. Every application/ld+json block is parsed and checked here:
+
+    invalid JSON      the block doesn't parse
+    missing fields    required VideoObject / BreadcrumbList properties that
+                      are absent or empty
+    breadcrumbs       ListItem positions not numbered 1..n, or an item URL
+                      that isn't absolute
+
+With --write every block that parses is re-serialized canonically (4-space
+indented, keys in their existing order, non-ASCII kept as is), which is
+what the templates already produce. The 'json-ld' stage of
+transform_pages.py does the same for the camera pages. edit_json_ld() lets
+a page transformer change the parsed objects instead of the text.
+
+Usage:
+    python3 structured_data.py
+    python3 structured_data.py --jobs 0 --verbose
+    python3 structured_data.py --write
+    python3 structured_data.py --strict          # exit 1 if any page has problems
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+import textwrap
+from collections import namedtuple
+from functools import partial
+
+from build_manifest import write_if_changed
+from page_batch import add_jobs_argument, run_pages
+from site_locales import find_pages
+
+# An application/ld+json script element: (opening tag)(body)(closing tag)
+JSON_LD_PATTERN = re.compile(
+    r'(<script\b[^>]*type=["\']application/ld\+json["\'][^>]*>)(.*?)(</script\s*>)',
+    re.DOTALL | re.IGNORECASE,
+)
+
+# Properties each type needs to qualify for rich results
+REQUIRED_FIELDS = {
+    'VideoObject': ('name', 'description', 'thumbnailUrl', 'uploadDate'),
+    'BreadcrumbList': ('itemListElement',),
+}
+# A VideoObject needs at least one of these to point at the video
+VIDEO_URL_FIELDS = ('contentUrl', 'embedUrl')
+
+# Printed pages with problems unless --verbose
+DETAIL_LIMIT = 10
+
+# Per-page outcome: blocks found, [problem lines], whether it was rewritten
+PageReport = namedtuple('PageReport', 'blocks problems written')
+
+
+def json_string(value):
+    """Escape a value for use inside a double-quoted JSON string in a template."""
+    # </ would end the <script> element early
+    return json.dumps(str(value), ensure_ascii=False)[1:-1].replace('</', '<\\/')
+
+
+def format_json_ld(data, indent='    '):
+    """Canonical script body for a JSON-LD object, indented to sit under its <script> tag."""
+    text = json.dumps(data, ensure_ascii=False, indent=4).replace('</', '<\\/')
+    return '\n' + textwrap.indent(text, indent) + '\n' + indent
+
+
+def tag_indent(content, start):
+    """Whitespace before the <script> tag starting at start."""
+    line_start = content.rfind('\n', 0, start) + 1
+    prefix = content[line_start:start]
+    return prefix if not prefix.strip() else ''
+
+
+def schema_objects(data):
+    """Every typed object in a block, including the items of an @graph."""
+    items = data if isinstance(data, list) else [data]
+    objects = []
+    for item in items:
+        if isinstance(item, dict):
+            objects.append(item)
+            objects.extend(schema_objects(item.get('@graph', [])))
+    return objects
+
+
+def validate_json_ld(data):
+    """Problems with one parsed block, as short descriptions."""
+    problems = []
+    for obj in schema_objects(data):
+        kind = obj.get('@type')
+        for field in REQUIRED_FIELDS.get(kind, ()):
+            if obj.get(field) in (None, '', []):
+                problems.append(f"{kind} has no {field}")
+        if kind == 'VideoObject' and not any(obj.get(field) for field in VIDEO_URL_FIELDS):
+            problems.append(f"VideoObject has neither {' nor '.join(VIDEO_URL_FIELDS)}")
+        if kind == 'BreadcrumbList':
+            items = obj.get('itemListElement') or []
+            for expected, item in enumerate(items, 1):
+                if item.get('position') != expected:
+                    problems.append(f"breadcrumb {expected} has position {item.get('position')!r}")
+                if not item.get('name'):
+                    problems.append(f"breadcrumb {expected} has no name")
+                # Only the current page may leave out its URL
+                url = item.get('item')
+                url = url.get('@id') if isinstance(url, dict) else url
+                if url is None and expected < len(items):
+                    problems.append(f"breadcrumb {expected} has no item URL")
+                elif url is not None and not str(url).startswith(('https://', 'http://')):
+                    problems.append(f"breadcrumb {expected} item is not an absolute URL: {url}")
+    return problems
+
+
+def edit_json_ld(content, edit):
+    """Apply edit(data) to every JSON-LD block that parses and re-serialize it.
+
+    edit changes the parsed object in place (or returns a replacement).
+    Blocks that don't parse are left alone.
+    """
+    def replace(match):
+        opening, body, closing = match.groups()
+        try:
+            data = json.loads(body)
+        except ValueError:
+            return match.group(0)
+        result = edit(data)
+        data = data if result is None else result
+        return opening + format_json_ld(data, tag_indent(content, match.start())) + closing
+
+    return JSON_LD_PATTERN.sub(replace, content)
+
+
+def normalize_json_ld_content(content, file_path=None):
+    """Return content with every JSON-LD block in canonical form, or None if nothing changed."""
+    if 'application/ld+json' not in content:
+        return None
+    normalized = edit_json_ld(content, lambda data: None)
+    return normalized if normalized != content else None
+
+
+def check_page(path, root, write=False):
+    """Validate one page's JSON-LD and, with write, normalize it in place."""
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    blocks = 0
+    problems = []
+    for match in JSON_LD_PATTERN.finditer(content):
+        blocks += 1
+        line = content.count('\n', 0, match.start()) + 1
+        try:
+            data = json.loads(match.group(2))
+        except ValueError as e:
+            problems.append(f"line {line}: invalid JSON ({e})")
+            continue
+        problems.extend(f"line {line}: {problem}" for problem in validate_json_ld(data))
+
+    written = False
+    if write:
+        normalized = normalize_json_ld_content(content, path)
+        written = normalized is not None and write_if_changed(path, normalized)
+    return PageReport(blocks, problems, written)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Validate the JSON-LD of every page and normalize it.')
+    parser.add_argument('--root', default='.', help='site root (default: current directory)')
+    parser.add_argument('--write', action='store_true', help='re-serialize every valid block canonically')
+    parser.add_argument('--verbose', action='store_true', help='list every page with problems, not just the first few')
+    parser.add_argument('--strict', action='store_true', help='exit with status 1 if any page has problems')
+    add_jobs_argument(parser)
+    args = parser.parse_args()
+
+    pages = find_pages(args.root)
+    print(f"🧩 Checking JSON-LD on {len(pages)} pages{' and normalizing it' if args.write else ''}...")
+
+    block_count = written_count = error_count = 0
+    failing = []
+    for result in run_pages(partial(check_page, root=args.root, write=args.write), pages, jobs=args.jobs):
+        print(result.output, end='')
+        page = os.path.relpath(result.path, args.root)
+        if result.error:
+            print(f"  ❌ {page}: {result.error}")
+            error_count += 1
+            continue
+        block_count += result.value.blocks
+        written_count += result.value.written
+        if result.value.problems:
+            failing.append((page, result.value.problems))
+
+    if failing:
+        print(f"\n⚠️  Pages with problems ({len(failing)}):")
+        shown = failing if args.verbose else failing[:DETAIL_LIMIT]
+        for page, problems in shown:
+            print(f"  • {page}")
+            for problem in problems:
+                print(f"      {problem}")
+        if len(shown) < len(failing):
+            print(f"  ... {len(failing) - len(shown)} more (--verbose to list all)")
+
+    print(f"\n{'='*60}")
+    print("Summary:")
+    print(f"  🧩 Blocks: {block_count} on {len(pages)} pages")
+    print(f"  {'⚠️ ' if failing else '✅'} Pages with problems: {len(failing)}")
+    if args.write:
+        print(f"  📝 Normalized: {written_count} pages")
+    if error_count:
+        print(f"  ❌ Errors: {error_count}")
+    print(f"{'='*60}")
+
+    if args.strict and (failing or error_count):
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Run the page rewrite scripts as one pipeline.
+
+Instead of every script re-reading and re-writing the same camera pages, each
+page is loaded once, passed through all enabled stages in memory and written
+once. The stages are the content-level functions of the standalone scripts,
+so both entry points stay in sync. Per-stage timing and change counts are
+reported at the end.
+
+Usage:
+    python3 transform_pages.py                      # all stages
+    python3 transform_pages.py --stages footer,copyright
+    python3 transform_pages.py --skip analytics --jobs 0 --dry-run
+"""
+
+import os
+import time
+import argparse
+from collections import namedtuple
+from functools import partial
+
+from add_breadcrumb_schema import add_breadcrumb_schema_to_content
+from enhance_video_schema import enhance_video_schema_content
+from optimize_camera_titles import optimize_title_content
+from fix_camera_descriptions import unique_description_content
+from update_footer import replace_footer
+from add_google_analytics import add_analytics_to_content
+from update_cameras import add_time_display
+from update_copyright_year import make_copyright_dynamic
+from add_lite_embed import add_lite_embed_content
+from structured_data import normalize_json_ld_content
+from site_thumbs import rewrite_thumbnails_content
+from page_batch import add_jobs_argument, run_pages
+
+# transform(content, file_path) returns the new content, or None when the
+# stage leaves the page alone. skip_index mirrors the scripts that never
+# touched cameras/index.html.
+Stage = namedtuple('Stage', 'name description transform directories skip_index')
+
+# Stages run in this order. The time widget has to run before the copyright
+# stage, which hooks into its updateTime() script. The schema, player and
+# card markup is written with YouTube thumbnail URLs, so the thumbnails
+# stage runs last.
+STAGES = [
+    Stage('breadcrumb', 'BreadcrumbList schema', add_breadcrumb_schema_to_content, ('cameras',), False),
+    Stage('video-schema', 'VideoObject schema', enhance_video_schema_content, ('cameras',), False),
+    Stage('titles', 'Title optimization', optimize_title_content, ('cameras',), False),
+    Stage('descriptions', 'Unique descriptions', unique_description_content, ('cameras',), True),
+    Stage('footer', 'SEO footer', replace_footer, ('cameras',), True),
+    Stage('analytics', 'GTM & GA tracking', add_analytics_to_content, ('cameras', 'cities'), False),
+    Stage('time-widget', 'JST time widget', add_time_display, ('cameras',), False),
+    Stage('copyright', 'Dynamic copyright year', make_copyright_dynamic, ('cameras',), True),
+    Stage('lite-embed', 'Click-to-play player facade', add_lite_embed_content, ('cameras',), True),
+    Stage('json-ld', 'Canonical JSON-LD', normalize_json_ld_content, ('cameras',), False),
+    Stage('thumbnails', 'Mirrored thumbnail URLs', rewrite_thumbnails_content, ('cameras', 'cities'), False),
+]
+STAGES_BY_NAME = {stage.name: stage for stage in STAGES}
+
+# Per-page outcome: stage name -> (seconds, changed), and whether it was written
+PageStats = namedtuple('PageStats', 'stages written')
+
+def stage_applies(stage, file_path):
+    """Check if a stage should run on a page."""
+    directory = os.path.basename(os.path.dirname(file_path))
+    if directory not in stage.directories:
+        return False
+    return not (stage.skip_index and os.path.basename(file_path).startswith('index'))
+
+def transform_page(file_path, stage_names, dry_run=False):
+    """Load a page once, run it through the stages and write it once."""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        original = f.read()
+
+    content = original
+    stats = {}
+    for name in stage_names:
+        stage = STAGES_BY_NAME[name]
+        if not stage_applies(stage, file_path):
+            continue
+        start = time.perf_counter()
+        result = stage.transform(content, file_path)
+        elapsed = time.perf_counter() - start
+        changed = result is not None and result != content
+        if changed:
+            content = result
+        stats[name] = (elapsed, changed)
+
+    written = content != original
+    if written and not dry_run:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+    return PageStats(stats, written)
+
+def collect_pages(stages):
+    """List the HTML pages in every directory used by the stages."""
+    directories = []
+    for stage in stages:
+        for directory in stage.directories:
+            if directory not in directories:
+                directories.append(directory)
+
+    pages = []
+    for directory in directories:
+        if not os.path.exists(directory):
+            print(f"⚠️  Directory '{directory}' not found")
+            continue
+        pages.extend(os.path.join(directory, f) for f in sorted(os.listdir(directory)) if f.endswith('.html'))
+    return pages
+
+def select_stages(only, skip):
+    """Resolve --stages / --skip into an ordered list of stages."""
+    names = [n.strip() for n in only.split(',') if n.strip()] if only else [s.name for s in STAGES]
+    skipped = {n.strip() for n in skip.split(',') if n.strip()} if skip else set()
+
+    unknown = [n for n in list(names) + list(skipped) if n not in STAGES_BY_NAME]
+    if unknown:
+        raise SystemExit(f"❌ Unknown stage(s): {', '.join(unknown)}")
+
+    return [s for s in STAGES if s.name in names and s.name not in skipped]
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the page rewrite stages in a single pass per page.')
+    parser.add_argument('--stages', help='comma-separated stages to run (default: all)')
+    parser.add_argument('--skip', help='comma-separated stages to leave out')
+    parser.add_argument('--list', action='store_true', help='list the available stages and exit')
+    parser.add_argument('--dry-run', action='store_true', help='report changes without writing files')
+    add_jobs_argument(parser)
+    args = parser.parse_args()
+
+    if args.list:
+        for stage in STAGES:
+            print(f"  {stage.name:<14} {stage.description} ({', '.join(stage.directories)})")
+        return
+
+    stages = select_stages(args.stages, args.skip)
+    pages = collect_pages(stages)
+    stage_names = tuple(stage.name for stage in stages)
+
+    print("=" * 60)
+    print(f"🔧 Running {len(stages)} stages over {len(pages)} pages")
+    print("=" * 60)
+
+    totals = {stage.name: [0.0, 0, 0] for stage in stages}  # seconds, pages, changed
+    written_count = 0
+    error_count = 0
+
+    start = time.perf_counter()
+    transform = partial(transform_page, stage_names=stage_names, dry_run=args.dry_run)
+    for result in run_pages(transform, pages, jobs=args.jobs):
+        print(result.output, end='')
+        if result.error:
+            print(f"  ❌ Error processing {result.path}: {result.error}")
+            error_count += 1
+            continue
+        for name, (elapsed, changed) in result.value.stages.items():
+            totals[name][0] += elapsed
+            totals[name][1] += 1
+            totals[name][2] += changed
+        written_count += result.value.written
+    elapsed = time.perf_counter() - start
+
+    print(f"\n{'Stage':<16}{'Pages':>7}{'Changed':>9}{'Time':>12}")
+    print("-" * 44)
+    for stage in stages:
+        seconds, page_count, changed = totals[stage.name]
+        print(f"{stage.name:<16}{page_count:>7}{changed:>9}{seconds * 1000:>9.1f} ms")
+
+    print(f"\n{'='*60}")
+    print(f"Summary:")
+    print(f"  Pages:   {len(pages)}")
+    print(f"  {'Changed' if args.dry_run else 'Written'}: {written_count}")
+    print(f"  Errors:  {error_count}")
+    print(f"  Time:    {elapsed:.2f}s")
+    print(f"{'='*60}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Single-pass rewrite engine for the i18n page generator.
+
+A RuleSet collects the literal and regex rules for one page type. Instead of
+running each rule as its own re.sub() over the whole page (copying the page
+once per rule), all rules are scanned together and the page is rebuilt in a
+single left-to-right pass, dispatching each match to the rule that produced
+it.
+
+Matches are resolved exactly like one big alternation: the leftmost match
+wins, and when two rules match at the same position the one declared first
+wins. Each rule keeps its own compiled pattern so CPython's fast literal
+prefix search still applies; a heap merges the per-rule match streams.
+
+Replacement strings are inserted verbatim; use a callable to build the
+replacement from the match object.
+
+Profiling is opt-in: while a RuleProfile is installed with set_profile(),
+every apply() records per-rule search/replace time and match counts.
+"""
+
+import re
+import time
+from functools import lru_cache
+from heapq import heapify, heappop, heappush
+
+# Installed by set_profile(); None keeps apply() on the uninstrumented path
+_profile = None
+
+
+@lru_cache(maxsize=512)
+def compile_rules(signature):
+    """Compile a tuple of (pattern, flags) pairs into a tuple of patterns."""
+    return tuple(re.compile(pattern, flags) for pattern, flags in signature)
+
+
+def set_profile(profile):
+    """Install a RuleProfile (or None to stop profiling); return the previous one."""
+    global _profile
+    previous, _profile = _profile, profile
+    return previous
+
+
+class RuleProfile:
+    """Per-rule time and match counts gathered across RuleSet.apply() calls.
+
+    Rules are keyed by (rule set name, rule label). The label defaults to the
+    pattern text; rules whose pattern embeds per-page values should pass a
+    fixed label so their numbers add up across pages. Time covers the rule's
+    searches and, for callables, building the replacement (including any
+    nested RuleSet it applies).
+    """
+
+    def __init__(self):
+        self.rules = {}  # (rule set, label) -> [seconds, searches, matches]
+
+    def instrument(self, ruleset, patterns, replacements):
+        """Wrap a rule set's searches and callables with timers."""
+        stats = [self.rules.setdefault((ruleset.name, label), [0.0, 0, 0]) for label in ruleset._labels]
+
+        def timed(func, stat, searching):
+            def wrapper(*args):
+                start = time.perf_counter()
+                try:
+                    return func(*args)
+                finally:
+                    stat[0] += time.perf_counter() - start
+                    if searching:
+                        stat[1] += 1
+            return wrapper
+
+        searches = [timed(pattern.search, stat, True) for pattern, stat in zip(patterns, stats)]
+        replacements = [timed(r, stat, False) if callable(r) else r for r, stat in zip(replacements, stats)]
+        return searches, replacements, stats
+
+    def report(self, limit=None):
+        """Return report lines: rules by time, then the rules that never matched."""
+        rows = sorted(self.rules.items(), key=lambda item: item[1][0], reverse=True)
+        lines = [f"{'Rule set':<14}{'Rule':<52}{'Time':>11}{'Searches':>10}{'Matches':>9}", '-' * 96]
+        for (name, label), (seconds, searches, matches) in rows[:limit]:
+            lines.append(f"{name:<14}{_shorten(label, 50):<52}{seconds * 1000:>8.1f} ms{searches:>10}{matches:>9}")
+
+        unmatched = [(name, label) for (name, label), stat in rows if stat[2] == 0]
+        if unmatched:
+            lines.append('')
+            lines.append(f"Never matched ({len(unmatched)}):")
+            lines.extend(f"  {name:<14}{_shorten(label, 80)}" for name, label in unmatched)
+        return lines
+
+
+def _shorten(text, width):
+    text = ' '.join(text.split())
+    return text if len(text) <= width else text[:width - 1] + '…'
+
+
+class RuleSet:
+    """Ordered literal/regex rewrite rules applied in one pass."""
+
+    def __init__(self, name='rules'):
+        self.name = name
+        self._signature = []
+        self._replacements = []
+        self._labels = []
+
+    def __len__(self):
+        return len(self._signature)
+
+    def literal(self, text, replacement, label=None):
+        """Replace every occurrence of a literal string."""
+        self._signature.append((re.escape(text), 0))
+        self._replacements.append(replacement)
+        self._labels.append(label or text)
+
+    def regex(self, pattern, replacement, flags=0, label=None):
+        """Replace every match of a regular expression."""
+        self._signature.append((pattern, flags))
+        self._replacements.append(replacement)
+        self._labels.append(label or pattern)
+
+    def apply(self, content):
+        """Rewrite content with all rules in a single left-to-right pass."""
+        if not self._signature:
+            return content
+
+        patterns = compile_rules(tuple(self._signature))
+        replacements = self._replacements
+        stats = None
+        if _profile is None:
+            searches = [pattern.search for pattern in patterns]
+        else:
+            searches, replacements, stats = _profile.instrument(self, patterns, replacements)
+
+        # (start, rule index, match) for the next match of every rule
+        pending = []
+        for index, search in enumerate(searches):
+            match = search(content)
+            if match:
+                pending.append((match.start(), index, match))
+        if not pending:
+            return content
+        heapify(pending)
+
+        parts = []
+        pos = 0
+        while pending:
+            start, index, match = heappop(pending)
+            search = searches[index]
+
+            if start < pos:
+                # Overlaps text already consumed by an earlier match
+                match = search(content, pos)
+                if match:
+                    heappush(pending, (match.start(), index, match))
+                continue
+
+            replacement = replacements[index]
+            if callable(replacement):
+                replacement = replacement(match)
+            parts.append(content[pos:start])
+            parts.append(replacement)
+            pos = match.end()
+            if stats is not None:
+                stats[index][2] += 1
+
+            match = search(content, pos if pos > start else pos + 1)
+            if match:
+                heappush(pending, (match.start(), index, match))
+
+        parts.append(content[pos:])
+        return ''.join(parts)
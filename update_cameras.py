@@ -2,6 +2,9 @@
 import os
 import re
 import glob
+import argparse
+
+from page_batch import add_jobs_argument, run_pages
 
 # Time display HTML to add after LIVE indicator
 time_display = '''                <span class="flex items-center gap-2">
@@ -31,6 +34,31 @@ time_script = '''
         setInterval(updateTime, 1000);
     </script>'''
 
+# Pattern: Find the LIVE span closing tag and add time display after it
+live_pattern = r'(                <span class="flex items-center gap-2">\s*<span class="w-2 h-2 bg-red-500 rounded-full animate-pulse"></span>\s*LIVE\s*</span>)\s*(\n\s*</div>)'
+
+def add_time_display(content, file_path=None):
+    """Return content with time display and JavaScript added, or None if not applicable."""
+    # Check if already updated
+    if 'id="current-time"' in content:
+        return None
+
+    # Add time display after LIVE indicator
+    if not re.search(live_pattern, content):
+        return None
+
+    content = re.sub(
+        live_pattern,
+        r'\1\n' + time_display + r'\2',
+        content
+    )
+
+    # Add JavaScript before </body>
+    if '</body>' in content and time_script not in content:
+        content = content.replace('</body>', time_script + '\n</body>')
+
+    return content
+
 def update_camera_page(file_path):
     """Update a single camera page with time display and JavaScript."""
     print(f"Processing: {os.path.basename(file_path)}")
@@ -43,24 +71,14 @@ def update_camera_page(file_path):
         print(f"  ⏭️  Already has time display, skipping")
         return False
 
-    # Add time display after LIVE indicator
-    # Pattern: Find the LIVE span closing tag and add time display after it
-    pattern = r'(                <span class="flex items-center gap-2">\s*<span class="w-2 h-2 bg-red-500 rounded-full animate-pulse"></span>\s*LIVE\s*</span>)\s*(\n\s*</div>)'
-
-    if re.search(pattern, content):
-        content = re.sub(
-            pattern,
-            r'\1\n' + time_display + r'\2',
-            content
-        )
-        print(f"  ✅ Added time display")
-    else:
+    had_script = time_script in content
+    content = add_time_display(content, file_path)
+    if content is None:
         print(f"  ⚠️  Could not find LIVE indicator pattern")
         return False
 
-    # Add JavaScript before </body>
-    if '</body>' in content and time_script not in content:
-        content = content.replace('</body>', time_script + '\n</body>')
+    print(f"  ✅ Added time display")
+    if not had_script and time_script in content:
         print(f"  ✅ Added JavaScript")
 
     # Write updated content
@@ -70,6 +88,10 @@ def update_camera_page(file_path):
     return True
 
 def main():
+    parser = argparse.ArgumentParser(description='Add the JST time display to camera pages.')
+    add_jobs_argument(parser)
+    args = parser.parse_args()
+
     camera_files = glob.glob('/home/user/sakuralivecams/cameras/*.html')
 
     # Exclude tokyo-tower.html as it's already updated
@@ -80,8 +102,11 @@ def main():
     updated_count = 0
     skipped_count = 0
 
-    for file_path in sorted(camera_files):
-        if update_camera_page(file_path):
+    for result in run_pages(update_camera_page, sorted(camera_files), jobs=args.jobs):
+        print(result.output, end='')
+        if result.error:
+            raise result.error
+        if result.value:
             updated_count += 1
         else:
             skipped_count += 1
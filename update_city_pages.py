@@ -2,7 +2,9 @@
 import os
 import re
 import glob
-from html.parser import HTMLParser
+
+from page_metadata import get_page_metadata
+from page_templates import PageTemplate
 
 # City-specific data for places to visit (SEO-optimized)
 CITY_PLACES = {
@@ -73,47 +75,8 @@ def get_city_places(city_name):
     city_key = city_name.lower()
     return CITY_PLACES.get(city_key, GENERIC_PLACES)
 
-class CityNameExtractor(HTMLParser):
-    """Extract city name from HTML h1."""
-    def __init__(self):
-        super().__init__()
-        self.city_name = None
-        self.in_h1 = False
-
-    def handle_starttag(self, tag, attrs):
-        if tag == 'h1':
-            self.in_h1 = True
-
-    def handle_endtag(self, tag):
-        if tag == 'h1':
-            self.in_h1 = False
-
-    def handle_data(self, data):
-        if self.in_h1 and data.strip() and not self.city_name:
-            # Extract city name (remove "Live Webcams" suffix)
-            text = data.strip()
-            self.city_name = text.replace(' Live Webcams', '').replace(' Webcams', '')
-
-def update_city_page(file_path):
-    """Comprehensive update for a city page."""
-    filename = os.path.basename(file_path)
-    city_slug = filename.replace('.html', '')
-
-    print(f"Processing: {filename}")
-
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Extract city name
-    extractor = CityNameExtractor()
-    extractor.feed(content)
-    city_name = extractor.city_name or city_slug.title()
-
-    changes_made = []
-
-    # 1. Add current time display in hero section (after the 4-grid stats)
-    if 'id="current-time"' not in content:
-        time_display = '''            </div>
+# Current JST time under the hero stats
+TIME_DISPLAY_HTML = '''            </div>
 
             <div class="mt-6 flex items-center gap-2 text-white">
                 <svg class="w-6 h-6" fill="none" stroke="currentColor" viewBox="0 0 24 24">
@@ -122,67 +85,52 @@ def update_city_page(file_path):
                 <span class="text-lg font-semibold">Current Time (JST): <span id="current-time" class="font-bold">--:--:--</span></span>
             </div>'''
 
-        pattern = r'(            </div>\s*</div>\s*</section>)'
-        replacement = time_display + r'\n        \1'
-
-        if re.search(pattern, content):
-            content = re.sub(pattern, replacement, content, count=1)
-            changes_made.append("time display")
-
-    # 2. Enhance About section with places to visit
-    if 'Places to Visit' not in content:
-        places = get_city_places(city_name)
-        places_html = '\n'.join([f'                <li class="flex items-start gap-2"><span class="text-rose-600 mt-1">•</span><span>{place}</span></li>' for place in places])
-
-        enhanced_about = f'''    <section class="py-12 bg-white">
+# About section with places to visit, compiled once and rendered per city
+ABOUT_SECTION_TEMPLATE = PageTemplate('''    <section class="py-12 bg-white">
         <div class="max-w-7xl mx-auto px-4">
             <div class="grid md:grid-cols-2 gap-12">
                 <div>
-                    <h2 class="text-3xl font-bold text-gray-900 mb-6">About {city_name} Webcams</h2>
+                    <h2 class="text-3xl font-bold text-gray-900 mb-6">About $city_name Webcams</h2>
                     <div class="prose prose-lg text-gray-700 space-y-4">
                         <p>
-                            Experience {city_name} in real-time through our strategically positioned HD webcams.
+                            Experience $city_name in real-time through our strategically positioned HD webcams.
                             Whether you're planning your visit, reminiscing about past travels, or simply curious
-                            about life in {city_name}, these live streams offer an authentic window into this
+                            about life in $city_name, these live streams offer an authentic window into this
                             captivating Japanese destination.
                         </p>
                         <p>
-                            Our cameras capture the essence of {city_name} 24/7, from bustling daytime activity
+                            Our cameras capture the essence of $city_name 24/7, from bustling daytime activity
                             to serene evening atmospheres. Watch as locals go about their daily lives, observe
-                            weather patterns in real-time, and discover the unique rhythm that makes {city_name}
+                            weather patterns in real-time, and discover the unique rhythm that makes $city_name
                             one of Japan's most fascinating locations.
                         </p>
                         <p>
                             All webcam streams are free to watch, with no subscription required. Bookmark this
-                            page to check back anytime and stay connected to {city_name} from anywhere in the world.
+                            page to check back anytime and stay connected to $city_name from anywhere in the world.
                         </p>
                     </div>
                 </div>
 
                 <div>
-                    <h3 class="text-2xl font-bold text-gray-900 mb-6">Places to Visit in {city_name}</h3>
+                    <h3 class="text-2xl font-bold text-gray-900 mb-6">Places to Visit in $city_name</h3>
                     <ul class="space-y-3 text-gray-700">
-{places_html}
+$places_html
                     </ul>
                     <div class="mt-6 p-4 bg-rose-50 rounded-lg">
                         <p class="text-sm text-gray-700">
                             <strong class="text-rose-700">Pro Tip:</strong> Use our live webcams to check current
-                            weather conditions and crowd levels before visiting popular attractions in {city_name}.
+                            weather conditions and crowd levels before visiting popular attractions in $city_name.
                         </p>
                     </div>
                 </div>
-            </div>'''
-
-        # Find the old about section and replace it
-        old_about_pattern = r'    <section class="py-12 bg-white">.*?</section>'
+            </div>''')
 
-        if re.search(old_about_pattern, content, re.DOTALL):
-            content = re.sub(old_about_pattern, enhanced_about + '\n    </section>', content, flags=re.DOTALL, count=1)
-            changes_made.append("enhanced about section")
+PLACE_ITEM_TEMPLATE = PageTemplate(
+    '                <li class="flex items-start gap-2"><span class="text-rose-600 mt-1">•</span><span>$place</span></li>'
+)
 
-    # 3. Replace footer with SEO-optimized version
-    if 'Popular Cities' not in content:
-        new_footer = '''    <footer class="bg-black py-12 mt-12">
+# SEO-optimized footer
+SEO_FOOTER_HTML = '''    <footer class="bg-black py-12 mt-12">
         <div class="max-w-7xl mx-auto px-4">
             <div class="grid md:grid-cols-4 gap-8 mb-8">
                 <!-- About Section -->
@@ -233,14 +181,8 @@ def update_city_page(file_path):
         </div>
     </footer>'''
 
-        old_footer_pattern = r'    <footer class="bg-black.*?</footer>'
-        if re.search(old_footer_pattern, content, re.DOTALL):
-            content = re.sub(old_footer_pattern, new_footer, content, flags=re.DOTALL)
-            changes_made.append("SEO footer")
-
-    # 4. Add JavaScript for time and copyright year (before </body>)
-    if 'updateTime()' not in content:
-        time_script = '''
+# Clock and copyright year script
+TIME_SCRIPT = '''
     <script>
         function updateTime() {
             const now = new Date();
@@ -267,7 +209,62 @@ def update_city_page(file_path):
         }
     </script>'''
 
-        content = content.replace('</body>', time_script + '\n</body>')
+def get_city_name(content):
+    """Extract city name from the page h1."""
+    heading = get_page_metadata(content).camera_name
+    if not heading:
+        return None
+    # Remove "Live Webcams" suffix
+    return heading.replace(' Live Webcams', '').replace(' Webcams', '')
+
+def update_city_page(file_path):
+    """Comprehensive update for a city page."""
+    filename = os.path.basename(file_path)
+    city_slug = filename.replace('.html', '')
+
+    print(f"Processing: {filename}")
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    # Extract city name
+    city_name = get_city_name(content) or city_slug.title()
+
+    changes_made = []
+
+    # 1. Add current time display in hero section (after the 4-grid stats)
+    if 'id="current-time"' not in content:
+        pattern = r'(            </div>\s*</div>\s*</section>)'
+        replacement = TIME_DISPLAY_HTML + r'\n        \1'
+
+        if re.search(pattern, content):
+            content = re.sub(pattern, replacement, content, count=1)
+            changes_made.append("time display")
+
+    # 2. Enhance About section with places to visit
+    if 'Places to Visit' not in content:
+        places = get_city_places(city_name)
+        places_html = '\n'.join(PLACE_ITEM_TEMPLATE.render(place=place) for place in places)
+
+        enhanced_about = ABOUT_SECTION_TEMPLATE.render(city_name=city_name, places_html=places_html)
+
+        # Find the old about section and replace it
+        old_about_pattern = r'    <section class="py-12 bg-white">.*?</section>'
+
+        if re.search(old_about_pattern, content, re.DOTALL):
+            content = re.sub(old_about_pattern, enhanced_about + '\n    </section>', content, flags=re.DOTALL, count=1)
+            changes_made.append("enhanced about section")
+
+    # 3. Replace footer with SEO-optimized version
+    if 'Popular Cities' not in content:
+        old_footer_pattern = r'    <footer class="bg-black.*?</footer>'
+        if re.search(old_footer_pattern, content, re.DOTALL):
+            content = re.sub(old_footer_pattern, SEO_FOOTER_HTML, content, flags=re.DOTALL)
+            changes_made.append("SEO footer")
+
+    # 4. Add JavaScript for time and copyright year (before </body>)
+    if 'updateTime()' not in content:
+        content = content.replace('</body>', TIME_SCRIPT + '\n</body>')
         changes_made.append("JavaScript")
 
     # Write updated content
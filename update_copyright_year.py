@@ -3,29 +3,21 @@ import os
 import re
 import glob
 
-def update_copyright(file_path):
-    """Update copyright year to be dynamic."""
-    filename = os.path.basename(file_path)
-    print(f"Processing: {filename}")
-
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+# Pattern to find hardcoded year in copyright
+copyright_pattern = r'&copy; 2025 SakuraLive\.'
 
+def make_copyright_dynamic(content, file_path=None):
+    """Return content with a dynamic copyright year, or None if not applicable."""
     # Check if already updated
     if '<span id="copyright-year"></span>' in content:
-        print(f"  ⏭️  Copyright already dynamic")
-        return False
-
-    # Pattern to find hardcoded year in copyright
-    pattern = r'&copy; 2025 SakuraLive\.'
+        return None
 
-    if not re.search(pattern, content):
-        print(f"  ⚠️  Could not find copyright pattern")
-        return False
+    if not re.search(copyright_pattern, content):
+        return None
 
     # Replace with dynamic year span
     content = re.sub(
-        pattern,
+        copyright_pattern,
         r'&copy; <span id="copyright-year"></span> SakuraLive.',
         content
     )
@@ -40,6 +32,26 @@ def update_copyright(file_path):
 
         content = re.sub(time_script_pattern, copyright_js, content)
 
+    return content
+
+def update_copyright(file_path):
+    """Update copyright year to be dynamic."""
+    filename = os.path.basename(file_path)
+    print(f"Processing: {filename}")
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    # Check if already updated
+    if '<span id="copyright-year"></span>' in content:
+        print(f"  ⏭️  Copyright already dynamic")
+        return False
+
+    content = make_copyright_dynamic(content, file_path)
+    if content is None:
+        print(f"  ⚠️  Could not find copyright pattern")
+        return False
+
     # Write updated content
     with open(file_path, 'w', encoding='utf-8') as f:
         f.write(content)
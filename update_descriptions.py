@@ -2,42 +2,8 @@
 import os
 import re
 import glob
-from html.parser import HTMLParser
-
-class CameraInfoExtractor(HTMLParser):
-    """Extract camera name and city from HTML."""
-    def __init__(self):
-        super().__init__()
-        self.camera_name = None
-        self.city = None
-        self.in_h1 = False
-        self.in_breadcrumb_city = False
-        self.breadcrumb_depth = 0
-
-    def handle_starttag(self, tag, attrs):
-        if tag == 'h1':
-            self.in_h1 = True
-        # Look for city link in breadcrumb
-        if tag == 'a':
-            attrs_dict = dict(attrs)
-            href = attrs_dict.get('href', '')
-            if '../cities/' in href:
-                self.in_breadcrumb_city = True
-
-    def handle_endtag(self, tag):
-        if tag == 'h1':
-            self.in_h1 = False
-        if tag == 'a':
-            self.in_breadcrumb_city = False
-
-    def handle_data(self, data):
-        data = data.strip()
-        if self.in_h1 and data and not self.camera_name:
-            self.camera_name = data
-        if self.in_breadcrumb_city and data and not self.city:
-            # Remove ", Japan" if present and ignore "View All" text
-            if not data.startswith('View All'):
-                self.city = data.replace(', Japan', '')
+
+from page_metadata import get_page_metadata
 
 def create_detailed_description(camera_name, city):
     """Create a detailed description template for a camera location."""
@@ -76,11 +42,10 @@ def update_camera_description(file_path):
         return False
 
     # Extract camera name and city
-    extractor = CameraInfoExtractor()
-    extractor.feed(content)
+    metadata = get_page_metadata(content)
 
-    camera_name = extractor.camera_name
-    city = extractor.city
+    camera_name = metadata.camera_name
+    city = metadata.city_name
 
     if not camera_name or not city:
         print(f"  ⚠️  Could not extract camera name or city")
@@ -2,6 +2,9 @@
 import os
 import re
 import glob
+import argparse
+
+from page_batch import add_jobs_argument, run_pages
 
 # SEO-optimized footer HTML
 new_footer = '''    <footer class="bg-black py-12 mt-12">
@@ -55,6 +58,24 @@ new_footer = '''    <footer class="bg-black py-12 mt-12">
         </div>
     </footer>'''
 
+# Pattern to match the old footer (from <footer> to </footer>)
+old_footer_pattern = r'    <footer class="bg-black py-8 mt-12">.*?</footer>'
+
+def footer_is_current(content):
+    """Check if the page already has the new footer (look for new footer marker)."""
+    return 'Popular Cities' in content and 'More Destinations' in content
+
+def replace_footer(content, file_path=None):
+    """Return content with the SEO footer, or None if not applicable."""
+    if footer_is_current(content):
+        return None
+
+    if not re.search(old_footer_pattern, content, re.DOTALL):
+        return None
+
+    # Replace the footer
+    return re.sub(old_footer_pattern, new_footer, content, flags=re.DOTALL)
+
 def update_footer(file_path):
     """Update footer in a camera page."""
     filename = os.path.basename(file_path)
@@ -63,21 +84,16 @@ def update_footer(file_path):
     with open(file_path, 'r', encoding='utf-8') as f:
         content = f.read()
 
-    # Check if already updated (look for new footer marker)
-    if 'Popular Cities' in content and 'More Destinations' in content:
+    # Check if already updated
+    if footer_is_current(content):
         print(f"  ⏭️  Footer already updated")
         return False
 
-    # Pattern to match the old footer (from <footer> to </footer>)
-    old_footer_pattern = r'    <footer class="bg-black py-8 mt-12">.*?</footer>'
-
-    if not re.search(old_footer_pattern, content, re.DOTALL):
+    content = replace_footer(content, file_path)
+    if content is None:
         print(f"  ⚠️  Could not find footer pattern")
         return False
 
-    # Replace the footer
-    content = re.sub(old_footer_pattern, new_footer, content, flags=re.DOTALL)
-
     # Write updated content
     with open(file_path, 'w', encoding='utf-8') as f:
         f.write(content)
@@ -86,6 +102,10 @@ def update_footer(file_path):
     return True
 
 def main():
+    parser = argparse.ArgumentParser(description='Replace the footer on camera pages.')
+    add_jobs_argument(parser)
+    args = parser.parse_args()
+
     camera_files = glob.glob('/home/user/sakuralivecams/cameras/*.html')
 
     # Filter out non-camera pages
@@ -97,15 +117,15 @@ def main():
     skipped_count = 0
     error_count = 0
 
-    for file_path in sorted(camera_files):
-        try:
-            if update_footer(file_path):
-                updated_count += 1
-            else:
-                skipped_count += 1
-        except Exception as e:
-            print(f"  ❌ Error: {e}")
+    for result in run_pages(update_footer, sorted(camera_files), jobs=args.jobs):
+        print(result.output, end='')
+        if result.error:
+            print(f"  ❌ Error: {result.error}")
             error_count += 1
+        elif result.value:
+            updated_count += 1
+        else:
+            skipped_count += 1
         print()
 
     print(f"\n{'='*60}")
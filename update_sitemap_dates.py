@@ -1,62 +1,85 @@
 #!/usr/bin/env python3
 """
-Update sitemap.xml with today's date to signal freshness to search engines.
+Update sitemap.xml lastmod dates to signal freshness to search engines.
+A URL's date only moves when its page content actually changed (tracked in
+.lastmod.json, see page_lastmod), so crawlers don't re-fetch unchanged pages.
 Also boosts priority for top-performing pages.
 """
 
 import re
-from datetime import datetime
+import argparse
+
+from page_lastmod import STORE_NAME, LastmodStore, print_change_report
+
+BASE_URL = 'https://sakuralivecams.com'
+
+# High-value pages get their priority boosted to 0.90
+HIGH_VALUE_URLS = [
+    'shibuya-crossing-scramble-crossing.html',
+    'mount-fuji-oshino.html',
+    'osaka-dotonbori-live-camera.html',
+    'tokyo-tower.html',
+    'sapporo-station.html',
+]
+
+URL_BLOCK_PATTERN = re.compile(r'<url>.*?</url>', re.DOTALL)
 
 def update_sitemap():
-    """Update lastmod dates in sitemap.xml"""
+    """Update lastmod dates in sitemap.xml; return the LastmodStore used."""
     with open('sitemap.xml', 'r', encoding='utf-8') as f:
         content = f.read()
 
-    # Get today's date
-    today = datetime.now().strftime('%Y-%m-%d')
-
-    # Replace all lastmod dates with today
-    content = re.sub(
-        r'<lastmod>\d{4}-\d{2}-\d{2}</lastmod>',
-        f'<lastmod>{today}</lastmod>',
-        content
-    )
-
-    # Boost priority for high-value pages
-    high_value_urls = [
-        'shibuya-crossing-scramble-crossing.html',
-        'mount-fuji-oshino.html',
-        'osaka-dotonbori-live-camera.html',
-        'tokyo-tower.html',
-        'sapporo-station.html',
-    ]
-
-    for url in high_value_urls:
-        # Find this URL and boost its priority to 0.90
-        pattern = f'(<url><loc>https://sakuralivecams.com/cameras/{re.escape(url)}</loc><lastmod>{today}</lastmod><priority>)0\\.80(</priority></url>)'
-        content = re.sub(pattern, r'\g<1>0.90\2', content)
+    store = LastmodStore(STORE_NAME)
+    high_value_locs = {f'{BASE_URL}/cameras/{url}' for url in HIGH_VALUE_URLS}
+
+    def update_url(match):
+        block = match.group(0)
+        loc_match = re.search(r'<loc>([^<]+)</loc>', block)
+        if not loc_match or not loc_match.group(1).startswith(BASE_URL):
+            return block
+        loc = loc_match.group(1)
+
+        # Pages new to the store keep the date the sitemap already has
+        lastmod_match = re.search(r'<lastmod>([^<]+)</lastmod>', block)
+        url_path = loc[len(BASE_URL):].lstrip('/')
+        if lastmod_match and url_path not in store.pages:
+            store.seed[url_path] = lastmod_match.group(1)
+
+        lastmod = store.file_lastmod('.', url_path)
+        if lastmod:
+            block = re.sub(r'<lastmod>\d{4}-\d{2}-\d{2}</lastmod>', f'<lastmod>{lastmod}</lastmod>', block)
+
+        # Boost priority for high-value pages
+        if loc in high_value_locs:
+            block = block.replace('<priority>0.80</priority>', '<priority>0.90</priority>')
+        return block
+
+    content = URL_BLOCK_PATTERN.sub(update_url, content)
 
     # Write back
     with open('sitemap.xml', 'w', encoding='utf-8') as f:
         f.write(content)
 
-    return True
+    store.save()
+    return store
 
 def main():
-    print("📅 Updating sitemap.xml with fresh dates...")
-
-    if update_sitemap():
-        today = datetime.now().strftime('%Y-%m-%d')
-        print(f"✅ Updated all lastmod dates to {today}")
-        print("\nBoosted priority for top cameras:")
-        print("  • Shibuya Crossing (0.90)")
-        print("  • Mount Fuji (0.90)")
-        print("  • Osaka Dotonbori (0.90)")
-        print("  • Tokyo Tower (0.90)")
-        print("  • Sapporo Station (0.90)")
-        print("\nFresh dates signal to search engines that content is actively maintained!")
-    else:
-        print("❌ Failed to update sitemap")
+    parser = argparse.ArgumentParser(description='Update sitemap.xml lastmod dates from page changes.')
+    parser.add_argument('--changed-urls', metavar='FILE', help='write the changed URLs to FILE for CDN purging')
+    args = parser.parse_args()
+
+    print("📅 Updating sitemap.xml dates from page content...")
+
+    store = update_sitemap()
+    print(f"✅ Checked {len(store.seen)} URLs, {len(store.changed)} changed since the last run")
+    print_change_report(store.changed, [], BASE_URL, args.changed_urls)
+    print("\nBoosted priority for top cameras:")
+    print("  • Shibuya Crossing (0.90)")
+    print("  • Mount Fuji (0.90)")
+    print("  • Osaka Dotonbori (0.90)")
+    print("  • Tokyo Tower (0.90)")
+    print("  • Sapporo Station (0.90)")
+    print("\nOnly pages whose content changed get a fresh date, so crawlers spend their budget on them.")
 
 if __name__ == '__main__':
     main()